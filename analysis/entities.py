@@ -0,0 +1,209 @@
+"""Group provider entries that describe the same underlying model."""
+
+import dataclasses
+import datetime
+import re
+from typing import Iterable, Iterator
+
+from analysis.index import ALIAS_SEPARATORS_RE
+from scraper.base import DeprecationEntry
+
+# Words that only say who hosts or sells the model, e.g. Vertex AI's
+# "Anthropic's Claude 3 Haiku on Google Cloud".
+STOP_WORDS = {"anthropic", "s", "on", "google", "cloud", "the", "by", "model", "models"}
+
+# Bedrock-style vendor prefixes ("anthropic.", "us.anthropic.") and version
+# suffixes ("-v1:0", "@20240307"), which are deployment details, not names,
+# unless the ID has no other numbers ("claude-v2:1" is Claude 2.1).
+VENDOR_PREFIX_RE = re.compile(r"^(?:[a-z]+\.)+(?=[a-z])")
+VERSION_SUFFIX_RE = re.compile(r"(?:-v(\d+(?::\d+)?)|@\S*)$")
+# Release stamps: 20250929, 2024-12-17, and Gemini's trailing 09-2025.
+DATE_STAMP_RE = re.compile(r"(?<!\d)(?:20\d{2}-\d{2}-\d{2}|20\d{6}|\d{2}-20\d{2}$)(?!\d)")
+TOKEN_RE = re.compile(r"[a-z]+|\d+")
+
+TYPO_MIN_LENGTH = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelKey:
+    """A model name reduced to its word set and ordered version numbers."""
+
+    words: frozenset[str]
+    numbers: tuple[int, ...]
+
+    def text(self) -> str:
+        return " ".join(sorted(self.words))
+
+
+def model_key(name: str) -> ModelKey | None:
+    """Normalize a model name or ID; returns None if nothing identifying is left.
+
+    Letters and digits are split apart, so "claude-sonnet-4-5-20250929",
+    "Claude Sonnet 4.5" and "anthropic.claude-sonnet-4-5-20250929-v1:0"
+    all reduce to the words {claude, sonnet} and the numbers (4, 5).
+    """
+    name = ALIAS_SEPARATORS_RE.split(name.strip().replace("`", ""), 1)[0].lower()
+    name = VENDOR_PREFIX_RE.sub("", name)
+    suffix = VERSION_SUFFIX_RE.search(name)
+    name = DATE_STAMP_RE.sub(" ", VERSION_SUFFIX_RE.sub("", name))
+    if suffix and suffix.group(1) and not any(char.isdigit() for char in name):
+        name += " " + suffix.group(1)
+    words, numbers = set(), []
+    for token in TOKEN_RE.findall(name):
+        if token.isdigit():
+            numbers.append(int(token))
+        elif token not in STOP_WORDS:
+            words.add(token)
+    if not words:
+        return None
+    return ModelKey(frozenset(words), tuple(numbers))
+
+
+def _typo_signatures(key: ModelKey) -> Iterator[tuple]:
+    """Index keys under which two ModelKeys one misspelt word apart collide.
+
+    Each long word is replaced by itself and by every single-letter
+    deletion of it (symmetric-delete matching), alongside the other words
+    and the numbers. Any two words within one edit share one of these
+    variants, so candidates come from a dict hit rather than a scan.
+    """
+    for word in key.words:
+        if len(word) < TYPO_MIN_LENGTH:
+            continue
+        rest = key.words - {word}
+        yield key.numbers, rest, word
+        for i in range(len(word)):
+            yield key.numbers, rest, word[:i] + word[i + 1 :]
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    if len(a) == len(b):
+        return sum(x != y for x, y in zip(a, b)) <= 1
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1 :]
+
+
+def _similar(a: ModelKey, b: ModelKey) -> bool:
+    """Same version numbers and the same words, allowing one misspelt word.
+
+    Only words of at least TYPO_MIN_LENGTH letters may differ, and only by a
+    single edit, since short words carry meaning ("lite" vs "live").
+    """
+    if a.numbers != b.numbers or len(a.words) != len(b.words):
+        return False
+    only_a, only_b = a.words - b.words, b.words - a.words
+    if not only_a:
+        return True
+    if len(only_a) != 1:
+        return False
+    (wa,), (wb,) = only_a, only_b
+    return min(len(wa), len(wb)) >= TYPO_MIN_LENGTH and _one_edit_apart(wa, wb)
+
+
+@dataclasses.dataclass
+class ModelEntity:
+    name: str
+    entries: list[DeprecationEntry]
+
+    @property
+    def providers(self) -> list[str]:
+        return list(dict.fromkeys(e.provider for e in self.entries))
+
+    def shutdown_dates(self) -> dict[str, datetime.date]:
+        """Earliest known shutdown date per provider."""
+        dates: dict[str, datetime.date] = {}
+        for entry in self.entries:
+            if entry.has_shutdown_date():
+                current = dates.get(entry.provider)
+                if current is None or entry.shutdown_date < current:
+                    dates[entry.provider] = entry.shutdown_date
+        return dates
+
+    def to_dict(self) -> dict:
+        return {
+            "model": self.name,
+            "shutdown_dates": {p: d.isoformat() for p, d in self.shutdown_dates().items()},
+            "providers": {
+                provider: [
+                    {
+                        "model_name": e.model_name,
+                        "model_id": e.model_id,
+                        "status": e.status,
+                        "shutdown_date": e.shutdown_date.isoformat() if e.has_shutdown_date() else "",
+                    }
+                    for e in self.entries
+                    if e.provider == provider
+                ]
+                for provider in self.providers
+            },
+        }
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # Keep the earliest key as the root so groups come out in input order.
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def resolve_entities(entries: Iterable[DeprecationEntry]) -> list[ModelEntity]:
+    """Group entries into canonical models, in order of first appearance.
+
+    Names are first reduced to ModelKeys, which collapses exact matches
+    with a dict. Only the distinct keys then go through typo matching,
+    where ``_typo_signatures`` buckets propose candidates and ``_similar``
+    confirms them, so nothing is compared pairwise. Entries whose name and
+    ID reduce to different keys link those keys together. Entries without
+    any usable key become their own entity.
+    """
+    entries = list(entries)
+    key_ids: dict[ModelKey, int] = {}
+    entry_keys: list[list[int]] = []
+    for entry in entries:
+        ids = []
+        for text in (entry.model_name, entry.model_id):
+            key = model_key(text) if text else None
+            if key is not None:
+                ids.append(key_ids.setdefault(key, len(key_ids)))
+        entry_keys.append(ids)
+
+    keys = list(key_ids)
+    groups = _UnionFind(len(keys))
+    buckets: dict[tuple, list[int]] = {}
+    for i, key in enumerate(keys):
+        for signature in _typo_signatures(key):
+            bucket = buckets.setdefault(signature, [])
+            for j in bucket:
+                if _similar(key, keys[j]):
+                    groups.union(i, j)
+            bucket.append(i)
+
+    for ids in entry_keys:
+        for other in ids[1:]:
+            groups.union(ids[0], other)
+
+    members: dict[object, list[DeprecationEntry]] = {}
+    for position, (entry, ids) in enumerate(zip(entries, entry_keys)):
+        root = groups.find(ids[0]) if ids else ("unkeyed", position)
+        members.setdefault(root, []).append(entry)
+
+    return [
+        ModelEntity(name=min((e.model_name for e in group), key=len), entries=group)
+        for group in members.values()
+    ]
@@ -0,0 +1,109 @@
+import bisect
+import datetime
+import re
+from typing import Iterable, Iterator
+
+from scraper.base import DeprecationEntry
+
+# Pages list several names for one model in a single cell, e.g. OpenAI's
+# "gpt-4-0613 | gpt-4, gpt-4-completions".
+ALIAS_SEPARATORS_RE = re.compile(r"\s*[|,]\s*")
+
+
+def normalize_name(name: str) -> str:
+    return " ".join(name.replace("`", "").split()).lower()
+
+
+def _aliases(entry: DeprecationEntry) -> set[str]:
+    aliases = {normalize_name(part) for part in ALIAS_SEPARATORS_RE.split(entry.model_name)}
+    aliases.discard("")
+    aliases.discard(normalize_name(entry.model_name))
+    return aliases
+
+
+class DeprecationIndex:
+    """Entries indexed once per run for lookups and shutdown-date range queries.
+
+    Name, ID and alias lookups are dict hits. Entries with a shutdown date
+    are also kept sorted by (shutdown date, input position), so a date range
+    is two bisections and a slice. Iterating the index yields the entries in
+    their original order.
+    """
+
+    def __init__(self, entries: Iterable[DeprecationEntry]):
+        self.entries = list(entries)
+        self._by_name: dict[str, list[int]] = {}
+        self._by_id: dict[str, list[int]] = {}
+        self._by_alias: dict[str, list[int]] = {}
+
+        for position, entry in enumerate(self.entries):
+            self._by_name.setdefault(normalize_name(entry.model_name), []).append(position)
+            if entry.model_id:
+                self._by_id.setdefault(normalize_name(entry.model_id), []).append(position)
+            for alias in _aliases(entry):
+                self._by_alias.setdefault(alias, []).append(position)
+
+        self._dated = sorted(
+            (p for p, e in enumerate(self.entries) if e.has_shutdown_date()),
+            key=lambda p: self.entries[p].shutdown_date,
+        )
+        self._shutdown_dates = [self.entries[p].shutdown_date for p in self._dated]
+
+    @classmethod
+    def of(cls, entries: "Iterable[DeprecationEntry] | DeprecationIndex") -> "DeprecationIndex":
+        """Reuse ``entries`` if it is already an index, otherwise build one."""
+        return entries if isinstance(entries, cls) else cls(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[DeprecationEntry]:
+        return iter(self.entries)
+
+    def _take(self, positions: list[int]) -> list[DeprecationEntry]:
+        return [self.entries[p] for p in positions]
+
+    def by_name(self, name: str) -> list[DeprecationEntry]:
+        return self._take(self._by_name.get(normalize_name(name), []))
+
+    def by_id(self, model_id: str) -> list[DeprecationEntry]:
+        return self._take(self._by_id.get(normalize_name(model_id), []))
+
+    def by_alias(self, alias: str) -> list[DeprecationEntry]:
+        return self._take(self._by_alias.get(normalize_name(alias), []))
+
+    def lookup(self, term: str) -> list[DeprecationEntry]:
+        """Entries whose name, ID or alias matches ``term``, in input order."""
+        key = normalize_name(term)
+        positions = set(self._by_name.get(key, ()))
+        positions.update(self._by_id.get(key, ()))
+        positions.update(self._by_alias.get(key, ()))
+        return self._take(sorted(positions))
+
+    def _range(self, start: datetime.date | None, end: datetime.date | None) -> list[int]:
+        lo = 0 if start is None else bisect.bisect_left(self._shutdown_dates, start)
+        hi = len(self._dated) if end is None else bisect.bisect_right(self._shutdown_dates, end)
+        return self._dated[lo:hi]
+
+    def shutting_down(
+        self,
+        start: datetime.date = None,
+        end: datetime.date = None,
+        input_order: bool = False,
+    ) -> list[DeprecationEntry]:
+        """Entries with a shutdown date in ``[start, end]`` (either bound optional).
+
+        Sorted by shutdown date, ties in input order, unless ``input_order``
+        asks for the original order instead.
+        """
+        positions = self._range(start, end)
+        if input_order:
+            positions = sorted(positions)
+        return self._take(positions)
+
+    def shutting_down_on(self, dates: Iterable[datetime.date]) -> list[DeprecationEntry]:
+        """Entries shutting down on any of ``dates``, in input order."""
+        positions: list[int] = []
+        for date in set(dates):
+            positions.extend(self._range(date, date))
+        return self._take(sorted(positions))
@@ -0,0 +1,106 @@
+"""Follow replacement recommendations through deprecated models to a live one."""
+
+import logging
+import re
+
+from analysis.index import DeprecationIndex, normalize_name
+from scraper.base import DeprecationEntry
+
+log = logging.getLogger(__name__)
+
+RETIRING_STATUSES = {"deprecated", "retired", "legacy"}
+
+# "gpt-5 or gpt-4.1*", "a, b": alternatives, of which the first is followed.
+ALTERNATIVES_RE = re.compile(r"\s+or\s+|\s*[,|]\s*", re.IGNORECASE)
+# Bedrock joins the replacement's name and ID as "name / id"; both name the
+# same model.
+IDENTIFIER_SEPARATOR = " / "
+# Footnote markers and notes such as "gpt-5.6-sol (reasoning.mode: pro)".
+DECORATION_RE = re.compile(r"\s*\([^)]*\)|[*`]")
+
+
+def is_retiring(entry: DeprecationEntry) -> bool:
+    """Whether ``entry`` is on its way out.
+
+    Active models can carry a tentative "not sooner than" shutdown date,
+    so the date alone does not make a model retiring.
+    """
+    return entry.status in RETIRING_STATUSES
+
+
+def replacement_identifiers(text: str) -> list[str]:
+    """Names a replacement cell refers to, most specific (the ID) first."""
+    first = ALTERNATIVES_RE.split(text.strip(), 1)[0]
+    parts = [DECORATION_RE.sub("", part).strip() for part in first.split(IDENTIFIER_SEPARATOR)]
+    return [part for part in reversed(parts) if part]
+
+
+class ReplacementGraph:
+    """Replacement edges between entries, resolved with memoization.
+
+    Building the graph looks every distinct replacement up in the index
+    once; any other name is looked up the first time it is resolved.
+    ``resolve`` walks edges until it reaches a replacement that is not
+    itself retiring and caches the answer for every node on the way, so
+    each node is walked at most once across all lookups.
+    """
+
+    def __init__(self, entries: list[DeprecationEntry] | DeprecationIndex):
+        self._index = index = DeprecationIndex.of(entries)
+        self._edges: dict[str, str | None] = {}
+        self._resolved: dict[str, str] = {}
+        for entry in index:
+            if entry.replacement:
+                key = normalize_name(entry.replacement)
+                if key not in self._edges:
+                    self._edges[key] = self._next_hop(index, entry.replacement)
+
+    @staticmethod
+    def _next_hop(index: DeprecationIndex, replacement: str) -> str | None:
+        """The replacement's own replacement, or None if it is where the chain ends."""
+        for identifier in replacement_identifiers(replacement):
+            matches = index.lookup(identifier)
+            if matches:
+                break
+        else:
+            # Not listed on any deprecations page, so presumably current.
+            return None
+        if any(m.status not in RETIRING_STATUSES for m in matches):
+            return None
+        return next((m.replacement for m in matches if m.replacement), None)
+
+    def resolve(self, replacement: str) -> str:
+        """Final target of ``replacement``; "" if the chain runs in a cycle."""
+        if not replacement:
+            return ""
+        path: list[str] = []
+        on_path: set[str] = set()
+        text = replacement
+        while True:
+            key = normalize_name(text)
+            if key in self._resolved:
+                result = self._resolved[key]
+                break
+            if key in on_path:
+                log.warning("Replacement cycle: %s", " -> ".join(path + [key]))
+                result = ""
+                break
+            path.append(key)
+            on_path.add(key)
+            if key not in self._edges:
+                self._edges[key] = self._next_hop(self._index, text)
+            next_text = self._edges[key]
+            if next_text is None:
+                result = text
+                break
+            text = next_text
+        for key in path:
+            self._resolved[key] = result
+        return result
+
+
+def resolve_replacements(entries: list[DeprecationEntry] | DeprecationIndex) -> None:
+    """Set ``resolved_replacement`` on every entry that has a replacement."""
+    graph = ReplacementGraph(entries)
+    for entry in entries:
+        entry.resolved_replacement = graph.resolve(entry.replacement)
@@ -0,0 +1,63 @@
+"""Time scraper parsing and generators, optionally against a stored baseline."""
+
+import argparse
+import sys
+from pathlib import Path
+
+import orjson
+
+from benchmarks.suite import DEFAULT_THRESHOLD, compare, run
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="glob filter on benchmark names")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("-o", "--output", type=Path, help="write results JSON here")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {DEFAULT_BASELINE.name}")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_BASELINE,
+        help="compare against a stored baseline (default: %(const)s)",
+    )
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown ratio")
+    args = parser.parse_args(argv)
+
+    results = run(args.patterns, repeat=args.repeat, min_time=args.min_time)
+    payload = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    if args.output:
+        args.output.write_bytes(payload)
+    if args.save_baseline:
+        DEFAULT_BASELINE.write_bytes(payload)
+
+    if not args.compare:
+        for name, result in results["benchmarks"].items():
+            print(f"{name:40} {_format_seconds(result['median']):>10}  (min {_format_seconds(result['min'])})")
+        return 0
+
+    baseline = orjson.loads(args.compare.read_bytes())
+    rows = compare(results, baseline, args.threshold)
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:40} {_format_seconds(row['baseline']):>10} -> "
+            f"{_format_seconds(row['current']):>10}  x{row['ratio']:.2f}  {flag}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
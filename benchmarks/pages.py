@@ -0,0 +1,245 @@
+"""Synthetic provider-shaped documentation pages for scale-testing the scrapers."""
+
+import argparse
+import datetime
+import random
+import sys
+import time
+from pathlib import Path
+
+from scraper import anthropic_scraper, bedrock_scraper, gemini_scraper, openai_scraper, vertex_scraper
+
+SCRAPERS = {
+    "openai": openai_scraper.scrape,
+    "anthropic": anthropic_scraper.scrape,
+    "vertex": vertex_scraper.scrape,
+    "bedrock": bedrock_scraper.scrape,
+    "gemini": gemini_scraper.scrape,
+}
+
+BASE_DATE = datetime.date(2024, 1, 1)
+
+NOISE = (
+    "<nav>" + "".join(f'<a href="/docs/{i}">Docs section {i}</a>' for i in range(20)) + "</nav>"
+    "<script>window.dataLayer = window.dataLayer || [];</script>"
+    "<p>This page lists model versions and the dates on which they stop being served.</p>"
+)
+
+
+def _long_date(rng: random.Random) -> str:
+    date = BASE_DATE + datetime.timedelta(days=rng.randrange(1500))
+    return f"{date:%B} {date.day}, {date.year}"
+
+
+def _iso_date(rng: random.Random) -> str:
+    return (BASE_DATE + datetime.timedelta(days=rng.randrange(1500))).isoformat()
+
+
+def _split(rows: int, tables: int) -> list[range]:
+    """Split model indices ``0..rows`` into ``tables`` contiguous chunks."""
+    tables = max(1, min(tables, rows)) if rows else 1
+    size, extra = divmod(rows, tables)
+    chunks, start = [], 0
+    for i in range(tables):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(range(start, end))
+        start = end
+    return chunks
+
+
+def _openai(rng, rows, tables, rowspan_density, headings) -> list[str]:
+    parts = []
+    for t, chunk in enumerate(_split(rows, tables)):
+        parts.append(f"<h2>{_iso_date(rng)}</h2>")
+        parts.append(
+            "<table><tr><th>Shutdown date</th><th>Model / system</th>"
+            "<th>Recommended replacement</th></tr>"
+        )
+        for i in chunk:
+            date = _iso_date(rng).replace("-", "&#x2011;")
+            parts.append(f"<tr><td>{date}</td><td>gpt-synthetic-{i}</td><td>gpt-synthetic-{i + 1}</td></tr>")
+        parts.append("</table>")
+    return parts
+
+
+def _anthropic(rng, rows, tables, rowspan_density, headings) -> list[str]:
+    parts = [
+        "<h2>Model status</h2><table><tr><th>API Model Name</th><th>Current State</th>"
+        "<th>Deprecated</th><th>Tentative Retirement Date</th></tr>"
+    ]
+    states = ("Active", "Legacy", "Deprecated", "Retired")
+    for i in range(rows):
+        state = states[i % len(states)]
+        deprecated = "N/A" if state == "Active" else _long_date(rng)
+        retirement = f"Not sooner than {_long_date(rng)}" if state == "Active" else _long_date(rng)
+        parts.append(
+            f"<tr><td><code>claude-synthetic-{i}</code></td><td>{state}</td>"
+            f"<td>{deprecated}</td><td>{retirement}</td></tr>"
+        )
+    parts.append("</table><h2>Deprecation history</h2>")
+    retired = [i for i in range(rows) if i % len(states) >= 2]
+    for chunk in _split(len(retired), max(tables - 1, 1)):
+        parts.append(f"<h3>{_iso_date(rng)}: Claude synthetic models</h3>")
+        parts.append(
+            "<table><tr><th>Retirement Date</th><th>Deprecated Model</th>"
+            "<th>Recommended Replacement</th></tr>"
+        )
+        for j in chunk:
+            i = retired[j]
+            parts.append(
+                f"<tr><td>{_long_date(rng)}</td><td><code>claude-synthetic-{i}</code></td>"
+                f"<td><code>claude-synthetic-{i}-next</code></td></tr>"
+            )
+        parts.append("</table>")
+    return parts
+
+
+def _vertex(rng, rows, tables, rowspan_density, headings) -> list[str]:
+    parts = []
+    if headings:
+        # The heading/paragraph layout parsed by vertex_scraper._parse_headings.
+        for i in range(rows):
+            parts.append(f"<h3>Claude Synthetic {i}</h3>")
+            parts.append(
+                f"<p>Claude Synthetic {i} is deprecated as of {_long_date(rng)} and will be "
+                f"shut down on {_long_date(rng)}. It is available to existing customers only.</p>"
+            )
+        return parts
+    for chunk in _split(rows, tables):
+        parts.append("<h2>Deprecated partner models</h2>")
+        parts.append("<table><tr><th>Model</th><th>Deprecation date</th><th>Shutdown date</th></tr>")
+        for i in chunk:
+            parts.append(f"<tr><td>claude-synthetic-{i}</td><td>{_long_date(rng)}</td><td>{_long_date(rng)}</td></tr>")
+        parts.append("</table>")
+    return parts
+
+
+def _bedrock(rng, rows, tables, rowspan_density, headings) -> list[str]:
+    """Legacy and EOL tables in the layout read by scraper.tables.extract_grid.
+
+    A ``rowspan_density`` fraction of models get a second regional row
+    whose model-name cell is covered by a rowspan from the row above.
+    """
+    parts = []
+    for t, chunk in enumerate(_split(rows, tables)):
+        eol = t % 2 == 1
+        if eol:
+            parts.append("<h2>End-of-life model versions</h2><table><tr><th>Model version</th><th>Legacy date</th>")
+        else:
+            parts.append(
+                "<h2>Legacy model versions</h2><table><tr><th>Model version</th><th>Legacy date</th>"
+                "<th>Public extended access date</th>"
+            )
+        parts.append("<th>EOL date</th><th>Recommended model version replacement</th><th>Recommended model ID</th></tr>")
+        for i in chunk:
+            spans = 2 if rng.random() < rowspan_density else 1
+            for region in range(spans):
+                cells = []
+                if region == 0:
+                    rowspan = f' rowspan="{spans}"' if spans > 1 else ""
+                    cells.append(f"<td{rowspan}>Claude Synthetic {i}</td>")
+                cells.append(f"<td>{_long_date(rng)} (us-east-{region + 1})</td>")
+                if not eol:
+                    cells.append(f"<td>{_long_date(rng)}</td>")
+                cells.append(f"<td>{_long_date(rng)} (us-east-{region + 1})</td>")
+                cells.append(f"<td>Claude Synthetic {i + 1}</td>")
+                cells.append(f"<td>anthropic.claude-synthetic-{i + 1}-v1:0</td>")
+                parts.append("<tr>" + "".join(cells) + "</tr>")
+        parts.append("</table>")
+    return parts
+
+
+def _gemini(rng, rows, tables, rowspan_density, headings) -> list[str]:
+    parts = []
+    for t, chunk in enumerate(_split(rows, tables)):
+        parts.append(f"<h2>Gemini synthetic family {t}</h2>")
+        parts.append(
+            "<table><tr><th>Model</th><th>Release date</th><th>Shutdown date</th>"
+            "<th>Recommended replacement</th></tr>"
+        )
+        for i in chunk:
+            parts.append(
+                f"<tr><td>gemini-synthetic-{i}</td><td>{_long_date(rng)}</td>"
+                f"<td>{_long_date(rng)}</td><td>gemini-synthetic-{i + 1}</td></tr>"
+            )
+        parts.append("</table>")
+    return parts
+
+
+BUILDERS = {
+    "openai": _openai,
+    "anthropic": _anthropic,
+    "vertex": _vertex,
+    "bedrock": _bedrock,
+    "gemini": _gemini,
+}
+
+
+def generate_page(
+    provider: str,
+    rows: int,
+    tables: int = 1,
+    rowspan_density: float = 0.0,
+    sections: int = 0,
+    headings: bool = False,
+    seed: int = 0,
+) -> str:
+    """Build an HTML page shaped like ``provider``'s deprecations page.
+
+    ``rows`` is the number of distinct models, so the matching scraper
+    returns exactly ``rows`` entries. ``sections`` adds that many
+    navigation/script/prose blocks around the tables, the way real docs
+    pages wrap them. ``headings`` switches Vertex to its heading and
+    paragraph layout.
+    """
+    rng = random.Random(seed)
+    body = BUILDERS[provider](rng, rows, tables, rowspan_density, headings)
+    noise = [f"<section><h2>Overview {i}</h2>{NOISE}</section>" for i in range(sections)]
+    half = len(noise) // 2
+    return "<html><head><title>Deprecations</title></head><body>" + "".join(
+        noise[:half] + body + noise[half:]
+    ) + "</body></html>"
+
+
+def scale(provider: str, sizes: list[int], **options) -> list[tuple[int, int, float]]:
+    """Parse time per page size: (rows, page bytes, seconds)."""
+    results = []
+    for rows in sizes:
+        html = generate_page(provider, rows, **options)
+        start = time.perf_counter()
+        SCRAPERS[provider](html)
+        results.append((rows, len(html), time.perf_counter() - start))
+    return results
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pages", description=__doc__)
+    parser.add_argument("provider", choices=sorted(BUILDERS))
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000])
+    parser.add_argument("--tables", type=int, default=1)
+    parser.add_argument("--rowspan-density", type=float, default=0.0)
+    parser.add_argument("--sections", type=int, default=0)
+    parser.add_argument("--headings", action="store_true", help="Vertex heading/paragraph layout")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="write the page for the first --rows value here")
+    args = parser.parse_args(argv)
+
+    options = {
+        "tables": args.tables,
+        "rowspan_density": args.rowspan_density,
+        "sections": args.sections,
+        "headings": args.headings,
+        "seed": args.seed,
+    }
+    if args.output:
+        args.output.write_text(generate_page(args.provider, args.rows[0], **options))
+        return 0
+
+    print(f"{'rows':>8} {'page KB':>9} {'seconds':>9} {'us/row':>8}")
+    for rows, size, seconds in scale(args.provider, args.rows, **options):
+        print(f"{rows:>8} {size // 1024:>9} {seconds:>9.3f} {seconds / max(rows, 1) * 1e6:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import datetime
+import fnmatch
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.pages import generate_page
+from generators.ics_generator import generate_ics
+from generators.readme_generator import generate_readme
+from generators.slack_notifier import format_slack_message
+from scraper import anthropic_scraper, bedrock_scraper, codec, gemini_scraper, openai_scraper, vertex_scraper
+from scraper.base import UNKNOWN_DATE, DeprecationEntry
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+DATA_SIZES = (10, 100, 1000, 10000)
+PAGE_ROWS = (100, 1000)
+
+PROVIDERS = ("OpenAI", "Anthropic", "Vertex AI", "Bedrock", "Gemini")
+STATUSES = ("active", "legacy", "deprecated", "retired")
+
+SCRAPER_FIXTURES = [
+    ("openai", openai_scraper.scrape),
+    ("anthropic", anthropic_scraper.scrape),
+    ("vertex", vertex_scraper.scrape),
+    ("bedrock", bedrock_scraper.scrape),
+    ("gemini", gemini_scraper.scrape),
+]
+
+DEFAULT_THRESHOLD = 0.2
+
+
+def make_entries(count: int, today: datetime.date = None) -> list[DeprecationEntry]:
+    """Deterministic synthetic entries spread over every provider and status."""
+    if today is None:
+        today = datetime.date.today()
+    entries = []
+    for i in range(count):
+        shutdown = today + datetime.timedelta(days=(i * 7) % 365 - 120) if i % 5 else UNKNOWN_DATE
+        entries.append(
+            DeprecationEntry(
+                provider=PROVIDERS[i % len(PROVIDERS)],
+                model_name=f"model-{i}-preview",
+                model_id=f"vendor.model-{i}-v1:0" if i % 3 == 0 else "",
+                deprecated_date=today - datetime.timedelta(days=i % 200) if i % 2 else UNKNOWN_DATE,
+                shutdown_date=shutdown,
+                replacement=f"model-{i + 1}" if i % 4 else "",
+                status=STATUSES[i % len(STATUSES)],
+            )
+        )
+    return entries
+
+
+def _benchmarks() -> dict[str, Callable[[], Callable[[], object]]]:
+    """Benchmark name -> setup function returning the callable to time.
+
+    Setup (fixture loading, entry generation) runs outside the timed region.
+    """
+    cases: dict[str, Callable[[], Callable[[], object]]] = {}
+
+    for name, scrape_fn in SCRAPER_FIXTURES:
+
+        def setup(name=name, scrape_fn=scrape_fn):
+            html = (FIXTURES_DIR / f"{name}.html").read_text()
+            return lambda: scrape_fn(html)
+
+        cases[f"parse/{name}/fixture"] = setup
+
+        for rows in PAGE_ROWS:
+
+            def setup_page(name=name, scrape_fn=scrape_fn, rows=rows):
+                html = generate_page(name, rows, tables=4, rowspan_density=0.3, sections=5)
+                return lambda: scrape_fn(html)
+
+            cases[f"parse/{name}/{rows}"] = setup_page
+
+    for size in DATA_SIZES:
+
+        def readme(size=size):
+            entries = make_entries(size)
+            return lambda: generate_readme(entries)
+
+        def ics(size=size):
+            entries = make_entries(size)
+            return lambda: generate_ics(entries)
+
+        def slack(size=size):
+            entries = [e for e in make_entries(size) if e.has_shutdown_date()]
+            return lambda: format_slack_message(entries)
+
+        def to_dict(size=size):
+            entries = make_entries(size)
+            return lambda: [e.to_dict() for e in entries]
+
+        def from_dict(size=size):
+            dicts = [e.to_dict() for e in make_entries(size)]
+            return lambda: [DeprecationEntry.from_dict(d) for d in dicts]
+
+        def encode(size=size):
+            entries = make_entries(size)
+            return lambda: codec.encode(entries, indent=True)
+
+        def decode(size=size):
+            data = codec.encode(make_entries(size))
+            return lambda: codec.decode(data)
+
+        cases[f"generate_readme/{size}"] = readme
+        cases[f"generate_ics/{size}"] = ics
+        cases[f"format_slack_message/{size}"] = slack
+        cases[f"to_dict/{size}"] = to_dict
+        cases[f"from_dict/{size}"] = from_dict
+        cases[f"codec_encode/{size}"] = encode
+        cases[f"codec_decode/{size}"] = decode
+
+    return cases
+
+
+def time_callable(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.05) -> dict:
+    """Per-call timings in seconds, calibrating the loop count like timeit."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 10
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def run(patterns: list[str] = (), repeat: int = 5, min_time: float = 0.05) -> dict:
+    results: dict[str, dict] = {}
+    for name, setup in _benchmarks().items():
+        if patterns and not any(fnmatch.fnmatch(name, p) for p in patterns):
+            continue
+        results[name] = time_callable(setup(), repeat=repeat, min_time=min_time)
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Compare median timings; ``regression`` is set when slower by more than ``threshold``."""
+    rows = []
+    for name, result in current["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"] if base["median"] else float("inf")
+        rows.append(
+            {
+                "name": name,
+                "baseline": base["median"],
+                "current": result["median"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold,
+            }
+        )
+    return rows
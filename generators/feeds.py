@@ -0,0 +1,148 @@
+"""Filtered ICS feeds per provider, per status and per configured glob filter."""
+
+import dataclasses
+import fnmatch
+import logging
+import re
+import tomllib
+from pathlib import Path
+
+from analysis.index import DeprecationIndex
+from generators.ics_generator import (
+    CALENDAR_FOOTER,
+    CALENDAR_NAME,
+    calendar_header,
+    write_ics,
+)
+from generators.output import write_chunks_if_changed
+from scraper.base import DeprecationEntry
+
+log = logging.getLogger(__name__)
+
+FEED_NAME_RE = re.compile(r"[a-z0-9][a-z0-9_-]*")
+FEED_LIST_KEYS = ("providers", "statuses", "models")
+FEED_KEYS = {"title", *FEED_LIST_KEYS}
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+@dataclasses.dataclass
+class Feed:
+    """A calendar of the entries passing every given filter; empty filters pass all.
+
+    ``models`` holds case-insensitive globs matched against the model name
+    and the model ID.
+    """
+
+    path: str
+    title: str
+    providers: frozenset[str] = frozenset()
+    statuses: frozenset[str] = frozenset()
+    models: tuple[str, ...] = ()
+    _model_re: re.Pattern | None = dataclasses.field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.models:
+            self._model_re = re.compile("|".join(fnmatch.translate(glob.lower()) for glob in self.models))
+
+    def matches(self, entry: DeprecationEntry) -> bool:
+        if self.providers and entry.provider not in self.providers:
+            return False
+        if self.statuses and entry.status not in self.statuses:
+            return False
+        if self._model_re is not None:
+            return bool(
+                self._model_re.match(entry.model_name.lower())
+                or (entry.model_id and self._model_re.match(entry.model_id.lower()))
+            )
+        return True
+
+
+def load_feed_config(path: Path) -> list[Feed]:
+    """Feeds defined in a TOML file's ``[feeds.<name>]`` tables; none if it is missing.
+
+    Each table may set ``title`` and any of the ``providers``, ``statuses``
+    and ``models`` lists. The feed is written to ``<name>.ics``.
+    """
+    try:
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    except FileNotFoundError:
+        return []
+
+    feeds = []
+    for name, table in config.get("feeds", {}).items():
+        if not FEED_NAME_RE.fullmatch(name):
+            raise ValueError(f"{path}: feed name {name!r} must be lower-case letters, digits, '-' or '_'")
+        unknown = set(table) - FEED_KEYS
+        if unknown:
+            raise ValueError(f"{path}: unknown keys in feed {name!r}: {', '.join(sorted(unknown))}")
+        if not isinstance(table.get("title", ""), str):
+            raise ValueError(f"{path}: title of feed {name!r} must be a string")
+        for key in FEED_LIST_KEYS:
+            value = table.get(key, [])
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise ValueError(f"{path}: {key} of feed {name!r} must be a list of strings")
+        feeds.append(
+            Feed(
+                path=f"{name}.ics",
+                title=table.get("title", f"{CALENDAR_NAME} ({name})"),
+                providers=frozenset(table.get("providers", ())),
+                statuses=frozenset(table.get("statuses", ())),
+                models=tuple(table.get("models", ())),
+            )
+        )
+    return feeds
+
+
+def default_feeds(entries: list[DeprecationEntry] | DeprecationIndex) -> list[Feed]:
+    """One feed per provider and one per status, in order of first appearance."""
+    providers = dict.fromkeys(e.provider for e in entries)
+    statuses = dict.fromkeys(e.status for e in entries)
+    return [
+        Feed(path=f"providers/{slugify(p)}.ics", title=f"{CALENDAR_NAME} ({p})", providers=frozenset([p]))
+        for p in providers
+    ] + [
+        Feed(path=f"status/{slugify(s)}.ics", title=f"{CALENDAR_NAME} ({s})", statuses=frozenset([s]))
+        for s in statuses
+    ]
+
+
+def write_feeds(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    calendar_path: Path,
+    feeds_dir: Path,
+    config_path: Path = None,
+) -> dict[Path, bool]:
+    """Write the full calendar and every feed from a single pass over the entries.
+
+    The full calendar is written by write_ics, and each event it encodes,
+    with the SEQUENCE state of the full calendar, is shared byte-for-byte
+    by every feed that includes it. Feed files left over from providers or
+    filters that no longer exist are removed. Returns whether each file
+    changed.
+    """
+    index = DeprecationIndex.of(entries)
+    calendar_path, feeds_dir = Path(calendar_path), Path(feeds_dir)
+    feeds = default_feeds(index) + (load_feed_config(config_path) if config_path else [])
+
+    members: list[list[bytes]] = [[] for _ in feeds]
+
+    def share(entry: DeprecationEntry, event: bytes) -> None:
+        for feed, feed_events in zip(feeds, members):
+            if feed.matches(entry):
+                feed_events.append(event)
+
+    written = {calendar_path: write_ics(index, calendar_path, on_event=share)}
+    footer = CALENDAR_FOOTER.encode()
+    for feed, feed_events in zip(feeds, members):
+        path = feeds_dir / feed.path
+        written[path] = write_chunks_if_changed(path, [calendar_header(feed.title).encode(), *feed_events, footer])
+
+    if feeds_dir.is_dir():
+        for stale in set(feeds_dir.rglob("*.ics")) - set(written):
+            log.info("Removing stale feed %s", stale)
+            stale.unlink()
+    return written
@@ -1,52 +1,224 @@
 import datetime
+import hashlib
+import re
 from pathlib import Path
+from typing import Callable, Iterator
 
-from icalendar import Alarm, Calendar, Event
-
+from analysis.index import DeprecationIndex
+from generators.output import write_chunks_if_changed
 from scraper.base import DeprecationEntry
 
+CRLF = "\r\n"
+FOLD_LIMIT = 75
+UID_DOMAIN = "model-deprecation-tracker"
+HASH_PROPERTY = "X-DEPRECATION-HASH"
+ALARM_DAYS = (7, 30)
+
+CALENDAR_NAME = "Model Deprecations"
+CALENDAR_FOOTER = "END:VCALENDAR" + CRLF
+
+FOLDED_RE = re.compile(rb"\r?\n[ \t]")
+EVENT_STATE_RE = re.compile(
+    rb"^(UID|SEQUENCE|LAST-MODIFIED|" + HASH_PROPERTY.encode() + rb"):(.*?)\r?$", re.MULTILINE
+)
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT value as RFC 5545 section 3.3.11 requires."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line into CRLF-separated pieces shorter than 75 octets.
+
+    Pieces never split a UTF-8 character or a backslash escape, matching
+    the folding icalendar applied before this writer replaced it.
+    """
+    if len(line) < FOLD_LIMIT and line.isascii():
+        return line
+    pieces, current, size = [], [], 0
+    for char in line:
+        char_size = len(char.encode())
+        if current and size + char_size >= FOLD_LIMIT:
+            if len(current) > 1 and current[-1] == "\\":
+                pieces.append("".join(current[:-1]))
+                current, size = ["\\"], 1
+            else:
+                pieces.append("".join(current))
+                current, size = [], 0
+        current.append(char)
+        size += char_size
+    pieces.append("".join(current))
+    return (CRLF + " ").join(pieces)
+
+
+def _content_line(name: str, value: str) -> str:
+    return _fold(f"{name}:{value}") + CRLF
+
+
+def calendar_header(name: str = CALENDAR_NAME) -> str:
+    return "".join(
+        [
+            "BEGIN:VCALENDAR" + CRLF,
+            "VERSION:2.0" + CRLF,
+            "PRODID:-//ModelDeprecationTracker//EN" + CRLF,
+            _content_line("X-WR-CALNAME", _escape(name)),
+        ]
+    )
+
 
-def generate_ics(entries: list[DeprecationEntry]) -> str:
-    cal = Calendar()
-    cal.add("prodid", "-//ModelDeprecationTracker//EN")
-    cal.add("version", "2.0")
-    cal.add("x-wr-calname", "Model Deprecations")
+def event_uid(provider: str, model_name: str, ordinal: int = 0) -> str:
+    """Stable UID for a provider's model; repeats of a model get an ordinal."""
+    key = f"{provider}\0{model_name}" + (f"\0{ordinal}" if ordinal else "")
+    return f"{hashlib.sha1(key.encode()).hexdigest()[:20]}@{UID_DOMAIN}"
 
-    for entry in entries:
-        if not entry.has_shutdown_date():
+
+def _event_body(entry: DeprecationEntry) -> str:
+    description_parts = [f"Model: {entry.model_name}"]
+    if entry.model_id:
+        description_parts.append(f"Model ID: {entry.model_id}")
+    if entry.replacement:
+        description_parts.append(f"Replacement: {entry.replacement}")
+    description_parts.append(f"Status: {entry.status}")
+
+    lines = [
+        _content_line("SUMMARY", _escape(f"[{entry.provider}] Model deprecation: {entry.model_name}")),
+        _content_line("DTSTART;VALUE=DATE", entry.shutdown_date.strftime("%Y%m%d")),
+        _content_line(
+            "DTEND;VALUE=DATE", (entry.shutdown_date + datetime.timedelta(days=1)).strftime("%Y%m%d")
+        ),
+        _content_line("DESCRIPTION", _escape("\n".join(description_parts))),
+    ]
+    for days in ALARM_DAYS:
+        lines += [
+            "BEGIN:VALARM" + CRLF,
+            "ACTION:DISPLAY" + CRLF,
+            _content_line("DESCRIPTION", _escape(f"{entry.model_name} shutdown in {days} days")),
+            f"TRIGGER:-P{days}D" + CRLF,
+            "END:VALARM" + CRLF,
+        ]
+    return "".join(lines)
+
+
+def read_event_state(data: bytes) -> dict[str, tuple[str, int, str]]:
+    """UID -> (content hash, SEQUENCE, LAST-MODIFIED) for events in an ICS file."""
+    state: dict[str, tuple[str, int, str]] = {}
+    uid = None
+    fields: dict[bytes, bytes] = {}
+    for m in EVENT_STATE_RE.finditer(FOLDED_RE.sub(b"", data)):
+        name, value = m.groups()
+        if name == b"UID":
+            uid, fields = value.decode(), {}
+            state[uid] = ("", 0, "")
+            continue
+        if uid is None:
             continue
+        fields[name] = value
+        sequence = fields.get(b"SEQUENCE", b"0")
+        state[uid] = (
+            fields.get(HASH_PROPERTY.encode(), b"").decode(),
+            int(sequence) if sequence.isdigit() else 0,
+            fields.get(b"LAST-MODIFIED", b"").decode(),
+        )
+    return state
+
+
+def iter_events(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    previous: dict[str, tuple[str, int, str]] = None,
+    now: datetime.datetime = None,
+) -> Iterator[tuple[DeprecationEntry, str]]:
+    """Yield each dated entry with its encoded VEVENT, in input order.
+
+    An event keeps the SEQUENCE and LAST-MODIFIED it had in ``previous``
+    while its content hash is unchanged; otherwise LAST-MODIFIED becomes
+    ``now`` and SEQUENCE goes up by one. DTSTAMP follows LAST-MODIFIED, so
+    an unchanged calendar is byte-for-byte identical from run to run.
+    """
+    previous = previous or {}
+    stamp = (now or datetime.datetime.now(datetime.timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+    seen: dict[tuple[str, str], int] = {}
+    for entry in DeprecationIndex.of(entries).shutting_down(input_order=True):
+        ordinal = seen.get((entry.provider, entry.model_name), 0)
+        seen[(entry.provider, entry.model_name)] = ordinal + 1
+        uid = event_uid(entry.provider, entry.model_name, ordinal)
+
+        body = _event_body(entry)
+        content_hash = hashlib.sha256(body.encode()).hexdigest()[:16]
+        old_hash, sequence, modified = previous.get(uid, (None, -1, ""))
+        if old_hash != content_hash or not modified:
+            sequence, modified = sequence + 1, stamp
+
+        yield entry, "".join(
+            [
+                "BEGIN:VEVENT" + CRLF,
+                _content_line("UID", uid),
+                _content_line("DTSTAMP", modified),
+                _content_line("SEQUENCE", str(sequence)),
+                _content_line("LAST-MODIFIED", modified),
+                body,
+                _content_line(HASH_PROPERTY, content_hash),
+                "END:VEVENT" + CRLF,
+            ]
+        )
+
+
+def iter_ics(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    previous: dict[str, tuple[str, int, str]] = None,
+    now: datetime.datetime = None,
+) -> Iterator[str]:
+    """The calendar as a header, one string per event and a footer."""
+    yield calendar_header()
+    for _, event in iter_events(entries, previous, now):
+        yield event
+    yield CALENDAR_FOOTER
 
-        event = Event()
-        event.add("summary", f"[{entry.provider}] Model deprecation: {entry.model_name}")
 
-        description_parts = [f"Model: {entry.model_name}"]
-        if entry.model_id:
-            description_parts.append(f"Model ID: {entry.model_id}")
-        if entry.replacement:
-            description_parts.append(f"Replacement: {entry.replacement}")
-        description_parts.append(f"Status: {entry.status}")
-        event.add("description", "\n".join(description_parts))
+def generate_ics(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    previous: str = "",
+    now: datetime.datetime = None,
+) -> str:
+    """The whole calendar; ``previous`` is the last generated file, if any."""
+    return "".join(iter_ics(entries, read_event_state(previous.encode()), now))
 
-        event.add("dtstart", entry.shutdown_date)
-        event.add("dtend", entry.shutdown_date + datetime.timedelta(days=1))
 
-        alarm_7d = Alarm()
-        alarm_7d.add("action", "DISPLAY")
-        alarm_7d.add("description", f"{entry.model_name} shutdown in 7 days")
-        alarm_7d.add("trigger", datetime.timedelta(days=-7))
-        event.add_component(alarm_7d)
+def read_previous_state(path: Path) -> dict[str, tuple[str, int, str]]:
+    """Event state of the calendar at ``path``; empty if there is none yet."""
+    try:
+        return read_event_state(Path(path).read_bytes())
+    except FileNotFoundError:
+        return {}
 
-        alarm_30d = Alarm()
-        alarm_30d.add("action", "DISPLAY")
-        alarm_30d.add("description", f"{entry.model_name} shutdown in 30 days")
-        alarm_30d.add("trigger", datetime.timedelta(days=-30))
-        event.add_component(alarm_30d)
 
-        cal.add_component(event)
+def write_ics(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    path: str,
+    on_event: Callable[[DeprecationEntry, bytes], None] = None,
+) -> bool:
+    """Stream the calendar to ``path`` unless it is unchanged; returns whether the file changed.
 
-    return cal.to_ical().decode("utf-8")
+    ``on_event`` is called with each entry and its encoded VEVENT as it is
+    written, so write_feeds can share the bytes with the filtered feeds.
+    """
+    path = Path(path)
+    previous = read_previous_state(path)
 
+    def chunks() -> Iterator[bytes]:
+        yield calendar_header().encode()
+        for entry, event in iter_events(entries, previous):
+            encoded = event.encode()
+            if on_event is not None:
+                on_event(entry, encoded)
+            yield encoded
+        yield CALENDAR_FOOTER.encode()
 
-def write_ics(entries: list[DeprecationEntry], path: str) -> None:
-    ics_content = generate_ics(entries)
-    Path(path).write_text(ics_content)
+    return write_chunks_if_changed(path, chunks())
@@ -0,0 +1,75 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+def _tmp_path(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temporary file and a rename."""
+    path = Path(path)
+    tmp_path = _tmp_path(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_if_changed(
+    path: Path,
+    data: bytes,
+    normalize: Callable[[bytes], bytes] = None,
+) -> bool:
+    """Write ``data`` to ``path`` unless the file already holds the same content.
+
+    ``normalize`` is applied to both the current and the new bytes before
+    comparing, so volatile parts such as a timestamp can be ignored.
+    Returns whether the file was written.
+    """
+    path = Path(path)
+    try:
+        current = path.read_bytes()
+    except FileNotFoundError:
+        current = None
+
+    if current is not None:
+        if current == data or (normalize is not None and normalize(current) == normalize(data)):
+            return False
+
+    write_atomic(path, data)
+    return True
+
+
+def write_chunks_if_changed(path: Path, chunks: Iterable[bytes]) -> bool:
+    """Stream ``chunks`` to ``path`` unless the file already holds the same content.
+
+    The chunks go to a temporary file while being compared with the current
+    file, so neither version is held in memory. Returns whether the file
+    was written.
+    """
+    path = Path(path)
+    tmp_path = _tmp_path(path)
+    try:
+        current = open(path, "rb")
+    except FileNotFoundError:
+        current = None
+    try:
+        same = current is not None
+        with open(tmp_path, "wb") as out:
+            for chunk in chunks:
+                out.write(chunk)
+                if same and current.read(len(chunk)) != chunk:
+                    same = False
+        if same and not current.read(1):
+            return False
+        os.replace(tmp_path, path)
+        return True
+    finally:
+        if current is not None:
+            current.close()
+        tmp_path.unlink(missing_ok=True)
@@ -1,7 +1,12 @@
+import bisect
+import dataclasses
 import datetime
-from itertools import groupby
+import hashlib
+import re
 from pathlib import Path
 
+from analysis.index import DeprecationIndex
+from generators.output import write_if_changed
 from scraper.base import UNKNOWN_DATE, DeprecationEntry
 
 MARKER_START = "<!-- DEPRECATION_TABLE_START -->"
@@ -10,18 +15,20 @@ MARKER_END = "<!-- DEPRECATION_TABLE_END -->"
 RETENTION_DAYS = 90
 WARN_DAYS = 30
 
+LAST_UPDATED_RE = re.compile(rb"^\*Last updated: [0-9-]+\*$", re.MULTILINE)
 
-def _sort_key(entry: DeprecationEntry) -> tuple[int, datetime.date]:
-    if entry.has_shutdown_date():
-        return (0, entry.shutdown_date)
-    return (1, UNKNOWN_DATE)
+PAST_MARKER = "\U0001f534"
+WARN_MARKER = "\U0001f7e1"
 
-
-def _should_include(entry: DeprecationEntry, today: datetime.date) -> bool:
-    if not entry.has_shutdown_date():
-        return False
-    cutoff = today - datetime.timedelta(days=RETENTION_DAYS)
-    return entry.shutdown_date >= cutoff
+# Bump when the row layout changes so that stored sections are re-rendered.
+SECTION_FORMAT = "1"
+SECTION_START = "<!-- PROVIDER_SECTION {provider} hash={digest} valid_until={valid_until} -->"
+SECTION_END = "<!-- PROVIDER_SECTION_END -->"
+SECTION_RE = re.compile(
+    r"^<!-- PROVIDER_SECTION (?P<provider>.+?) hash=(?P<digest>[0-9a-f]+) "
+    r"valid_until=(?P<valid_until>[0-9-]+|never) -->\n(?P<body>.*?)^<!-- PROVIDER_SECTION_END -->$",
+    re.MULTILINE | re.DOTALL,
+)
 
 
 def _format_date(d: datetime.date) -> str:
@@ -35,54 +42,202 @@ def _format_shutdown(d: datetime.date, today: datetime.date) -> str:
         return "TBD"
     date_str = d.isoformat()
     if d <= today:
-        return f"\U0001f534 {date_str}"
+        return f"{PAST_MARKER} {date_str}"
     if (d - today).days <= WARN_DAYS:
-        return f"\U0001f7e1 {date_str}"
+        return f"{WARN_MARKER} {date_str}"
     return date_str
 
 
-def generate_readme(entries: list[DeprecationEntry]) -> str:
-    today = datetime.date.today()
-    relevant = [e for e in entries if _should_include(e, today)]
-    relevant.sort(key=lambda e: e.provider)
+@dataclasses.dataclass
+class _Section:
+    """A provider section parsed back out of a previously generated table."""
+
+    text: str
+    digest: str
+    valid_until: datetime.date | None
+    rows: list[str]
+
+
+def _section_hash(entries: list[DeprecationEntry]) -> str:
+    """Digest of everything a section shows except today-relative markers."""
+    h = hashlib.sha256(SECTION_FORMAT.encode())
+    for entry in entries:
+        h.update(
+            "\0".join(
+                (
+                    entry.model_name,
+                    entry.model_id,
+                    entry.status,
+                    entry.deprecated_date.isoformat(),
+                    entry.shutdown_date.isoformat(),
+                    entry.replacement,
+                    entry.resolved_replacement,
+                    "\n",
+                )
+            ).encode()
+        )
+    return h.hexdigest()[:16]
+
+
+def _valid_until(entries: list[DeprecationEntry], today: datetime.date) -> datetime.date | None:
+    """First day after ``today`` on which a row gains or changes its marker or expires.
+
+    A row turns yellow WARN_DAYS before shutdown, red on the shutdown date,
+    and drops out RETENTION_DAYS after it.
+    """
+    transitions = (
+        day
+        for entry in entries
+        for day in (
+            entry.shutdown_date - datetime.timedelta(days=WARN_DAYS),
+            entry.shutdown_date,
+            entry.shutdown_date + datetime.timedelta(days=RETENTION_DAYS + 1),
+        )
+        if day > today
+    )
+    return min(transitions, default=None)
+
+
+def _render_row(entry: DeprecationEntry, today: datetime.date) -> str:
+    model = " ".join(entry.model_name.split())
+    deprecated = _format_date(entry.deprecated_date)
+    shutdown = _format_shutdown(entry.shutdown_date, today)
+    replacement = " ".join(entry.replacement.split())
+    resolved = " ".join(entry.resolved_replacement.split())
+    if resolved and resolved != replacement:
+        replacement += f" \u2192 {resolved}"
+    return f"| {model} | {entry.model_id} | {entry.status} | {deprecated} | {shutdown} | {replacement} |"
+
+
+def _reclassify(rows: list[str], visible: list[DeprecationEntry], today: datetime.date) -> list[str] | None:
+    """Update the shutdown markers of already rendered rows in place.
+
+    Entries are in shutdown order, so rows that expired are a prefix of
+    ``rows`` and the rest line up with ``visible``. Only the shutdown cell
+    of each row is rewritten. Returns None if the rows do not line up.
+    """
+    if len(rows) < len(visible):
+        return None
+    updated = []
+    for row, entry in zip(rows[len(rows) - len(visible) :], visible):
+        date = entry.shutdown_date.isoformat()
+        for marker in (PAST_MARKER, WARN_MARKER):
+            row = row.replace(f"| {marker} {date} |", f"| {date} |")
+        cell = f"| {date} |"
+        position = row.rfind(cell)
+        if position == -1:
+            return None
+        new_cell = f"| {_format_shutdown(entry.shutdown_date, today)} |"
+        updated.append(row[:position] + new_cell + row[position + len(cell) :])
+    return updated
+
+
+def _parse_sections(previous: str) -> dict[str, _Section]:
+    sections = {}
+    for m in SECTION_RE.finditer(previous):
+        valid_until = m["valid_until"]
+        body = m["body"].splitlines()
+        sections[m["provider"]] = _Section(
+            text=m.group(0),
+            digest=m["digest"],
+            valid_until=None if valid_until == "never" else datetime.date.fromisoformat(valid_until),
+            rows=[line for line in body[4:] if line.startswith("| ")],
+        )
+    return sections
+
+
+def _render_section(
+    provider: str,
+    entries: list[DeprecationEntry],
+    today: datetime.date,
+    previous: _Section | None,
+) -> str:
+    """One provider's section, reusing or patching ``previous`` where possible.
+
+    The previous text is kept as is when the entries hash the same and no
+    marker can have changed since it was rendered. When only markers can
+    have changed, its rows are reclassified rather than rendered again.
+    """
+    cutoff = today - datetime.timedelta(days=RETENTION_DAYS)
+    visible = entries[bisect.bisect_left([e.shutdown_date for e in entries], cutoff) :]
+    if not visible:
+        return ""
+    digest = _section_hash(entries)
+    if previous is not None and previous.digest == digest:
+        if previous.valid_until is None or today < previous.valid_until:
+            return previous.text
+        rows = _reclassify(previous.rows, visible, today)
+    else:
+        rows = None
+    if rows is None:
+        rows = [_render_row(entry, today) for entry in visible]
+
+    valid_until = _valid_until(visible, today)
+    lines = [
+        SECTION_START.format(
+            provider=provider,
+            digest=digest,
+            valid_until=valid_until.isoformat() if valid_until else "never",
+        ),
+        f"### {provider}",
+        "",
+        "| Model | Model ID | Status | Deprecated | Shutdown | Replacement |",
+        "|-------|----------|--------|------------|----------|-------------|",
+        *rows,
+        "",
+        SECTION_END,
+    ]
+    return "\n".join(lines)
+
+
+def generate_readme(
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    previous: str = "",
+    today: datetime.date = None,
+) -> str:
+    """The table block, one marked section per provider.
+
+    ``previous`` is the block from the last run; sections in it whose
+    entries are unchanged are reused instead of being rendered again.
+    """
+    if today is None:
+        today = datetime.date.today()
+    # Already ordered by shutdown date; grouping keeps that within each provider.
+    by_provider: dict[str, list[DeprecationEntry]] = {}
+    for entry in DeprecationIndex.of(entries).shutting_down():
+        by_provider.setdefault(entry.provider, []).append(entry)
+    previous_sections = _parse_sections(previous) if previous else {}
 
     lines: list[str] = []
     lines.append(MARKER_START)
     lines.append("")
     lines.append(f"*Last updated: {today.isoformat()}*")
     lines.append("")
-
-    for provider, group in groupby(relevant, key=lambda e: e.provider):
-        group_entries = sorted(group, key=_sort_key)
-        lines.append(f"### {provider}")
-        lines.append("")
-        lines.append("| Model | Model ID | Status | Deprecated | Shutdown | Replacement |")
-        lines.append("|-------|----------|--------|------------|----------|-------------|")
-
-        for entry in group_entries:
-            model = " ".join(entry.model_name.split())
-            model_id = entry.model_id
-            status = entry.status
-            deprecated = _format_date(entry.deprecated_date)
-            shutdown = _format_shutdown(entry.shutdown_date, today)
-            replacement = " ".join(entry.replacement.split())
-            lines.append(
-                f"| {model} | {model_id} | {status} | {deprecated} | {shutdown} | {replacement} |"
-            )
-
-        lines.append("")
-
+    for provider in sorted(by_provider):
+        section = _render_section(provider, by_provider[provider], today, previous_sections.get(provider))
+        if section:
+            lines.append(section)
+            lines.append("")
     lines.append(MARKER_END)
     return "\n".join(lines)
 
 
-def update_readme(readme_path: str, entries: list[DeprecationEntry]) -> None:
+def _without_timestamp(content: bytes) -> bytes:
+    return LAST_UPDATED_RE.sub(b"", content)
+
+
+def update_readme(readme_path: str, entries: list[DeprecationEntry] | DeprecationIndex) -> bool:
+    """Splice a fresh table into the README; returns whether the file changed.
+
+    A table that differs only in its "Last updated" line is left alone, so
+    the date moves only when the data does.
+    """
     path = Path(readme_path)
     content = path.read_text() if path.exists() else ""
-    new_table = generate_readme(entries)
-
     start_idx = content.find(MARKER_START)
     end_idx = content.find(MARKER_END)
+    previous = content[start_idx:end_idx] if start_idx != -1 and end_idx != -1 else ""
+    new_table = generate_readme(entries, previous)
 
     if start_idx != -1 and end_idx != -1:
         end_idx += len(MARKER_END)
@@ -92,4 +247,4 @@ def update_readme(readme_path: str, entries: list[DeprecationEntry]) -> None:
             content += "\n"
         content += "\n" + new_table + "\n"
 
-    path.write_text(content)
+    return write_if_changed(path, content.encode(), normalize=_without_timestamp)
@@ -1,24 +1,32 @@
 import datetime
 import logging
 
-import requests
-
 log = logging.getLogger(__name__)
 
-from scraper.base import DeprecationEntry
+from analysis.index import DeprecationIndex
+from scraper.base import DeprecationEntry, get_session
 
 NOTIFY_AT_DAYS = {14, 1}
 
 
 def find_upcoming_deprecations(
-    entries: list[DeprecationEntry], notify_at_days: set[int] = NOTIFY_AT_DAYS
+    entries: list[DeprecationEntry] | DeprecationIndex, notify_at_days: set[int] = NOTIFY_AT_DAYS
 ) -> list[DeprecationEntry]:
     today = datetime.date.today()
-    return [
-        e
-        for e in entries
-        if e.has_shutdown_date() and (e.shutdown_date - today).days in notify_at_days
-    ]
+    return DeprecationIndex.of(entries).shutting_down_on(
+        today + datetime.timedelta(days=days) for days in notify_at_days
+    )
+
+
+def days_until(entry: DeprecationEntry, today: datetime.date = None) -> int:
+    """Whole days from ``today`` until ``entry`` shuts down; negative once it has."""
+    return (entry.shutdown_date - (today or datetime.date.today())).days
+
+
+def _resolved_suffix(entry: DeprecationEntry) -> str:
+    if entry.resolved_replacement and entry.resolved_replacement != entry.replacement:
+        return f" (resolves to {entry.resolved_replacement})"
+    return ""
 
 
 def format_slack_message(entries: list[DeprecationEntry]) -> dict:
@@ -33,13 +41,12 @@ def format_slack_message(entries: list[DeprecationEntry]) -> dict:
     ]
 
     for entry in entries:
-        days_until = (entry.shutdown_date - datetime.date.today()).days
         text = f"*{entry.provider}* - {entry.model_name}"
         if entry.model_id:
             text += f" (`{entry.model_id}`)"
-        text += f"\nShutdown: {entry.shutdown_date.isoformat()} ({days_until} days)"
+        text += f"\nShutdown: {entry.shutdown_date.isoformat()} ({days_until(entry)} days)"
         if entry.replacement:
-            text += f"\nReplacement: {entry.replacement}"
+            text += f"\nReplacement: {entry.replacement}{_resolved_suffix(entry)}"
 
         blocks.append(
             {
@@ -54,19 +61,20 @@ def format_slack_message(entries: list[DeprecationEntry]) -> dict:
     # Build plain-text fallback for Slack event ingestion
     lines = ["Upcoming Model Deprecations"]
     for entry in entries:
-        days_until = (entry.shutdown_date - datetime.date.today()).days
         line = f"{entry.provider} - {entry.model_name}"
         if entry.model_id:
             line += f" ({entry.model_id})"
-        line += f" | Shutdown: {entry.shutdown_date.isoformat()} ({days_until} days)"
+        line += f" | Shutdown: {entry.shutdown_date.isoformat()} ({days_until(entry)} days)"
         if entry.replacement:
-            line += f" | Replacement: {entry.replacement}"
+            line += f" | Replacement: {entry.replacement}{_resolved_suffix(entry)}"
         lines.append(line)
 
     return {"text": "\n".join(lines), "blocks": blocks}
 
 
-def send_notification(entries: list[DeprecationEntry], webhook_urls: list[str]) -> None:
+def send_notification(
+    entries: list[DeprecationEntry] | DeprecationIndex, webhook_urls: list[str]
+) -> None:
     """Send a separate Slack notification per shutdown horizon.
 
     Entries are grouped by days-until-shutdown so each deadline (e.g. the
@@ -80,11 +88,10 @@ def send_notification(entries: list[DeprecationEntry], webhook_urls: list[str])
     today = datetime.date.today()
     groups: dict[int, list[DeprecationEntry]] = {}
     for entry in upcoming:
-        days_until = (entry.shutdown_date - today).days
-        groups.setdefault(days_until, []).append(entry)
+        groups.setdefault(days_until(entry, today), []).append(entry)
 
-    for days_until in sorted(groups):  # most urgent first
-        payload = format_slack_message(groups[days_until])
-        log.info("Sending Slack notification (%s days):\n%s", days_until, payload)
+    for days in sorted(groups):  # most urgent first
+        payload = format_slack_message(groups[days])
+        log.info("Sending Slack notification (%s days):\n%s", days, payload)
         for url in webhook_urls:
-            requests.post(url, json=payload, timeout=10)
+            get_session().post(url, json=payload, timeout=10)
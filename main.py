@@ -1,39 +1,108 @@
+import argparse
+import datetime
 import logging
 import os
+import sys
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 import orjson
 
-from generators.ics_generator import write_ics
+from analysis.entities import resolve_entities
+from analysis.index import DeprecationIndex
+from analysis.replacements import resolve_replacements
+from generators.feeds import write_feeds
+from generators.output import write_if_changed
 from generators.readme_generator import update_readme
 from generators.slack_notifier import send_notification
-from scraper import ALL_SCRAPERS
-from scraper.base import DeprecationEntry
+from scraper import codec
+from scraper.base import CACHE_DIR, DeprecationEntry, connection_stats, http_cache
+from scraper.memo import parse_memo
+from scraper.runner import DEFAULT_TIMEOUT, DEFAULT_WORKERS, scrape_all
+from store.history import HistoryStore
+from store.sqlite_store import query, shutting_down_within, write_database
+from usage.impact import impact
+from usage.incremental import exit_code
+from usage.scanner import scan
 
 PROJECT_DIR = Path(__file__).parent
 DATA_DIR = PROJECT_DIR / "data"
 DEPRECATIONS_FILE = DATA_DIR / "deprecations.json"
+MODELS_FILE = DATA_DIR / "models.json"
 README_PATH = PROJECT_DIR / "README.md"
 ICS_PATH = PROJECT_DIR / "deprecations.ics"
+FEEDS_DIR = PROJECT_DIR / "feeds"
+FEEDS_CONFIG = PROJECT_DIR / "feeds.toml"
+HISTORY_DIR = DATA_DIR / "history"
+# Set SQLITE_DB to an empty string to skip writing the database.
+DATABASE_PATH = os.environ.get("SQLITE_DB", str(DATA_DIR / "deprecations.db"))
 
+log = logging.getLogger(__name__)
 
-def main() -> None:
-    all_entries: list[DeprecationEntry] = []
 
-    for _name, scrape_fn in ALL_SCRAPERS:
-        entries = scrape_fn()
-        all_entries.extend(entries)
+def update() -> None:
+    results = scrape_all(
+        max_workers=int(os.environ.get("SCRAPE_WORKERS", DEFAULT_WORKERS)),
+        timeout=float(os.environ.get("SCRAPE_TIMEOUT", DEFAULT_TIMEOUT)),
+    )
+    all_entries: list[DeprecationEntry] = []
+    previous = None
+    for result in results:
+        if not result.timed_out:
+            all_entries.extend(result.entries)
+            continue
+        # Keep the last good data rather than dropping a slow provider's models.
+        if previous is None:
+            previous = codec.load(DEPRECATIONS_FILE) if DEPRECATIONS_FILE.exists() else []
+        kept = [e for e in previous if e.provider == result.name]
+        log.warning("Keeping %d previous %s entries after the scrape timed out", len(kept), result.name)
+        all_entries.extend(kept)
 
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    serialized = [entry.to_dict() for entry in all_entries]
-    DEPRECATIONS_FILE.write_bytes(
-        orjson.dumps(serialized, option=orjson.OPT_INDENT_2)
+    stats = http_cache.stats
+    log.info(
+        "HTTP cache: %d hits, %d misses, %d revalidations",
+        stats.hits,
+        stats.misses,
+        stats.revalidations,
+    )
+    log.info(
+        "Parse memo: %d unchanged pages reused, %d parsed",
+        parse_memo.stats.hits,
+        parse_memo.stats.misses,
     )
 
-    update_readme(str(README_PATH), all_entries)
-    write_ics(all_entries, str(ICS_PATH))
+    index = DeprecationIndex(all_entries)
+    resolve_replacements(index)
+    entities = resolve_entities(all_entries)
+    written = {
+        DEPRECATIONS_FILE: write_if_changed(DEPRECATIONS_FILE, codec.encode(all_entries, indent=True)),
+        MODELS_FILE: write_if_changed(
+            MODELS_FILE,
+            orjson.dumps([entity.to_dict() for entity in entities], option=orjson.OPT_INDENT_2),
+        ),
+        README_PATH: update_readme(str(README_PATH), index),
+        **write_feeds(index, ICS_PATH, FEEDS_DIR, FEEDS_CONFIG),
+    }
+    for path, changed in written.items():
+        name = path.relative_to(PROJECT_DIR)
+        if changed:
+            log.info("Wrote %s", name)
+        else:
+            log.info("Skipped %s (unchanged)", name)
+
+    if DATABASE_PATH and (written[DEPRECATIONS_FILE] or not Path(DATABASE_PATH).exists()):
+        write_database(Path(DATABASE_PATH), all_entries)
+        log.info("Wrote %s", DATABASE_PATH)
+
+    changes = HistoryStore(HISTORY_DIR).record(all_entries)
+    counts = {op: sum(c.op == op for c in changes) for op in ("added", "changed", "removed")}
+    log.info(
+        "History: %d added, %d changed, %d removed",
+        counts["added"],
+        counts["changed"],
+        counts["removed"],
+    )
 
     slack_webhooks = [
         url.strip()
@@ -41,7 +110,142 @@ def main() -> None:
         if url.strip()
     ]
     if slack_webhooks:
-        send_notification(all_entries, slack_webhooks)
+        send_notification(index, slack_webhooks)
+
+    for host, host_stats in sorted(connection_stats().items()):
+        log.info(
+            "Connections to %s: %d requests over %d connections (%d reused)",
+            host,
+            host_stats.requests,
+            host_stats.connections,
+            host_stats.reused,
+        )
+
+
+def _format_value(value) -> str:
+    return value if value else "-"
+
+
+def show_history(args: argparse.Namespace) -> int:
+    store = HistoryStore(HISTORY_DIR)
+    if not args.model:
+        for provider, model_name in store.models(args.provider):
+            print(f"{provider}\t{model_name}")
+        return 0
+
+    if not args.provider:
+        print("history: --provider is required with a model name", file=sys.stderr)
+        return 2
+    changes = store.history(args.provider, args.model)
+    if not changes:
+        print(f"No history for {args.provider} {args.model}", file=sys.stderr)
+        return 1
+    for change in changes:
+        if change.op == "changed":
+            detail = ", ".join(
+                f"{name}: {_format_value(change.before[name])} -> {_format_value(change.after[name])}"
+                for name in change.fields
+            )
+        else:
+            entry = change.after or change.before
+            detail = f"shutdown {_format_value(entry['shutdown_date'])}, status {entry['status']}"
+        print(f"{change.at}  {change.op:<8} {detail}")
+    return 0
+
+
+def _database() -> Path:
+    """The SQLite database, rebuilt from the JSON if it is missing or older."""
+    path = Path(DATABASE_PATH) if DATABASE_PATH else CACHE_DIR / "deprecations.db"
+    if not path.exists() or path.stat().st_mtime < DEPRECATIONS_FILE.stat().st_mtime:
+        write_database(path, codec.load(DEPRECATIONS_FILE))
+    return path
+
+
+def run_query(args: argparse.Namespace) -> int:
+    filters = {"provider": args.provider, "status": args.status, "model": args.model}
+    if args.within is not None:
+        entries = shutting_down_within(_database(), args.within, **filters)
+    else:
+        entries = query(_database(), shutdown_from=args.shutdown_from, shutdown_to=args.shutdown_to, **filters)
+
+    if args.json:
+        sys.stdout.buffer.write(codec.encode(entries, indent=True) + b"\n")
+        return 0
+    for entry in entries:
+        shutdown = entry.shutdown_date.isoformat() if entry.has_shutdown_date() else "TBD"
+        model = f"{entry.model_name} ({entry.model_id})" if entry.model_id else entry.model_name
+        replacement = f" -> {entry.replacement}" if entry.replacement else ""
+        print(f"{shutdown:<10}  {entry.provider:<10}  {entry.status:<10}  {model}{replacement}")
+    return 0
+
+
+def run_scan(args: argparse.Namespace) -> int:
+    hits = scan(args.paths, codec.load(DEPRECATIONS_FILE), jobs=args.jobs, respect_ignore=not args.no_ignore)
+    for hit in hits:
+        print(hit.format())
+    log.info("%d reference(s) to retiring models in %d file(s)", len(hits), len({hit.path for hit in hits}))
+    return exit_code(hits)
+
+
+def run_impact(args: argparse.Namespace) -> int:
+    rows = impact(
+        args.logs,
+        DeprecationIndex(codec.load(DEPRECATIONS_FILE)),
+        team_field=args.team_field,
+        model_field=args.model_field,
+        jobs=args.jobs,
+    )
+    if args.json:
+        sys.stdout.buffer.write(orjson.dumps([row.to_dict() for row in rows], option=orjson.OPT_INDENT_2) + b"\n")
+        return 0
+    for row in rows:
+        data = row.to_dict()
+        replacement = f" -> {data['replacement']}" if data["replacement"] else ""
+        print(
+            f"{row.horizon:<11}  {data['shutdown_date'] or 'TBD':<10}  {row.team or '-':<16}  "
+            f"{row.requests:>10}  {data['provider']} {data['model']}{replacement}"
+        )
+    return 0
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python main.py", description="Track AI model deprecations.")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("update", help="scrape providers and regenerate outputs (default)")
+    history = commands.add_parser("history", help="show recorded changes for a model")
+    history.add_argument("model", nargs="?", help="model name; omit to list tracked models")
+    history.add_argument("-p", "--provider", default="", help="provider, e.g. Bedrock")
+    search = commands.add_parser("query", help="filter entries through the SQLite database")
+    search.add_argument("-p", "--provider", default="")
+    search.add_argument("-s", "--status", default="")
+    search.add_argument("-m", "--model", default="", help="model name or model ID")
+    search.add_argument("--within", type=int, metavar="DAYS", help="shutting down in the next DAYS days")
+    search.add_argument("--from", dest="shutdown_from", type=datetime.date.fromisoformat, help="earliest shutdown date")
+    search.add_argument("--to", dest="shutdown_to", type=datetime.date.fromisoformat, help="latest shutdown date")
+    search.add_argument("--json", action="store_true", help="print entries as JSON")
+    scanner = commands.add_parser("scan", help="find references to retiring models in source files")
+    scanner.add_argument("paths", nargs="*", type=Path, default=[Path(".")], help="files or directories (default: .)")
+    scanner.add_argument("-j", "--jobs", type=int, help="worker processes (default: CPU count)")
+    scanner.add_argument("--no-ignore", action="store_true", help="also scan files excluded by .gitignore")
+    report = commands.add_parser("impact", help="count logged requests per team to retiring models")
+    report.add_argument("logs", nargs="+", type=Path, help="CSV or NDJSON request logs, optionally gzipped")
+    report.add_argument("--team-field", default="team", help="team column or key (default: team)")
+    report.add_argument("--model-field", default="model", help="model column or key (default: model)")
+    report.add_argument("-j", "--jobs", type=int, default=1, help="worker processes for multiple logs")
+    report.add_argument("--json", action="store_true", help="print rows as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "history":
+        return show_history(args)
+    if args.command == "query":
+        return run_query(args)
+    if args.command == "scan":
+        return run_scan(args)
+    if args.command == "impact":
+        return run_impact(args)
+    update()
+    return 0
 
 
-main()
+if __name__ == "__main__":
+    sys.exit(main())
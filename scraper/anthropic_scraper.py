@@ -1,13 +1,13 @@
-import datetime
-import re
-
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-
 from scraper.base import UNKNOWN_DATE, DeprecationEntry, fetch_page
+from scraper.dates import parse_date_safe, strip_not_sooner_than
+from scraper.memo import parse_memo
+from scraper.parsing import TABLES_ONLY, make_soup
+from scraper.tables import TableGrid, extract_grid
 
 URL = "https://platform.claude.com/docs/en/about-claude/model-deprecations"
 
+DATE_QUIRKS = (strip_not_sooner_than,)
+
 STATUS_MAP = {
     "active": "active",
     "legacy": "legacy",
@@ -15,34 +15,13 @@ STATUS_MAP = {
     "retired": "retired",
 }
 
-NOT_SOONER_THAN_RE = re.compile(r"not\s+sooner\s+than\s+(.+)", re.IGNORECASE)
-
 
 def _clean_model_name(text: str) -> str:
     return text.strip().strip("`").strip()
 
 
-def _parse_date_safe(text: str) -> datetime.date:
-    text = text.strip()
-    if not text or text.upper() == "N/A" or text == "-" or text == "—":
-        return UNKNOWN_DATE
-
-    match = NOT_SOONER_THAN_RE.search(text)
-    if match:
-        text = match.group(1).strip()
-
-    try:
-        return parse_date(text, fuzzy=True).date()
-    except (ValueError, OverflowError):
-        return UNKNOWN_DATE
-
-
-def _parse_status_table(table: BeautifulSoup) -> list[DeprecationEntry]:
-    rows = table.find_all("tr")
-    if not rows:
-        return []
-
-    headers = [th.get_text().strip().lower() for th in rows[0].find_all(["th", "td"])]
+def _parse_status_table(grid: TableGrid) -> list[DeprecationEntry]:
+    headers = [h.lower() for h in grid.headers]
 
     name_idx = -1
     state_idx = -1
@@ -63,12 +42,10 @@ def _parse_status_table(table: BeautifulSoup) -> list[DeprecationEntry]:
         return []
 
     entries = []
-    for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        if len(cells) <= name_idx:
+    for cell_texts in grid.rows():
+        if len(cell_texts) <= name_idx:
             continue
 
-        cell_texts = [c.get_text().strip() for c in cells]
         model_name = _clean_model_name(cell_texts[name_idx])
         if not model_name:
             continue
@@ -80,11 +57,11 @@ def _parse_status_table(table: BeautifulSoup) -> list[DeprecationEntry]:
 
         deprecated_date = UNKNOWN_DATE
         if deprecated_idx >= 0 and deprecated_idx < len(cell_texts):
-            deprecated_date = _parse_date_safe(cell_texts[deprecated_idx])
+            deprecated_date = parse_date_safe(cell_texts[deprecated_idx], DATE_QUIRKS)
 
         shutdown_date = UNKNOWN_DATE
         if retirement_idx >= 0 and retirement_idx < len(cell_texts):
-            shutdown_date = _parse_date_safe(cell_texts[retirement_idx])
+            shutdown_date = parse_date_safe(cell_texts[retirement_idx], DATE_QUIRKS)
 
         entries.append(
             DeprecationEntry(
@@ -99,13 +76,9 @@ def _parse_status_table(table: BeautifulSoup) -> list[DeprecationEntry]:
     return entries
 
 
-def _parse_history_table(table: BeautifulSoup) -> dict[str, str]:
+def _parse_history_table(grid: TableGrid) -> dict[str, str]:
     """Returns a mapping of model_name -> replacement from deprecation history tables."""
-    rows = table.find_all("tr")
-    if not rows:
-        return {}
-
-    headers = [th.get_text().strip().lower() for th in rows[0].find_all(["th", "td"])]
+    headers = [h.lower() for h in grid.headers]
 
     model_idx = -1
     replacement_idx = -1
@@ -120,12 +93,10 @@ def _parse_history_table(table: BeautifulSoup) -> dict[str, str]:
         return {}
 
     replacements: dict[str, str] = {}
-    for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        if len(cells) <= max(model_idx, replacement_idx):
+    for cell_texts in grid.rows():
+        if len(cell_texts) <= max(model_idx, replacement_idx):
             continue
 
-        cell_texts = [c.get_text().strip() for c in cells]
         model_name = _clean_model_name(cell_texts[model_idx])
         replacement = cell_texts[replacement_idx].strip()
 
@@ -145,37 +116,35 @@ def _is_history_table(headers: list[str]) -> bool:
     return "retirement date" in header_text and "deprecated model" in header_text
 
 
-def scrape(html: str = "") -> list[DeprecationEntry]:
-    if not html:
-        html = fetch_page(URL)
-
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_page(html: str) -> list[DeprecationEntry]:
+    soup = make_soup(html, only=TABLES_ONLY)
     entries: list[DeprecationEntry] = []
     replacements: dict[str, str] = {}
 
-    tables = soup.find_all("table")
-
     status_tables = []
     history_tables = []
 
-    for table in tables:
-        first_row = table.find("tr")
-        if not first_row:
-            continue
-        headers = [th.get_text().strip() for th in first_row.find_all(["th", "td"])]
-        if _is_status_table(headers):
-            status_tables.append(table)
-        elif _is_history_table(headers):
-            history_tables.append(table)
+    for table in soup.find_all("table"):
+        grid = extract_grid(table)
+        if _is_status_table(grid.headers):
+            status_tables.append(grid)
+        elif _is_history_table(grid.headers):
+            history_tables.append(grid)
 
-    for table in history_tables:
-        replacements.update(_parse_history_table(table))
+    for grid in history_tables:
+        replacements.update(_parse_history_table(grid))
 
-    for table in status_tables:
-        entries.extend(_parse_status_table(table))
+    for grid in status_tables:
+        entries.extend(_parse_status_table(grid))
 
     for entry in entries:
         if entry.model_name in replacements:
             entry.replacement = replacements[entry.model_name]
 
     return entries
+
+
+def scrape(html: str = "") -> list[DeprecationEntry]:
+    if html:
+        return _parse_page(html)
+    return parse_memo.parse("Anthropic", fetch_page(URL), _parse_page)
@@ -1,14 +1,43 @@
 import dataclasses
 import datetime
+import os
+import sys
+import threading
+from pathlib import Path
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.util import make_headers
+
+from scraper.http_cache import DEFAULT_MAX_AGE, HttpCache
 
 UNKNOWN_DATE = datetime.date.min
 
+CACHE_DIR = Path(os.environ.get("CACHE_DIR") or Path(__file__).resolve().parent.parent / ".cache")
 
-@dataclasses.dataclass
+http_cache = HttpCache(
+    CACHE_DIR / "http",
+    max_age=float(os.environ.get("HTTP_CACHE_MAX_AGE", DEFAULT_MAX_AGE)),
+)
+
+
+def _date_to_str(value) -> str:
+    if value == UNKNOWN_DATE:
+        return ""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+@dataclasses.dataclass(slots=True)
 class DeprecationEntry:
+    """One model's deprecation record.
+
+    Slotted to keep large inventories and history compact in memory;
+    ``provider`` and ``status`` come from a handful of values, so they are
+    interned and shared across entries.
+    """
+
     provider: str
     model_name: str
     model_id: str = ""
@@ -16,6 +45,12 @@ class DeprecationEntry:
     shutdown_date: datetime.date = UNKNOWN_DATE
     replacement: str = ""
     status: str = "active"
+    # The end of the replacement chain, filled in by analysis.replacements.
+    resolved_replacement: str = ""
+
+    def __post_init__(self) -> None:
+        self.provider = sys.intern(self.provider)
+        self.status = sys.intern(self.status)
 
     def has_deprecated_date(self) -> bool:
         return self.deprecated_date != UNKNOWN_DATE
@@ -24,14 +59,16 @@ class DeprecationEntry:
         return self.shutdown_date != UNKNOWN_DATE
 
     def to_dict(self) -> dict:
-        d = dataclasses.asdict(self)
-        for key in ("deprecated_date", "shutdown_date"):
-            val = d[key]
-            if val == UNKNOWN_DATE:
-                d[key] = ""
-            elif isinstance(val, datetime.date):
-                d[key] = val.isoformat()
-        return d
+        return {
+            "provider": self.provider,
+            "model_name": self.model_name,
+            "model_id": self.model_id,
+            "deprecated_date": _date_to_str(self.deprecated_date),
+            "shutdown_date": _date_to_str(self.shutdown_date),
+            "replacement": self.replacement,
+            "status": self.status,
+            "resolved_replacement": self.resolved_replacement,
+        }
 
     @classmethod
     def from_dict(cls, d: dict) -> "DeprecationEntry":
@@ -45,23 +82,72 @@ class DeprecationEntry:
         return cls(**d)
 
 
+POOL_HOSTS = 10
+POOL_CONNECTIONS_PER_HOST = 4
+
+RETRY_POLICY = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
+
+@dataclasses.dataclass
+class ConnectionStats:
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.requests - self.connections
+
+
 def create_session() -> requests.Session:
     session = requests.Session()
-    retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(
+        max_retries=RETRY_POLICY,
+        pool_connections=POOL_HOSTS,
+        pool_maxsize=POOL_CONNECTIONS_PER_HOST,
+        pool_block=True,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     session.headers.update(
         {
-            "User-Agent": "ModelDeprecationTracker/1.0 (+https://github.com/model-deprecation-tracker)"
+            "User-Agent": "ModelDeprecationTracker/1.0 (+https://github.com/model-deprecation-tracker)",
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+            "Connection": "keep-alive",
         }
     )
     return session
 
 
+def get_session() -> requests.Session:
+    """Return the process-wide session shared by every scraper and notifier."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def connection_stats(session: requests.Session = None) -> dict[str, ConnectionStats]:
+    """Per-host request and new-connection counts from the session's pools."""
+    if session is None:
+        session = get_session()
+    stats: dict[str, ConnectionStats] = {}
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host_stats = stats.setdefault(pool.host, ConnectionStats())
+            host_stats.requests += pool.num_requests
+            host_stats.connections += pool.num_connections
+    return stats
+
+
 def fetch_page(url: str, session: requests.Session = None) -> str:
     if session is None:
-        session = create_session()
-    response = session.get(url, timeout=30)
-    response.raise_for_status()
-    return response.text
+        session = get_session()
+    return http_cache.get(session, url, timeout=30)
@@ -1,32 +1,14 @@
 import datetime
-import re
-
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
 
 from scraper.base import UNKNOWN_DATE, DeprecationEntry, fetch_page
+from scraper.dates import parse_date_safe, strip_region_suffix
+from scraper.memo import parse_memo
+from scraper.parsing import TABLES_ONLY, make_soup
+from scraper.tables import TableGrid, collapse_whitespace, extract_grid
 
 URL = "https://docs.aws.amazon.com/bedrock/latest/userguide/model-lifecycle.html"
 
-DATE_WITH_PARENS_RE = re.compile(r"^(.*?)(?:\s*\(.*\))?\s*$")
-
-
-def _strip_region_info(text: str) -> str:
-    """Extract the date portion, removing region info in parentheses."""
-    match = DATE_WITH_PARENS_RE.match(text)
-    if match:
-        return match.group(1).strip()
-    return text.strip()
-
-
-def _parse_date_safe(text: str) -> datetime.date:
-    text = _strip_region_info(text)
-    if not text or text == "-" or text == "—" or text.upper() == "N/A":
-        return UNKNOWN_DATE
-    try:
-        return parse_date(text, fuzzy=True).date()
-    except (ValueError, OverflowError):
-        return UNKNOWN_DATE
+DATE_QUIRKS = (strip_region_suffix,)
 
 
 def _detect_table_type(headers: list[str]) -> str:
@@ -59,40 +41,8 @@ def _find_column_indices(headers: list[str]) -> dict[str, int]:
     return indices
 
 
-def _build_row_cells(row, num_columns: int, rowspan_tracker: dict[int, tuple[str, int]]) -> list[str]:
-    """Build a full-width cell list, accounting for active rowspans from previous rows."""
-    raw_cells = row.find_all(["td", "th"])
-    result: list[str] = []
-    raw_idx = 0
-
-    for col in range(num_columns):
-        if col in rowspan_tracker:
-            text, remaining = rowspan_tracker[col]
-            result.append(text)
-            if remaining <= 1:
-                del rowspan_tracker[col]
-            else:
-                rowspan_tracker[col] = (text, remaining - 1)
-        elif raw_idx < len(raw_cells):
-            cell = raw_cells[raw_idx]
-            text = " ".join(cell.get_text().split())
-            result.append(text)
-            span = int(cell.get("rowspan", 1))
-            if span > 1:
-                rowspan_tracker[col] = (text, span - 1)
-            raw_idx += 1
-        else:
-            result.append("")
-
-    return result
-
-
-def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
-    rows = table.find_all("tr")
-    if not rows:
-        return []
-
-    headers = [th.get_text().strip() for th in rows[0].find_all(["th", "td"])]
+def _parse_table(grid: TableGrid) -> list[DeprecationEntry]:
+    headers = grid.headers
     if not headers:
         return []
 
@@ -104,24 +54,20 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
     if "model" not in indices:
         return []
 
-    num_columns = len(headers)
     raw_entries: list[DeprecationEntry] = []
-    rowspan_tracker: dict[int, tuple[str, int]] = {}
-
-    for row in rows[1:]:
-        cell_texts = _build_row_cells(row, num_columns, rowspan_tracker)
 
+    for cell_texts in grid.rows():
         model_name = cell_texts[indices["model"]] if indices["model"] < len(cell_texts) else ""
         if not model_name:
             continue
 
         deprecated_date = UNKNOWN_DATE
         if "legacy" in indices and indices["legacy"] < len(cell_texts):
-            deprecated_date = _parse_date_safe(cell_texts[indices["legacy"]])
+            deprecated_date = parse_date_safe(cell_texts[indices["legacy"]], DATE_QUIRKS)
 
         shutdown_date = UNKNOWN_DATE
         if "eol" in indices and indices["eol"] < len(cell_texts):
-            shutdown_date = _parse_date_safe(cell_texts[indices["eol"]])
+            shutdown_date = parse_date_safe(cell_texts[indices["eol"]], DATE_QUIRKS)
 
         replacement_parts = []
         if "replacement_name" in indices and indices["replacement_name"] < len(cell_texts):
@@ -166,14 +112,17 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
     return list(best.values())
 
 
-def scrape(html: str = "") -> list[DeprecationEntry]:
-    if not html:
-        html = fetch_page(URL)
-
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_page(html: str) -> list[DeprecationEntry]:
+    soup = make_soup(html, only=TABLES_ONLY)
     entries: list[DeprecationEntry] = []
 
     for table in soup.find_all("table"):
-        entries.extend(_parse_table(table))
+        entries.extend(_parse_table(extract_grid(table, collapse_whitespace)))
 
     return entries
+
+
+def scrape(html: str = "") -> list[DeprecationEntry]:
+    if html:
+        return _parse_page(html)
+    return parse_memo.parse("Bedrock", fetch_page(URL), _parse_page)
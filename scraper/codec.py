@@ -0,0 +1,87 @@
+"""Bulk JSON and NDJSON encoding for lists of DeprecationEntry."""
+
+import datetime
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+import orjson
+
+from scraper.base import UNKNOWN_DATE, DeprecationEntry
+
+CHUNK_SIZE = 1024
+
+
+def _parse_date(value) -> datetime.date:
+    if isinstance(value, str) and value:
+        return datetime.date.fromisoformat(value)
+    return UNKNOWN_DATE
+
+
+def entry_from_record(record: dict) -> DeprecationEntry:
+    """Build an entry from a decoded ``to_dict()``-shaped record."""
+    return DeprecationEntry(
+        provider=record["provider"],
+        model_name=record["model_name"],
+        model_id=record.get("model_id", ""),
+        deprecated_date=_parse_date(record.get("deprecated_date")),
+        shutdown_date=_parse_date(record.get("shutdown_date")),
+        replacement=record.get("replacement", ""),
+        status=record.get("status", "active"),
+        resolved_replacement=record.get("resolved_replacement", ""),
+    )
+
+
+def iter_encode(entries: list[DeprecationEntry], indent: bool = False) -> Iterator[bytes]:
+    """Yield a JSON array of ``entries`` in pieces, CHUNK_SIZE entries at a time.
+
+    Only one chunk of ``to_dict()`` results exists at any moment. Each chunk
+    is encoded as its own array and stripped of its brackets; with
+    OPT_INDENT_2 the items of a top-level array are indented the same either
+    way, so the joined pieces are byte-identical to a single ``orjson.dumps``.
+    """
+    if not entries:
+        yield b"[]"
+        return
+    option, trim, sep = (orjson.OPT_INDENT_2, 2, b",\n") if indent else (0, 1, b",")
+    yield b"[\n" if indent else b"["
+    for start in range(0, len(entries), CHUNK_SIZE):
+        chunk = orjson.dumps([e.to_dict() for e in entries[start : start + CHUNK_SIZE]], option=option)
+        if start:
+            yield sep
+        yield chunk[trim:-trim]
+    yield b"\n]" if indent else b"]"
+
+
+def encode(entries: list[DeprecationEntry], indent: bool = False) -> bytes:
+    return b"".join(iter_encode(entries, indent))
+
+
+def decode(data: bytes | str) -> list[DeprecationEntry]:
+    return [entry_from_record(record) for record in orjson.loads(data)]
+
+
+def dump(entries: list[DeprecationEntry], path: Path) -> None:
+    """Write ``entries`` as indented JSON, the layout of data/deprecations.json."""
+    with open(path, "wb") as f:
+        for piece in iter_encode(entries, indent=True):
+            f.write(piece)
+
+
+def load(path: Path) -> list[DeprecationEntry]:
+    return decode(Path(path).read_bytes())
+
+
+def write_ndjson(entries: Iterable[DeprecationEntry], fp: IO[bytes]) -> int:
+    """Write one JSON object per line to a binary file; returns the entry count."""
+    count = 0
+    for entry in entries:
+        fp.write(orjson.dumps(entry.to_dict(), option=orjson.OPT_APPEND_NEWLINE))
+        count += 1
+    return count
+
+
+def iter_ndjson(fp: IO[bytes]) -> Iterator[DeprecationEntry]:
+    """Yield entries from an NDJSON file one line at a time, skipping blank lines."""
+    for line in fp:
+        if line.strip():
+            yield entry_from_record(orjson.loads(line))
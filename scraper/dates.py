@@ -0,0 +1,108 @@
+import datetime
+import functools
+import re
+from typing import Callable
+
+from dateutil.parser import parse as parse_date
+
+from scraper.base import UNKNOWN_DATE
+
+DateQuirk = Callable[[str], str]
+
+NULL_TOKENS = {"", "-", "—", "N/A"}
+
+NON_BREAKING_HYPHEN = "\u2011"
+
+MONTHS = {
+    "jan": 1, "january": 1,
+    "feb": 2, "february": 2,
+    "mar": 3, "march": 3,
+    "apr": 4, "april": 4,
+    "may": 5,
+    "jun": 6, "june": 6,
+    "jul": 7, "july": 7,
+    "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9,
+    "oct": 10, "october": 10,
+    "nov": 11, "november": 11,
+    "dec": 12, "december": 12,
+}  # fmt: skip
+
+ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+MONTH_DAY_YEAR_RE = re.compile(r"([A-Za-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})")
+DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)\.?,?\s+(\d{4})")
+
+DATE_WITH_PARENS_RE = re.compile(r"^(.*?)(?:\s*\(.*\))?\s*$")
+NOT_SOONER_THAN_RE = re.compile(r"not\s+sooner\s+than\s+(.+)", re.IGNORECASE)
+
+
+def normalize_hyphens(text: str) -> str:
+    return text.replace(NON_BREAKING_HYPHEN, "-")
+
+
+def strip_region_suffix(text: str) -> str:
+    """Drop a trailing parenthesised region list, e.g. ``Mar 1, 2026 (us-east-1)``."""
+    match = DATE_WITH_PARENS_RE.match(text)
+    if match:
+        return match.group(1).strip()
+    return text.strip()
+
+
+def strip_not_sooner_than(text: str) -> str:
+    match = NOT_SOONER_THAN_RE.search(text)
+    if match:
+        return match.group(1).strip()
+    return text
+
+
+def strip_trailing_period(text: str) -> str:
+    return text.strip().rstrip(".")
+
+
+def _fast_parse(text: str) -> datetime.date | None:
+    match = ISO_DATE_RE.fullmatch(text)
+    if match:
+        year, month, day = match.groups()
+    else:
+        match = MONTH_DAY_YEAR_RE.fullmatch(text)
+        if match:
+            month_name, day, year = match.groups()
+        else:
+            match = DAY_MONTH_YEAR_RE.fullmatch(text)
+            if not match:
+                return None
+            day, month_name, year = match.groups()
+        month = MONTHS.get(month_name.lower())
+        if month is None:
+            return None
+    try:
+        return datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_normalized(text: str) -> datetime.date:
+    parsed = _fast_parse(text)
+    if parsed is not None:
+        return parsed
+    try:
+        return parse_date(text, fuzzy=True).date()
+    except (ValueError, OverflowError):
+        return UNKNOWN_DATE
+
+
+def parse_date_safe(text: str, quirks: tuple[DateQuirk, ...] = ()) -> datetime.date:
+    """Parse a provider date cell, returning UNKNOWN_DATE when there is no date.
+
+    ``quirks`` are applied in order to clean provider-specific noise before
+    parsing. Common layouts (ISO dates, "Month D, YYYY", "D Month YYYY") are
+    matched by regex; anything else falls back to fuzzy dateutil parsing.
+    Results are memoized since the same date strings repeat across rows.
+    """
+    for quirk in quirks:
+        text = quirk(text)
+    text = text.strip()
+    if text.upper() in NULL_TOKENS:
+        return UNKNOWN_DATE
+    return _parse_normalized(text)
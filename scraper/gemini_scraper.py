@@ -1,29 +1,16 @@
 import datetime
 
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-
 from scraper.base import UNKNOWN_DATE, DeprecationEntry, fetch_page
+from scraper.dates import parse_date_safe
+from scraper.memo import parse_memo
+from scraper.parsing import TABLES_ONLY, make_soup
+from scraper.tables import TableGrid, extract_grid
 
 URL = "https://ai.google.dev/gemini-api/docs/deprecations"
 
 
-def _parse_date_safe(text: str) -> datetime.date:
-    text = text.strip()
-    if not text or text == "-" or text == "—" or text.upper() == "N/A":
-        return UNKNOWN_DATE
-    try:
-        return parse_date(text, fuzzy=True).date()
-    except (ValueError, OverflowError):
-        return UNKNOWN_DATE
-
-
-def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
-    rows = table.find_all("tr")
-    if not rows:
-        return []
-
-    headers = [th.get_text().strip().lower() for th in rows[0].find_all(["th", "td"])]
+def _parse_table(grid: TableGrid) -> list[DeprecationEntry]:
+    headers = [h.lower() for h in grid.headers]
     if not headers:
         return []
 
@@ -47,9 +34,7 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
 
     entries: list[DeprecationEntry] = []
 
-    for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        cell_texts = [c.get_text().strip() for c in cells]
+    for cell_texts in grid.rows():
         if len(cell_texts) <= model_idx:
             continue
 
@@ -63,7 +48,7 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
 
         shutdown_date = UNKNOWN_DATE
         if shutdown_idx >= 0 and shutdown_idx < len(cell_texts):
-            shutdown_date = _parse_date_safe(cell_texts[shutdown_idx])
+            shutdown_date = parse_date_safe(cell_texts[shutdown_idx])
 
         replacement = ""
         if replacement_idx >= 0 and replacement_idx < len(cell_texts):
@@ -89,14 +74,17 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
     return entries
 
 
-def scrape(html: str = "") -> list[DeprecationEntry]:
-    if not html:
-        html = fetch_page(URL)
-
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_page(html: str) -> list[DeprecationEntry]:
+    soup = make_soup(html, only=TABLES_ONLY)
     entries: list[DeprecationEntry] = []
 
     for table in soup.find_all("table"):
-        entries.extend(_parse_table(table))
+        entries.extend(_parse_table(extract_grid(table)))
 
     return entries
+
+
+def scrape(html: str = "") -> list[DeprecationEntry]:
+    if html:
+        return _parse_page(html)
+    return parse_memo.parse("Gemini", fetch_page(URL), _parse_page)
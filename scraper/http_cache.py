@@ -0,0 +1,97 @@
+import dataclasses
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import orjson
+import requests
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+
+
+class HttpCache:
+    """On-disk conditional-GET cache keyed by URL.
+
+    Each cached response stores its body with the ETag and Last-Modified
+    validators. Later requests for the same URL send If-None-Match and
+    If-Modified-Since, and a 304 answer is served from disk. Entries older
+    than ``max_age`` seconds are discarded so a misbehaving server cannot
+    keep a stale body alive forever.
+    """
+
+    def __init__(self, directory: Path, max_age: float = DEFAULT_MAX_AGE):
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def _load(self, url: str) -> dict | None:
+        path = self._path(url)
+        try:
+            record = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if record.get("url") != url:
+            return None
+        if time.time() - record.get("stored_at", 0) > self.max_age:
+            path.unlink(missing_ok=True)
+            return None
+        return record
+
+    def _store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        if not etag and not last_modified:
+            return
+        record = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "body": response.text,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(record))
+        os.replace(tmp_path, path)
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+    def get(self, session: requests.Session, url: str, timeout: float = 30) -> str:
+        record = self._load(url)
+        headers = {}
+        if record is not None:
+            if record["etag"]:
+                headers["If-None-Match"] = record["etag"]
+            if record["last_modified"]:
+                headers["If-Modified-Since"] = record["last_modified"]
+            self._count("revalidations")
+
+        response = session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and record is not None:
+            self._count("hits")
+            log.debug("HTTP cache hit for %s", url)
+            return record["body"]
+
+        response.raise_for_status()
+        self._count("misses")
+        self._store(url, response)
+        return response.text
@@ -0,0 +1,123 @@
+import dataclasses
+import datetime
+import functools
+import hashlib
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable
+
+import bs4
+import orjson
+
+from scraper.base import CACHE_DIR, DeprecationEntry
+from scraper.codec import entry_from_record
+
+log = logging.getLogger(__name__)
+
+SCRAPER_DIR = Path(__file__).resolve().parent
+
+
+@dataclasses.dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+
+
+def normalize_html(html: str) -> str:
+    return html.replace("\r\n", "\n").strip()
+
+
+@functools.cache
+def parser_code_hash() -> str:
+    """Hash of every scraper module plus the BeautifulSoup version.
+
+    Any edit to the parsing code, shared helpers included, changes this
+    hash and so invalidates every memoized parse.
+    """
+    digest = hashlib.sha256(bs4.__version__.encode())
+    for path in sorted(SCRAPER_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _valid_until(entries: list[DeprecationEntry], today: datetime.date) -> str:
+    """First date on which a date-relative status in ``entries`` could flip.
+
+    Several scrapers mark an entry retired once ``shutdown_date <= today``,
+    so a memoized parse is only reusable until the next upcoming shutdown.
+    """
+    upcoming = [e.shutdown_date for e in entries if e.has_shutdown_date() and e.shutdown_date > today]
+    return min(upcoming).isoformat() if upcoming else ""
+
+
+class ParseMemo:
+    """Skip parsing when a provider's page is byte-for-byte unchanged.
+
+    Stores the hash of the normalized HTML with the parsed entries per
+    provider. A later call with the same hash, the same parser code and no
+    shutdown date crossed since returns the stored entries without building
+    a soup.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.stats = MemoStats()
+        self._lock = threading.Lock()
+
+    def _path(self, provider: str) -> Path:
+        return self.directory / f"{re.sub(r'[^a-z0-9]+', '-', provider.lower())}.json"
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+
+    def parse(
+        self,
+        provider: str,
+        html: str,
+        parse_fn: Callable[[str], list[DeprecationEntry]],
+        today: datetime.date = None,
+    ) -> list[DeprecationEntry]:
+        if today is None:
+            today = datetime.date.today()
+        html_hash = hashlib.sha256(normalize_html(html).encode()).hexdigest()
+        code_hash = parser_code_hash()
+        path = self._path(provider)
+
+        try:
+            record = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            record = None
+
+        if (
+            record is not None
+            and record["html_hash"] == html_hash
+            and record["code_hash"] == code_hash
+            and record["parsed_on"] <= today.isoformat()
+            and (not record["valid_until"] or today.isoformat() < record["valid_until"])
+        ):
+            self._count("hits")
+            log.debug("Parse memo hit for %s", provider)
+            return [entry_from_record(d) for d in record["entries"]]
+
+        self._count("misses")
+        entries = parse_fn(html)
+        record = {
+            "html_hash": html_hash,
+            "code_hash": code_hash,
+            "parsed_on": today.isoformat(),
+            "valid_until": _valid_until(entries, today),
+            "entries": [e.to_dict() for e in entries],
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(record))
+        os.replace(tmp_path, path)
+        return entries
+
+
+parse_memo = ParseMemo(CACHE_DIR / "parsed")
@@ -1,46 +1,28 @@
-import datetime
 import re
 
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
-
-from scraper.base import UNKNOWN_DATE, DeprecationEntry, fetch_page
+from scraper.base import DeprecationEntry, fetch_page
+from scraper.dates import normalize_hyphens, parse_date_safe
+from scraper.memo import parse_memo
+from scraper.parsing import TABLES_ONLY, make_soup
+from scraper.tables import TableGrid, extract_grid
 
 URL = "https://developers.openai.com/api/docs/deprecations/"
 
-NON_BREAKING_HYPHEN = "\u2011"
+DATE_QUIRKS = (normalize_hyphens,)
 
 
 def _normalize_text(text: str) -> str:
-    return text.replace(NON_BREAKING_HYPHEN, "-").strip()
-
-
-def _parse_date_safe(text: str) -> datetime.date:
-    text = _normalize_text(text)
-    if not text or text == "-":
-        return UNKNOWN_DATE
-    try:
-        return parse_date(text, fuzzy=True).date()
-    except (ValueError, OverflowError):
-        return UNKNOWN_DATE
+    return normalize_hyphens(text).strip()
 
 
-def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
-    rows = table.find_all("tr")
-    if not rows:
-        return []
-
-    headers = [_normalize_text(th.get_text()) for th in rows[0].find_all(["th", "td"])]
-    num_cols = len(headers)
+def _parse_table(grid: TableGrid) -> list[DeprecationEntry]:
+    num_cols = len(grid.headers)
     entries = []
 
-    for row in rows[1:]:
-        cells = row.find_all(["td", "th"])
-        if len(cells) < num_cols:
+    for cell_texts in grid.rows():
+        if len(cell_texts) < num_cols:
             continue
 
-        cell_texts = [_normalize_text(cell.get_text()) for cell in cells]
-
         if num_cols == 3:
             shutdown_text, model_name, replacement = cell_texts[0], cell_texts[1], cell_texts[2]
         elif num_cols >= 4:
@@ -56,7 +38,7 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
             DeprecationEntry(
                 provider="OpenAI",
                 model_name=model_name,
-                shutdown_date=_parse_date_safe(shutdown_text),
+                shutdown_date=parse_date_safe(shutdown_text, DATE_QUIRKS),
                 replacement=replacement,
                 status="deprecated",
             )
@@ -65,14 +47,17 @@ def _parse_table(table: BeautifulSoup) -> list[DeprecationEntry]:
     return entries
 
 
-def scrape(html: str = "") -> list[DeprecationEntry]:
-    if not html:
-        html = fetch_page(URL)
-
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_page(html: str) -> list[DeprecationEntry]:
+    soup = make_soup(html, only=TABLES_ONLY)
     entries: list[DeprecationEntry] = []
 
     for table in soup.find_all("table"):
-        entries.extend(_parse_table(table))
+        entries.extend(_parse_table(extract_grid(table, _normalize_text)))
 
     return entries
+
+
+def scrape(html: str = "") -> list[DeprecationEntry]:
+    if html:
+        return _parse_page(html)
+    return parse_memo.parse("OpenAI", fetch_page(URL), _parse_page)
@@ -0,0 +1,36 @@
+import os
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+# Fastest first. lxml is a C-backed tree builder and an optional dependency
+# (``pip install .[fast]``); html.parser ships with Python and always works.
+PARSER_BACKENDS = ("lxml", "html.parser")
+
+TABLES_ONLY = ("table",)
+
+
+def available_backends() -> list[str]:
+    return [name for name in PARSER_BACKENDS if builder_registry.lookup(name) is not None]
+
+
+def _default_backend() -> str:
+    configured = os.environ.get("HTML_PARSER", "")
+    if configured:
+        if configured not in available_backends():
+            raise ValueError(f"HTML_PARSER={configured!r} is not an available parser backend")
+        return configured
+    return available_backends()[0]
+
+
+BACKEND = _default_backend()
+
+
+def make_soup(html: str, backend: str = "", only: tuple[str, ...] = ()) -> BeautifulSoup:
+    """Parse ``html``, keeping only elements named in ``only`` (and their contents) if given.
+
+    Filtering happens while the tree is built, so skipped navigation,
+    scripts and footers never become nodes.
+    """
+    parse_only = SoupStrainer(list(only)) if only else None
+    return BeautifulSoup(html, backend or BACKEND, parse_only=parse_only)
@@ -0,0 +1,100 @@
+import collections
+import concurrent.futures
+import dataclasses
+import logging
+import threading
+import time
+from typing import Callable
+
+from scraper import ALL_SCRAPERS
+from scraper.base import DeprecationEntry
+
+log = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = len(ALL_SCRAPERS)
+DEFAULT_TIMEOUT = 120.0
+
+
+@dataclasses.dataclass
+class ScrapeResult:
+    name: str
+    entries: list[DeprecationEntry]
+    elapsed: float
+    timed_out: bool = False
+
+
+def scrape_all(
+    scrapers: list[tuple[str, Callable[[], list[DeprecationEntry]]]] = ALL_SCRAPERS,
+    max_workers: int = DEFAULT_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[ScrapeResult]:
+    """Run every scraper on worker threads and return results in ``scrapers`` order.
+
+    ``timeout`` is a per-provider limit measured from when that provider's
+    scrape actually starts, so providers queued behind a small pool are not
+    penalised for waiting. A provider that exceeds it is logged and returned
+    with ``timed_out`` set and no entries, and the other providers carry on.
+    Workers are daemon threads, so an abandoned scrape never keeps the
+    process alive; a fresh worker takes its place. A failing provider
+    aborts the run, the same as it did when scrapers ran one after another.
+    """
+    queue = collections.deque(enumerate(scrapers))
+    futures = [concurrent.futures.Future() for _ in scrapers]
+    started: dict[int, float] = {}
+    abandoned: set[int] = set()
+
+    def work() -> None:
+        while True:
+            try:
+                idx, (name, scrape_fn) = queue.popleft()
+            except IndexError:
+                return
+            started[idx] = time.monotonic()
+            try:
+                entries = scrape_fn()
+            except BaseException as exc:
+                futures[idx].set_exception(exc)
+            else:
+                futures[idx].set_result(ScrapeResult(name, entries, time.monotonic() - started[idx]))
+            if idx in abandoned:
+                # A replacement worker was started when this scrape timed out.
+                return
+
+    def start_worker() -> None:
+        threading.Thread(target=work, name="scrape", daemon=True).start()
+
+    for _ in range(min(max(1, max_workers), len(scrapers))):
+        start_worker()
+
+    index_of = {future: i for i, future in enumerate(futures)}
+    pending = set(futures)
+    try:
+        while pending:
+            now = time.monotonic()
+            deadlines = [started[index_of[f]] + timeout for f in pending if index_of[f] in started]
+            wait_for = min([timeout, *(d - now for d in deadlines)])
+            done, pending = concurrent.futures.wait(
+                pending, timeout=max(wait_for, 0), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                future.result()
+
+            now = time.monotonic()
+            for future in list(pending):
+                idx = index_of[future]
+                if idx in started and now - started[idx] >= timeout:
+                    log.warning("%s scrape exceeded %gs time limit; abandoning it", scrapers[idx][0], timeout)
+                    pending.discard(future)
+                    abandoned.add(idx)
+                    start_worker()
+    finally:
+        queue.clear()
+
+    results = [
+        ScrapeResult(scrapers[i][0], [], timeout, timed_out=True) if i in abandoned else future.result()
+        for i, future in enumerate(futures)
+    ]
+    for result in results:
+        if not result.timed_out:
+            log.info("Scraped %s: %d entries in %.2fs", result.name, len(result.entries), result.elapsed)
+    return results
@@ -0,0 +1,95 @@
+import dataclasses
+from typing import Callable, Iterator
+
+from bs4 import Tag
+
+CELL_TAGS = ("td", "th")
+
+
+@dataclasses.dataclass
+class TableGrid:
+    """A table flattened to plain strings with rowspan and colspan expanded.
+
+    ``headers`` is the first row. ``columns[c][r]`` is the text of body row
+    ``r`` in column ``c``. ``widths[r]`` is how many leading columns body
+    row ``r`` actually covers, so ``rows()`` yields ragged rows just like
+    reading the ``<td>`` elements directly would.
+    """
+
+    headers: list[str]
+    columns: list[list[str]]
+    widths: list[int]
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def rows(self) -> Iterator[list[str]]:
+        for r, width in enumerate(self.widths):
+            yield [self.columns[c][r] for c in range(width)]
+
+
+def collapse_whitespace(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _span(cell: Tag, attr: str) -> int:
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def extract_grid(table: Tag, normalize: Callable[[str], str] = str.strip) -> TableGrid:
+    """Read every row of ``table`` once, normalizing each cell's text with ``normalize``.
+
+    Cells are taken from each ``<tr>``'s direct children rather than a
+    recursive search, which is much cheaper and keeps the cells of a table
+    nested inside a cell out of the outer row.
+    """
+    grid_rows: list[list[str]] = []
+    pending: dict[int, tuple[str, int]] = {}
+
+    for tr in table.find_all("tr"):
+        row: list[str] = []
+
+        def fill(col: int, text: str) -> None:
+            if col >= len(row):
+                row.extend([""] * (col + 1 - len(row)))
+            row[col] = text
+
+        col = 0
+        for cell in tr.children:
+            if cell.name not in CELL_TAGS:
+                continue
+            while col in pending:
+                fill(col, pending[col][0])
+                col += 1
+            text = normalize(cell.get_text())
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                fill(col, text)
+                if rowspan > 1:
+                    pending[col] = (text, rowspan)
+                col += 1
+
+        for pending_col in sorted(pending):
+            if pending_col >= col:
+                fill(pending_col, pending[pending_col][0])
+
+        # Spans started on this row were stored with their full height, so
+        # every pending column loses one row here.
+        for pending_col, (text, remaining) in list(pending.items()):
+            if remaining <= 1:
+                del pending[pending_col]
+            else:
+                pending[pending_col] = (text, remaining - 1)
+
+        grid_rows.append(row)
+
+    if not grid_rows:
+        return TableGrid(headers=[], columns=[], widths=[])
+
+    headers, body = grid_rows[0], grid_rows[1:]
+    num_columns = max((len(row) for row in body), default=0)
+    columns = [[row[c] if c < len(row) else "" for row in body] for c in range(num_columns)]
+    return TableGrid(headers=headers, columns=columns, widths=[len(row) for row in body])
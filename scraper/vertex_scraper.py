@@ -1,27 +1,28 @@
+import dataclasses
 import datetime
 import re
 
-from bs4 import BeautifulSoup
-from dateutil.parser import parse as parse_date
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
 
 from scraper.base import UNKNOWN_DATE, DeprecationEntry, fetch_page
+from scraper.dates import parse_date_safe, strip_trailing_period
+from scraper.memo import parse_memo
+from scraper.parsing import TABLES_ONLY, make_soup
+from scraper.tables import extract_grid
 
 URL = "https://docs.cloud.google.com/vertex-ai/generative-ai/docs/deprecations/partner-models"
 
+DATE_QUIRKS = (strip_trailing_period,)
+
 DEPRECATED_AS_OF_RE = re.compile(r"deprecated\s+as\s+of\s+(.+?)(?:\.|,|$)", re.IGNORECASE)
 SHUTDOWN_ON_RE = re.compile(r"shut\s*down\s+(?:on|date[:\s]+)\s*(.+?)(?:\.|,|$)", re.IGNORECASE)
 DISCONTINUE_RE = re.compile(r"discontinue[ds]?\s+(?:on|as\s+of)\s+(.+?)(?:\.|,|$)", re.IGNORECASE)
 MODEL_ID_RE = re.compile(r"`([^`]+)`")
+TABLE_TAG_RE = re.compile(r"<table\b", re.IGNORECASE)
 
-
-def _parse_date_safe(text: str) -> datetime.date:
-    text = text.strip().rstrip(".")
-    if not text:
-        return UNKNOWN_DATE
-    try:
-        return parse_date(text, fuzzy=True).date()
-    except (ValueError, OverflowError):
-        return UNKNOWN_DATE
+HEADING_TAGS = {"h2", "h3", "h4"}
+SECTION_BREAKS = {"h1", "h2", "h3", "h4"}
+DEFAULT_STRING_TYPES = {NavigableString, CData}
 
 
 def _extract_dates_from_text(text: str) -> tuple[datetime.date, datetime.date]:
@@ -30,40 +31,82 @@ def _extract_dates_from_text(text: str) -> tuple[datetime.date, datetime.date]:
 
     match = DEPRECATED_AS_OF_RE.search(text)
     if match:
-        deprecated_date = _parse_date_safe(match.group(1))
+        deprecated_date = parse_date_safe(match.group(1), DATE_QUIRKS)
 
     match = SHUTDOWN_ON_RE.search(text)
     if match:
-        shutdown_date = _parse_date_safe(match.group(1))
+        shutdown_date = parse_date_safe(match.group(1), DATE_QUIRKS)
 
     if shutdown_date == UNKNOWN_DATE:
         match = DISCONTINUE_RE.search(text)
         if match:
-            shutdown_date = _parse_date_safe(match.group(1))
+            shutdown_date = parse_date_safe(match.group(1), DATE_QUIRKS)
 
     return deprecated_date, shutdown_date
 
 
-def _collect_text_after_heading(heading) -> str:
-    """Collect text from sibling elements until the next heading of same or higher level."""
-    parts = []
-    tag_name = heading.name
-    for sibling in heading.next_siblings:
-        if sibling.name in ("h1", "h2", "h3", "h4"):
-            break
-        text = sibling.get_text() if sibling.name else str(sibling)
-        parts.append(text)
-    return " ".join(parts)
+@dataclasses.dataclass
+class _Section:
+    heading: Tag
+    heading_text: str = ""
+    parts: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.parts)
+
+
+def _segment_sections(soup: BeautifulSoup) -> list[_Section]:
+    """Split the document into heading sections in a single walk of the tree.
+
+    A section is the text of a heading's following siblings up to the next
+    h1-h4 sibling. Each node's text is computed once, bottom-up, and shared
+    by every section that contains it, instead of calling get_text() on
+    each sibling of every heading.
+    """
+    sections: list[_Section] = []
+
+    def walk(node: Tag) -> str:
+        text_parts: list[str] = []
+        current: _Section | None = None
+        for child in node.children:
+            if not isinstance(child, Tag):
+                if current is not None:
+                    current.parts.append(str(child))
+                if type(child) in DEFAULT_STRING_TYPES:
+                    text_parts.append(str(child))
+                continue
+
+            if child.name in SECTION_BREAKS:
+                current = _Section(child) if child.name in HEADING_TAGS else None
+                if current is not None:
+                    sections.append(current)
+                child_text = walk(child)
+                if current is not None:
+                    current.heading_text = child_text.strip()
+            else:
+                child_text = walk(child)
+                if current is not None:
+                    if child.interesting_string_types == DEFAULT_STRING_TYPES:
+                        current.parts.append(child_text)
+                    else:
+                        # e.g. <script>: get_text() on the sibling itself reads
+                        # strings that its parent's text skips.
+                        current.parts.append(child.get_text())
+            text_parts.append(child_text)
+        return "".join(text_parts)
+
+    walk(soup)
+    return sections
 
 
 def _parse_headings(soup: BeautifulSoup) -> list[DeprecationEntry]:
     entries: list[DeprecationEntry] = []
 
-    for heading in soup.find_all(["h2", "h3", "h4"]):
-        heading_text = heading.get_text().strip()
-        section_text = _collect_text_after_heading(heading)
-
-        deprecated_date, shutdown_date = _extract_dates_from_text(section_text)
+    for section in _segment_sections(soup):
+        heading = section.heading
+        heading_text = section.heading_text
+        deprecated_date, shutdown_date = _extract_dates_from_text(section.text)
 
         if deprecated_date == UNKNOWN_DATE and shutdown_date == UNKNOWN_DATE:
             continue
@@ -95,11 +138,8 @@ def _parse_tables(soup: BeautifulSoup) -> list[DeprecationEntry]:
     entries: list[DeprecationEntry] = []
 
     for table in soup.find_all("table"):
-        rows = table.find_all("tr")
-        if not rows:
-            continue
-
-        headers = [th.get_text().strip().lower() for th in rows[0].find_all(["th", "td"])]
+        grid = extract_grid(table)
+        headers = [h.lower() for h in grid.headers]
 
         model_idx = -1
         deprecation_idx = -1
@@ -116,23 +156,21 @@ def _parse_tables(soup: BeautifulSoup) -> list[DeprecationEntry]:
         if model_idx == -1 or (deprecation_idx == -1 and shutdown_idx == -1):
             continue
 
-        for row in rows[1:]:
-            cells = row.find_all(["td", "th"])
-            if len(cells) <= model_idx:
+        for cell_texts in grid.rows():
+            if len(cell_texts) <= model_idx:
                 continue
 
-            cell_texts = [c.get_text().strip() for c in cells]
             model_name = cell_texts[model_idx]
             if not model_name:
                 continue
 
             deprecated_date = UNKNOWN_DATE
             if deprecation_idx >= 0 and deprecation_idx < len(cell_texts):
-                deprecated_date = _parse_date_safe(cell_texts[deprecation_idx])
+                deprecated_date = parse_date_safe(cell_texts[deprecation_idx], DATE_QUIRKS)
 
             shutdown_date = UNKNOWN_DATE
             if shutdown_idx >= 0 and shutdown_idx < len(cell_texts):
-                shutdown_date = _parse_date_safe(cell_texts[shutdown_idx])
+                shutdown_date = parse_date_safe(cell_texts[shutdown_idx], DATE_QUIRKS)
 
             status = "deprecated"
             if shutdown_date != UNKNOWN_DATE and shutdown_date <= datetime.date.today():
@@ -151,15 +189,14 @@ def _parse_tables(soup: BeautifulSoup) -> list[DeprecationEntry]:
     return entries
 
 
-def scrape(html: str = "") -> list[DeprecationEntry]:
-    if not html:
-        html = fetch_page(URL)
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    entries = _parse_tables(soup)
+def _parse_page(html: str) -> list[DeprecationEntry]:
+    # Checking for a table first means the heading layout, which the live
+    # page uses, is parsed only once.
+    entries = _parse_tables(make_soup(html, only=TABLES_ONLY)) if TABLE_TAG_RE.search(html) else []
     if not entries:
-        entries = _parse_headings(soup)
+        # The heading fallback reads the paragraphs between headings, so it
+        # needs the full document tree.
+        entries = _parse_headings(make_soup(html))
 
     seen: set[str] = set()
     deduplicated: list[DeprecationEntry] = []
@@ -170,3 +207,9 @@ def scrape(html: str = "") -> list[DeprecationEntry]:
             deduplicated.append(entry)
 
     return deduplicated
+
+
+def scrape(html: str = "") -> list[DeprecationEntry]:
+    if html:
+        return _parse_page(html)
+    return parse_memo.parse("Vertex AI", fetch_page(URL), _parse_page)
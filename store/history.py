@@ -0,0 +1,199 @@
+import dataclasses
+import datetime
+import logging
+from pathlib import Path
+
+import orjson
+
+from generators.output import write_atomic
+from scraper.base import DeprecationEntry
+
+log = logging.getLogger(__name__)
+
+LOG_NAME = "changes.ndjson"
+INDEX_NAME = "index.json"
+SNAPSHOT_NAME = "snapshot.json"
+
+SNAPSHOT_INTERVAL = 30
+
+KEY_SEP = "\x1f"
+# Computed from other entries rather than scraped, so not part of an entry's own history.
+DERIVED_FIELDS = ("resolved_replacement",)
+
+
+@dataclasses.dataclass
+class Change:
+    at: str
+    op: str
+    key: str
+    provider: str
+    model_name: str
+    before: dict | None = None
+    after: dict | None = None
+    fields: list[str] = dataclasses.field(default_factory=list)
+
+
+def model_key(provider: str, model_name: str) -> str:
+    return f"{provider}{KEY_SEP}{model_name}"
+
+
+def _entry_keys(entries: list[DeprecationEntry]) -> dict[str, dict]:
+    """Key every entry by provider, model name and model ID.
+
+    Some pages list the same model twice (e.g. OpenAI's older shutdown
+    tables), so repeats get an ordinal suffix in page order.
+    """
+    keyed: dict[str, dict] = {}
+    for entry in entries:
+        base = KEY_SEP.join((entry.provider, entry.model_name, entry.model_id))
+        key, n = base, 1
+        while key in keyed:
+            key = f"{base}{KEY_SEP}{n}"
+            n += 1
+        keyed[key] = _own_fields(entry.to_dict())
+    return keyed
+
+
+def _own_fields(record: dict) -> dict:
+    return {name: value for name, value in record.items() if name not in DERIVED_FIELDS}
+
+
+def diff(previous: dict[str, dict], current: dict[str, dict], at: str) -> list[Change]:
+    changes = []
+    for key, after in current.items():
+        before = previous.get(key)
+        if before is not None:
+            before = _own_fields(before)
+        if before is None:
+            changes.append(Change(at, "added", key, after["provider"], after["model_name"], after=after))
+        elif before != after:
+            fields = [name for name in after if before.get(name) != after[name]]
+            changes.append(
+                Change(at, "changed", key, after["provider"], after["model_name"], before, after, fields)
+            )
+    for key, before in previous.items():
+        if key not in current:
+            changes.append(Change(at, "removed", key, before["provider"], before["model_name"], before=before))
+    return changes
+
+
+class HistoryStore:
+    """Append-only log of per-entry changes between runs.
+
+    ``changes.ndjson`` gets one line per added, removed or changed entry.
+    ``index.json`` maps provider + model name to the byte offsets of that
+    model's lines, so a history query reads only those lines.
+    ``snapshot.json`` holds the full keyed state as of a log offset and is
+    rewritten every ``snapshot_interval`` runs that record changes, so
+    working out the previous state only replays the log written since.
+    A run without changes writes nothing.
+    """
+
+    def __init__(self, directory: Path, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.directory = Path(directory)
+        self.snapshot_interval = snapshot_interval
+        self.log_path = self.directory / LOG_NAME
+        self.index_path = self.directory / INDEX_NAME
+        self.snapshot_path = self.directory / SNAPSHOT_NAME
+
+    def _log_size(self) -> int:
+        try:
+            return self.log_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _iter_log(self, start: int = 0):
+        """Yield (offset, record) for each line from byte ``start`` on."""
+        if start >= self._log_size():
+            return
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield offset, orjson.loads(line)
+                offset += len(line)
+
+    def _read_json(self, path: Path, default: dict) -> dict:
+        try:
+            return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return default
+
+    def load_index(self) -> dict:
+        """Read the index, catching up on log lines it has not seen yet."""
+        index = self._read_json(self.index_path, {"log_size": 0, "runs": 0, "models": {}})
+        size = self._log_size()
+        if index["log_size"] > size:
+            log.warning("History index is ahead of %s, rebuilding it", self.log_path)
+            index = {"log_size": 0, "runs": index["runs"], "models": {}}
+        if index["log_size"] < size:
+            models = index["models"]
+            for offset, record in self._iter_log(index["log_size"]):
+                models.setdefault(model_key(record["provider"], record["model_name"]), []).append(offset)
+            index["log_size"] = size
+        return index
+
+    def state(self) -> dict[str, dict]:
+        """The keyed entries as of the last recorded run."""
+        snapshot = self._read_json(self.snapshot_path, {"log_size": 0, "entries": {}})
+        if snapshot["log_size"] > self._log_size():
+            snapshot = {"log_size": 0, "entries": {}}
+        entries = snapshot["entries"]
+        for _, record in self._iter_log(snapshot["log_size"]):
+            if record["op"] == "removed":
+                entries.pop(record["key"], None)
+            else:
+                entries[record["key"]] = record["after"]
+        return entries
+
+    def record(self, entries: list[DeprecationEntry], at: datetime.date = None) -> list[Change]:
+        """Append the changes since the last run and return them."""
+        if at is None:
+            at = datetime.date.today()
+        index = self.load_index()
+        previous = self.state()
+        current = _entry_keys(entries)
+        changes = diff(previous, current, at.isoformat())
+        if not changes:
+            return changes
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        models = index["models"]
+        offset = index["log_size"]
+        with open(self.log_path, "ab") as f:
+            for change in changes:
+                line = orjson.dumps(change, option=orjson.OPT_APPEND_NEWLINE)
+                f.write(line)
+                models.setdefault(model_key(change.provider, change.model_name), []).append(offset)
+                offset += len(line)
+        index["log_size"] = offset
+        index["runs"] += 1
+        write_atomic(self.index_path, orjson.dumps(index))
+
+        if index["runs"] % self.snapshot_interval == 0:
+            self.compact(current, offset)
+        return changes
+
+    def compact(self, entries: dict[str, dict] = None, log_size: int = None) -> None:
+        """Write a snapshot of the current state so later runs skip replaying the log."""
+        if entries is None:
+            log_size = self._log_size()
+            entries = self.state()
+        write_atomic(self.snapshot_path, orjson.dumps({"log_size": log_size, "entries": entries}))
+
+    def history(self, provider: str, model_name: str) -> list[Change]:
+        """Every recorded change for one model, oldest first."""
+        offsets = self.load_index()["models"].get(model_key(provider, model_name), [])
+        if not offsets:
+            return []
+        changes = []
+        with open(self.log_path, "rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                changes.append(Change(**orjson.loads(f.readline())))
+        return changes
+
+    def models(self, provider: str = "") -> list[tuple[str, str]]:
+        keys = (key.split(KEY_SEP, 1) for key in self.load_index()["models"])
+        return sorted((p, m) for p, m in keys if not provider or p == provider)
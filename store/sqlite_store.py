@@ -0,0 +1,149 @@
+import datetime
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from scraper.base import UNKNOWN_DATE, DeprecationEntry
+
+SCHEMA = """
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model_name TEXT NOT NULL,
+    model_id TEXT NOT NULL,
+    deprecated_date TEXT,
+    shutdown_date TEXT,
+    replacement TEXT NOT NULL,
+    status TEXT NOT NULL,
+    resolved_replacement TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX entries_provider ON entries (provider, shutdown_date);
+CREATE INDEX entries_model_name ON entries (model_name);
+CREATE INDEX entries_model_id ON entries (model_id);
+CREATE INDEX entries_shutdown_date ON entries (shutdown_date);
+"""
+
+COLUMNS = (
+    "provider",
+    "model_name",
+    "model_id",
+    "deprecated_date",
+    "shutdown_date",
+    "replacement",
+    "status",
+    "resolved_replacement",
+)
+
+
+def _to_sql_date(value: datetime.date) -> str | None:
+    # Unknown dates are NULL so range scans on shutdown_date skip them.
+    return None if value == UNKNOWN_DATE else value.isoformat()
+
+
+def _from_sql_date(value: str | None) -> datetime.date:
+    return datetime.date.fromisoformat(value) if value else UNKNOWN_DATE
+
+
+def _row_to_entry(row: tuple) -> DeprecationEntry:
+    provider, model_name, model_id, deprecated, shutdown, replacement, status, resolved = row
+    return DeprecationEntry(
+        provider=provider,
+        model_name=model_name,
+        model_id=model_id,
+        deprecated_date=_from_sql_date(deprecated),
+        shutdown_date=_from_sql_date(shutdown),
+        replacement=replacement,
+        status=status,
+        resolved_replacement=resolved,
+    )
+
+
+def write_database(path: Path, entries: list[DeprecationEntry]) -> None:
+    """Build a fresh database of ``entries`` at ``path``, replacing it atomically.
+
+    Rows keep the input order in their ``id``, which queries use as the
+    tie-breaker so results list entries the way the JSON does.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(SCHEMA)
+            conn.executemany(
+                f"INSERT INTO entries ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                (
+                    (
+                        e.provider,
+                        e.model_name,
+                        e.model_id,
+                        _to_sql_date(e.deprecated_date),
+                        _to_sql_date(e.shutdown_date),
+                        e.replacement,
+                        e.status,
+                        e.resolved_replacement,
+                    )
+                    for e in entries
+                ),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def query(
+    path: Path,
+    provider: str = "",
+    status: str = "",
+    model: str = "",
+    shutdown_from: datetime.date = None,
+    shutdown_to: datetime.date = None,
+) -> list[DeprecationEntry]:
+    """Entries matching every given filter, ordered by shutdown date.
+
+    ``model`` matches either the model name or the model ID. The shutdown
+    bounds are inclusive; giving either one excludes entries without a
+    shutdown date.
+    """
+    clauses, params = [], []
+    if provider:
+        clauses.append("provider = ?")
+        params.append(provider)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if model:
+        clauses.append("(model_name = ? OR model_id = ?)")
+        params.extend([model, model])
+    if shutdown_from is not None:
+        clauses.append("shutdown_date >= ?")
+        params.append(shutdown_from.isoformat())
+    if shutdown_to is not None:
+        clauses.append("shutdown_date <= ?")
+        params.append(shutdown_to.isoformat())
+
+    sql = f"SELECT {', '.join(COLUMNS)} FROM entries"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY shutdown_date IS NULL, shutdown_date, id"
+
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return [_row_to_entry(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def shutting_down_within(
+    path: Path, days: int, today: datetime.date = None, **filters
+) -> list[DeprecationEntry]:
+    """Entries whose shutdown date falls between ``today`` and ``days`` from now."""
+    if today is None:
+        today = datetime.date.today()
+    return query(path, shutdown_from=today, shutdown_to=today + datetime.timedelta(days=days), **filters)
@@ -0,0 +1,99 @@
+import dataclasses
+import datetime
+import http.server
+import threading
+
+import pytest
+
+from scraper.base import (
+    POOL_CONNECTIONS_PER_HOST,
+    RETRY_POLICY,
+    UNKNOWN_DATE,
+    DeprecationEntry,
+    connection_stats,
+    create_session,
+    get_session,
+)
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedSession:
+    def test_get_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_adapter_configuration(self):
+        adapter = create_session().get_adapter("https://example.com")
+        assert adapter.max_retries is RETRY_POLICY
+        assert adapter._pool_maxsize == POOL_CONNECTIONS_PER_HOST
+        assert adapter._pool_block is True
+
+    def test_negotiates_compression(self):
+        assert "gzip" in create_session().headers["Accept-Encoding"]
+
+    def test_connection_stats_record_reuse(self, server_url):
+        session = create_session()
+        for _ in range(3):
+            session.get(server_url, timeout=5).raise_for_status()
+        (stats,) = connection_stats(session).values()
+        assert stats.requests == 3
+        assert stats.connections == 1
+        assert stats.reused == 2
+
+
+class TestDeprecationEntry:
+    def _entry(self, **overrides) -> DeprecationEntry:
+        fields = dict(
+            provider="".join(["Open", "AI"]),
+            model_name="gpt-4",
+            model_id="gpt-4-0613",
+            deprecated_date=datetime.date(2025, 1, 2),
+            replacement="gpt-5",
+            status="".join(["deprec", "ated"]),
+        )
+        fields.update(overrides)
+        return DeprecationEntry(**fields)
+
+    def test_is_slotted(self):
+        assert not hasattr(self._entry(), "__dict__")
+
+    def test_interns_provider_and_status(self):
+        a, b = self._entry(), self._entry()
+        assert a.provider is b.provider
+        assert a.status is b.status
+
+    def test_to_dict_matches_asdict(self):
+        entry = self._entry()
+        expected = dataclasses.asdict(entry)
+        expected["deprecated_date"] = "2025-01-02"
+        expected["shutdown_date"] = ""
+        assert entry.to_dict() == expected
+        assert list(entry.to_dict()) == [f.name for f in dataclasses.fields(DeprecationEntry)]
+
+    def test_round_trip(self):
+        entry = self._entry(shutdown_date=datetime.date(2026, 6, 1))
+        assert DeprecationEntry.from_dict(entry.to_dict()) == entry
+        unknown = DeprecationEntry.from_dict(self._entry(deprecated_date=UNKNOWN_DATE).to_dict())
+        assert unknown.deprecated_date == UNKNOWN_DATE
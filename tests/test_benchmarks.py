@@ -0,0 +1,67 @@
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.pages import SCRAPERS, generate_page
+from benchmarks.suite import compare, make_entries, run
+
+
+def _results(**medians: float) -> dict:
+    return {"benchmarks": {name: {"median": median} for name, median in medians.items()}}
+
+
+class TestCompare:
+    def test_flags_regressions_over_threshold(self):
+        rows = compare(_results(a=1.3, b=1.1), _results(a=1.0, b=1.0), threshold=0.2)
+        assert {row["name"]: row["regression"] for row in rows} == {"a": True, "b": False}
+
+    def test_skips_benchmarks_missing_from_baseline(self):
+        rows = compare(_results(a=1.0, new=1.0), _results(a=1.0))
+        assert [row["name"] for row in rows] == ["a"]
+
+
+class TestRun:
+    def test_runs_selected_benchmarks(self):
+        results = run(["to_dict/10", "parse/openai/*"], repeat=1, min_time=0)
+        assert set(results["benchmarks"]) == {
+            "to_dict/10",
+            "parse/openai/fixture",
+            "parse/openai/100",
+            "parse/openai/1000",
+        }
+        assert all(r["median"] > 0 for r in results["benchmarks"].values())
+
+    def test_make_entries_is_deterministic(self):
+        assert make_entries(50) == make_entries(50)
+
+    def test_compare_exit_code(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        args = ["-k", "from_dict/10", "--repeat", "1", "--min-time", "0"]
+        assert main([*args, "-o", str(baseline)]) == 0
+        assert main([*args, "--compare", str(baseline), "--threshold", "1000"]) == 0
+        assert main([*args, "--compare", str(baseline), "--threshold", "-1"]) == 1
+
+
+class TestSyntheticPages:
+    @pytest.mark.parametrize("provider", sorted(SCRAPERS))
+    @pytest.mark.parametrize(
+        "options",
+        [{}, {"tables": 4, "rowspan_density": 0.5, "sections": 3}],
+    )
+    def test_scraper_finds_every_model(self, provider, options):
+        html = generate_page(provider, 40, **options)
+        entries = SCRAPERS[provider](html)
+        assert len(entries) == 40
+        assert len({e.model_name for e in entries}) == 40
+
+    def test_vertex_heading_layout(self):
+        entries = SCRAPERS["vertex"](generate_page("vertex", 12, headings=True, sections=2))
+        assert len(entries) == 12
+        assert all(e.has_deprecated_date() and e.has_shutdown_date() for e in entries)
+
+    def test_bedrock_rowspans_collapse_to_one_entry_per_model(self):
+        html = generate_page("bedrock", 30, tables=2, rowspan_density=1.0)
+        assert html.count('rowspan="2"') == 30
+        assert len(SCRAPERS["bedrock"](html)) == 30
+
+    def test_is_deterministic(self):
+        assert generate_page("gemini", 25, seed=3) == generate_page("gemini", 25, seed=3)
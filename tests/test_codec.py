@@ -0,0 +1,60 @@
+import datetime
+import io
+
+import orjson
+
+from scraper import codec
+from scraper.base import UNKNOWN_DATE, DeprecationEntry
+
+
+def _entries(count: int) -> list[DeprecationEntry]:
+    return [
+        DeprecationEntry(
+            provider="OpenAI",
+            model_name=f"model-{i}",
+            model_id=f"model-{i}-id" if i % 2 else "",
+            deprecated_date=datetime.date(2025, 1, 1 + i % 28) if i % 3 else UNKNOWN_DATE,
+            shutdown_date=datetime.date(2026, 1 + i % 12, 1),
+            replacement=f"model-{i + 1}",
+            status="deprecated",
+        )
+        for i in range(count)
+    ]
+
+
+class TestBulkJson:
+    def test_matches_to_dict_output(self, monkeypatch):
+        monkeypatch.setattr(codec, "CHUNK_SIZE", 7)
+        for count in (0, 1, 7, 8, 30):
+            entries = _entries(count)
+            dicts = [e.to_dict() for e in entries]
+            assert codec.encode(entries, indent=True) == orjson.dumps(dicts, option=orjson.OPT_INDENT_2)
+            assert codec.encode(entries) == orjson.dumps(dicts)
+
+    def test_round_trip_through_file(self, tmp_path):
+        entries = _entries(20)
+        path = tmp_path / "deprecations.json"
+        codec.dump(entries, path)
+        assert codec.load(path) == entries
+
+    def test_decode_matches_from_dict(self):
+        records = [e.to_dict() for e in _entries(10)]
+        records[0]["shutdown_date"] = ""
+        del records[1]["model_id"]
+        decoded = codec.decode(orjson.dumps(records))
+        assert decoded == [DeprecationEntry.from_dict(r) for r in records]
+        assert decoded[0].shutdown_date == UNKNOWN_DATE
+
+
+class TestNdjson:
+    def test_round_trip(self):
+        entries = _entries(5)
+        buf = io.BytesIO()
+        assert codec.write_ndjson(entries, buf) == 5
+        assert buf.getvalue().count(b"\n") == 5
+        buf.seek(0)
+        assert list(codec.iter_ndjson(buf)) == entries
+
+    def test_skips_blank_lines(self):
+        buf = io.BytesIO(b"\n" + orjson.dumps(_entries(1)[0].to_dict()) + b"\n\n")
+        assert list(codec.iter_ndjson(buf)) == _entries(1)
@@ -0,0 +1,80 @@
+import datetime
+
+import pytest
+from dateutil.parser import parse as dateutil_parse
+
+from scraper.base import UNKNOWN_DATE
+from scraper.dates import (
+    _fast_parse,
+    _parse_normalized,
+    normalize_hyphens,
+    parse_date_safe,
+    strip_not_sooner_than,
+    strip_region_suffix,
+    strip_trailing_period,
+)
+
+FAST_PATH_SAMPLES = [
+    "2026-02-17",
+    "2026-3-1",
+    "February 5, 2027",
+    "July 15th, 2025",
+    "Mar 1, 2026",
+    "Sept 3, 2026",
+    "Jan. 5, 2026",
+    "January 5 2026",
+    "1 March 2026",
+    "5th Jan 2026",
+]
+
+
+class TestFastPath:
+    @pytest.mark.parametrize("text", FAST_PATH_SAMPLES)
+    def test_matches_dateutil(self, text):
+        assert _fast_parse(text) == dateutil_parse(text, fuzzy=True).date()
+
+    @pytest.mark.parametrize("text", ["February 30, 2026", "Smarch 5, 2026", "June 2026", "on 2026-01-01"])
+    def test_defers_unusual_text_to_dateutil(self, text):
+        assert _fast_parse(text) is None
+
+
+class TestParseDateSafe:
+    @pytest.mark.parametrize("text", ["", "  ", "-", "—", "N/A", "n/a"])
+    def test_null_tokens(self, text):
+        assert parse_date_safe(text) == UNKNOWN_DATE
+
+    def test_unparseable_text(self):
+        assert parse_date_safe("to be announced") == UNKNOWN_DATE
+
+    def test_falls_back_to_fuzzy_parsing(self):
+        assert parse_date_safe("On or after April 2, 2026 at noon") == datetime.date(2026, 4, 2)
+
+    def test_memoizes_results(self):
+        _parse_normalized.cache_clear()
+        parse_date_safe("April 20, 2026")
+        parse_date_safe(" April 20, 2026 ")
+        info = _parse_normalized.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestQuirks:
+    def test_non_breaking_hyphens(self):
+        text = "2026\u201102\u201117"
+        assert parse_date_safe(text, (normalize_hyphens,)) == datetime.date(2026, 2, 17)
+
+    def test_region_suffix(self):
+        text = "Mar 1, 2026 (us-east-1, us-west-2)"
+        assert strip_region_suffix(text) == "Mar 1, 2026"
+        assert parse_date_safe(text, (strip_region_suffix,)) == datetime.date(2026, 3, 1)
+
+    def test_not_sooner_than(self):
+        text = "Not sooner than February 5, 2027"
+        assert parse_date_safe(text, (strip_not_sooner_than,)) == datetime.date(2027, 2, 5)
+
+    def test_trailing_period(self):
+        assert parse_date_safe("July 5, 2026.", (strip_trailing_period,)) == datetime.date(2026, 7, 5)
+
+    def test_quirks_apply_in_order(self):
+        text = "Not sooner than June 19, 2026 (all Regions)"
+        quirks = (strip_region_suffix, strip_not_sooner_than)
+        assert parse_date_safe(text, quirks) == datetime.date(2026, 6, 19)
@@ -0,0 +1,104 @@
+import datetime
+
+import pytest
+
+from analysis.entities import ModelKey, model_key, resolve_entities
+from scraper.base import DeprecationEntry
+
+
+class TestModelKey:
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "claude-sonnet-4-5-20250929",
+            "Claude Sonnet 4.5",
+            "anthropic.claude-sonnet-4-5-20250929-v1:0",
+            "claude-sonnet-4-5@20250929",
+            "Anthropic's Claude Sonnet 4.5 on Google Cloud",
+        ],
+    )
+    def test_provider_spellings_agree(self, name):
+        assert model_key(name) == ModelKey(frozenset({"claude", "sonnet"}), (4, 5))
+
+    def test_versions_stay_distinct(self):
+        assert model_key("claude-3-haiku") != model_key("claude-3-5-haiku")
+        assert model_key("gpt-4") != model_key("gpt-4o")
+        assert model_key("gpt-4-0613") != model_key("gpt-4-0314")
+
+    def test_bedrock_suffix_is_the_version_when_nothing_else_is(self):
+        assert model_key("anthropic.claude-v2") == ModelKey(frozenset({"claude"}), (2,))
+        assert model_key("anthropic.claude-v2:1") == ModelKey(frozenset({"claude"}), (2, 1))
+
+    def test_nothing_identifying(self):
+        assert model_key("2025-01-01") is None
+
+
+def _entry(provider: str, name: str, shutdown: datetime.date = None, model_id: str = "") -> DeprecationEntry:
+    entry = DeprecationEntry(provider=provider, model_name=name, model_id=model_id)
+    if shutdown:
+        entry.shutdown_date = shutdown
+    return entry
+
+
+class TestResolveEntities:
+    def test_groups_across_providers(self):
+        entries = [
+            _entry("Anthropic", "claude-3-haiku-20240307", datetime.date(2026, 4, 20)),
+            _entry("Vertex AI", "Anthropic's Claude 3 Haiku on Google Cloud", datetime.date(2026, 2, 1)),
+            _entry("Bedrock", "Claude 3.5 Haiku", model_id="anthropic.claude-3-5-haiku-20241022-v1:0"),
+            _entry("Anthropic", "claude-3-5-haiku-20241022"),
+            _entry("OpenAI", "gpt-4"),
+        ]
+        entities = resolve_entities(entries)
+        assert [e.providers for e in entities] == [
+            ["Anthropic", "Vertex AI"],
+            ["Bedrock", "Anthropic"],
+            ["OpenAI"],
+        ]
+        assert entities[0].shutdown_dates() == {
+            "Anthropic": datetime.date(2026, 4, 20),
+            "Vertex AI": datetime.date(2026, 2, 1),
+        }
+
+    def test_model_id_links_different_names(self):
+        entries = [
+            _entry("Bedrock", "Claude Instant", model_id="anthropic.claude-instant-v1"),
+            _entry("Anthropic", "claude-instant"),
+        ]
+        assert len(resolve_entities(entries)) == 1
+
+    def test_bedrock_version_suffixes_keep_models_apart(self):
+        entries = [
+            _entry("Bedrock", "Claude 2", datetime.date(2025, 7, 21), model_id="anthropic.claude-v2"),
+            _entry("Bedrock", "Claude 2.1", datetime.date(2025, 7, 21), model_id="anthropic.claude-v2:1"),
+            _entry("Anthropic", "claude-2.1", datetime.date(2025, 7, 21)),
+        ]
+        assert [[e.model_name for e in entity.entries] for entity in resolve_entities(entries)] == [
+            ["Claude 2"],
+            ["Claude 2.1", "claude-2.1"],
+        ]
+
+    def test_allows_one_typo_in_long_words_only(self):
+        entries = [
+            _entry("Anthropic", "claude-3-sonnet"),
+            _entry("Vertex AI", "Claude 3 Sonet"),
+            _entry("Gemini", "gemini-2.5-flash-lite"),
+            _entry("Gemini", "gemini-2.5-flash-live"),
+        ]
+        assert [len(e.entries) for e in resolve_entities(entries)] == [2, 1, 1]
+
+    def test_unkeyed_entries_stay_separate(self):
+        entries = [_entry("OpenAI", "2025-01-01"), _entry("OpenAI", "2025-01-01")]
+        assert len(resolve_entities(entries)) == 2
+
+    def test_to_dict(self):
+        (entity,) = resolve_entities([_entry("Anthropic", "claude-opus-4", datetime.date(2027, 1, 1))])
+        assert entity.to_dict() == {
+            "model": "claude-opus-4",
+            "shutdown_dates": {"Anthropic": "2027-01-01"},
+            "providers": {
+                "Anthropic": [
+                    {"model_name": "claude-opus-4", "model_id": "", "status": "active", "shutdown_date": "2027-01-01"}
+                ]
+            },
+        }
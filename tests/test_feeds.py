@@ -0,0 +1,102 @@
+import datetime
+
+import pytest
+
+from generators.feeds import Feed, default_feeds, load_feed_config, write_feeds
+from scraper.base import DeprecationEntry
+
+
+def _entries() -> list[DeprecationEntry]:
+    shutdown = datetime.date(2027, 1, 15)
+    return [
+        DeprecationEntry(provider="OpenAI", model_name="gpt-4", shutdown_date=shutdown, status="deprecated"),
+        DeprecationEntry(
+            provider="OpenAI", model_name="o1", model_id="o1-2024-12-17", shutdown_date=shutdown, status="retired"
+        ),
+        DeprecationEntry(provider="Vertex AI", model_name="Claude 3 Haiku", shutdown_date=shutdown, status="retired"),
+        DeprecationEntry(provider="Gemini", model_name="gemini-pro", status="active"),
+    ]
+
+
+def _summaries(path) -> list[str]:
+    return [
+        line.split("Model deprecation: ", 1)[1]
+        for line in path.read_bytes().decode().splitlines()
+        if line.startswith("SUMMARY:")
+    ]
+
+
+class TestFeed:
+    def test_filters_combine(self):
+        feed = Feed(path="x.ics", title="x", providers=frozenset(["OpenAI"]), models=("GPT-*", "o1-2024*"))
+        assert [feed.matches(e) for e in _entries()] == [True, True, False, False]
+
+    def test_default_feeds(self):
+        assert [feed.path for feed in default_feeds(_entries())] == [
+            "providers/openai.ics",
+            "providers/vertex-ai.ics",
+            "providers/gemini.ics",
+            "status/deprecated.ics",
+            "status/retired.ics",
+            "status/active.ics",
+        ]
+
+
+class TestFeedConfig:
+    def test_missing_file_defines_no_feeds(self, tmp_path):
+        assert load_feed_config(tmp_path / "feeds.toml") == []
+
+    def test_loads_feeds(self, tmp_path):
+        path = tmp_path / "feeds.toml"
+        path.write_text('[feeds.retired-gpt]\nstatuses = ["retired"]\nmodels = ["gpt-*"]\n')
+        [feed] = load_feed_config(path)
+        assert (feed.path, feed.statuses, feed.models) == ("retired-gpt.ics", {"retired"}, ("gpt-*",))
+
+    @pytest.mark.parametrize(
+        "table",
+        [
+            '[feeds."../escape"]\n',
+            '[feeds.x]\nprovider = ["OpenAI"]\n',
+            '[feeds.x]\nmodels = "gpt-4*"\n',
+            '[feeds.x]\nproviders = "OpenAI"\n',
+            "[feeds.x]\nstatuses = [1]\n",
+            "[feeds.x]\ntitle = 1\n",
+        ],
+    )
+    def test_rejects_invalid_feeds(self, tmp_path, table):
+        path = tmp_path / "feeds.toml"
+        path.write_text(table)
+        with pytest.raises(ValueError):
+            load_feed_config(path)
+
+
+class TestWriteFeeds:
+    def test_fans_out_in_one_pass(self, tmp_path):
+        config = tmp_path / "feeds.toml"
+        config.write_text('[feeds.openai-retired]\nproviders = ["OpenAI"]\nstatuses = ["retired"]\n')
+        calendar = tmp_path / "deprecations.ics"
+        feeds_dir = tmp_path / "feeds"
+
+        written = write_feeds(_entries(), calendar, feeds_dir, config)
+        assert all(written.values())
+        assert _summaries(calendar) == ["gpt-4", "o1", "Claude 3 Haiku"]
+        assert _summaries(feeds_dir / "providers" / "openai.ics") == ["gpt-4", "o1"]
+        assert _summaries(feeds_dir / "status" / "retired.ics") == ["o1", "Claude 3 Haiku"]
+        assert _summaries(feeds_dir / "openai-retired.ics") == ["o1"]
+        assert _summaries(feeds_dir / "providers" / "gemini.ics") == []
+        assert b"X-WR-CALNAME:Model Deprecations (Vertex AI)" in (feeds_dir / "providers" / "vertex-ai.ics").read_bytes()
+
+        # Events are shared byte-for-byte with the full calendar.
+        event = calendar.read_bytes().split(b"BEGIN:VEVENT")[2].split(b"END:VEVENT")[0]
+        assert event in (feeds_dir / "openai-retired.ics").read_bytes()
+
+    def test_unchanged_feeds_are_skipped_and_stale_ones_removed(self, tmp_path):
+        calendar = tmp_path / "deprecations.ics"
+        feeds_dir = tmp_path / "feeds"
+        write_feeds(_entries(), calendar, feeds_dir)
+        assert not any(write_feeds(_entries(), calendar, feeds_dir).values())
+
+        written = write_feeds(_entries()[:2], calendar, feeds_dir)
+        assert not (feeds_dir / "providers" / "vertex-ai.ics").exists()
+        assert written[feeds_dir / "status" / "retired.ics"]
+        assert not written[feeds_dir / "providers" / "openai.ics"]
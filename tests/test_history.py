@@ -0,0 +1,102 @@
+import dataclasses
+import datetime
+
+import main
+from scraper.base import DeprecationEntry
+from store.history import HistoryStore
+
+DAY1 = datetime.date(2026, 1, 1)
+DAY2 = datetime.date(2026, 1, 2)
+DAY3 = datetime.date(2026, 1, 3)
+
+
+def _entries() -> list[DeprecationEntry]:
+    return [
+        DeprecationEntry(
+            provider="Bedrock",
+            model_name="Claude 3 Sonnet",
+            model_id="anthropic.claude-3-sonnet",
+            shutdown_date=datetime.date(2026, 3, 1),
+            status="legacy",
+        ),
+        DeprecationEntry(provider="OpenAI", model_name="ada", shutdown_date=datetime.date(2024, 1, 4)),
+        DeprecationEntry(provider="OpenAI", model_name="ada", shutdown_date=datetime.date(2024, 1, 4)),
+    ]
+
+
+def _moved(entries: list[DeprecationEntry]) -> list[DeprecationEntry]:
+    return [dataclasses.replace(entries[0], shutdown_date=datetime.date(2026, 6, 1))] + entries[1:]
+
+
+class TestHistoryStore:
+    def test_first_run_adds_everything(self, tmp_path):
+        changes = HistoryStore(tmp_path).record(_entries(), at=DAY1)
+        assert [c.op for c in changes] == ["added"] * 3
+
+    def test_unchanged_run_appends_nothing(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        size = store.log_path.stat().st_size
+        files = {path: path.read_bytes() for path in tmp_path.iterdir()}
+        assert store.record(_entries(), at=DAY2) == []
+        assert store.log_path.stat().st_size == size
+        assert {path: path.read_bytes() for path in tmp_path.iterdir()} == files
+
+    def test_ignores_derived_fields(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        resolved = [dataclasses.replace(e, resolved_replacement="claude-sonnet-4-5") for e in _entries()]
+        assert store.record(resolved, at=DAY2) == []
+
+    def test_records_changed_fields_and_removals(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        changes = store.record(_moved(_entries())[:2], at=DAY2)
+        assert [(c.op, c.fields) for c in changes] == [("changed", ["shutdown_date"]), ("removed", [])]
+
+        history = store.history("Bedrock", "Claude 3 Sonnet")
+        assert [(c.at, c.op) for c in history] == [("2026-01-01", "added"), ("2026-01-02", "changed")]
+        assert history[1].before["shutdown_date"] == "2026-03-01"
+        assert history[1].after["shutdown_date"] == "2026-06-01"
+
+    def test_index_catches_up_with_unindexed_log_lines(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        store.index_path.unlink()
+        store.record(_moved(_entries()), at=DAY2)
+        store.index_path.write_bytes(b'{"log_size": 0, "runs": 0, "models": {}}')
+        assert len(store.history("Bedrock", "Claude 3 Sonnet")) == 2
+
+    def test_snapshot_matches_replayed_state(self, tmp_path):
+        store = HistoryStore(tmp_path, snapshot_interval=2)
+        store.record(_entries(), at=DAY1)
+        assert not store.snapshot_path.exists()
+        store.record(_moved(_entries()), at=DAY2)
+        assert store.snapshot_path.exists()
+        replayed = HistoryStore(tmp_path / "replay")
+        replayed.record(_entries(), at=DAY1)
+        replayed.record(_moved(_entries()), at=DAY2)
+        assert store.state() == replayed.state()
+        assert store.record(_moved(_entries()), at=DAY3) == []
+
+    def test_models_lists_tracked_keys(self, tmp_path):
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        assert store.models("OpenAI") == [("OpenAI", "ada")]
+
+
+class TestHistoryCommand:
+    def test_prints_changes(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(main, "HISTORY_DIR", tmp_path)
+        store = HistoryStore(tmp_path)
+        store.record(_entries(), at=DAY1)
+        store.record(_moved(_entries()), at=DAY2)
+
+        assert main.main(["history", "-p", "Bedrock", "Claude 3 Sonnet"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("2026-01-01  added")
+        assert lines[1] == "2026-01-02  changed  shutdown_date: 2026-03-01 -> 2026-06-01"
+
+    def test_unknown_model(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(main, "HISTORY_DIR", tmp_path)
+        assert main.main(["history", "-p", "Bedrock", "missing"]) == 1
@@ -0,0 +1,93 @@
+import time
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+import requests
+
+from scraper.http_cache import HttpCache
+
+URL = "https://example.com/deprecations"
+
+
+def _response(status: int, body: str = "", headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode()
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    response.url = URL
+    return response
+
+
+def _session(*responses: requests.Response) -> MagicMock:
+    session = MagicMock()
+    session.get.side_effect = list(responses)
+    return session
+
+
+class TestHttpCache:
+    def test_first_fetch_is_a_miss(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        session = _session(_response(200, "<html>v1</html>", {"ETag": '"abc"'}))
+        assert cache.get(session, URL) == "<html>v1</html>"
+        assert session.get.call_args.kwargs["headers"] == {}
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.revalidations) == (0, 1, 0)
+
+    def test_serves_cached_body_on_304(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        session = _session(
+            _response(
+                200,
+                "<html>v1</html>",
+                {"ETag": '"abc"', "Last-Modified": "Mon, 05 Jan 2026 00:00:00 GMT"},
+            ),
+            _response(304),
+        )
+        cache.get(session, URL)
+        assert cache.get(session, URL) == "<html>v1</html>"
+        assert session.get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 05 Jan 2026 00:00:00 GMT",
+        }
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.revalidations) == (1, 1, 1)
+
+    def test_replaces_body_when_changed(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        session = _session(
+            _response(200, "<html>v1</html>", {"ETag": '"v1"'}),
+            _response(200, "<html>v2</html>", {"ETag": '"v2"'}),
+            _response(304),
+        )
+        cache.get(session, URL)
+        assert cache.get(session, URL) == "<html>v2</html>"
+        assert cache.get(session, URL) == "<html>v2</html>"
+        assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v2"'}
+
+    def test_persists_across_instances(self, tmp_path):
+        HttpCache(tmp_path).get(_session(_response(200, "body", {"ETag": '"x"'})), URL)
+        cache = HttpCache(tmp_path)
+        assert cache.get(_session(_response(304)), URL) == "body"
+        assert cache.stats.hits == 1
+
+    def test_expired_entries_are_refetched_unconditionally(self, tmp_path):
+        cache = HttpCache(tmp_path, max_age=60)
+        cache.get(_session(_response(200, "old", {"ETag": '"x"'})), URL)
+        (path,) = tmp_path.iterdir()
+        record = orjson.loads(path.read_bytes())
+        record["stored_at"] = time.time() - 120
+        path.write_bytes(orjson.dumps(record))
+
+        session = _session(_response(200, "new", {"ETag": '"y"'}))
+        assert cache.get(session, URL) == "new"
+        assert session.get.call_args.kwargs["headers"] == {}
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        cache.get(_session(_response(200, "body")), URL)
+        assert not list(tmp_path.iterdir())
+
+    def test_http_errors_raise(self, tmp_path):
+        cache = HttpCache(tmp_path)
+        with pytest.raises(requests.HTTPError):
+            cache.get(_session(_response(500)), URL)
@@ -1,7 +1,9 @@
 import datetime
 
+from icalendar import Calendar
+
 from scraper.base import DeprecationEntry
-from generators.ics_generator import generate_ics
+from generators.ics_generator import event_uid, generate_ics, write_ics
 
 
 def _make_entries() -> list[DeprecationEntry]:
@@ -65,3 +67,61 @@ class TestGenerateIcs:
         result = generate_ics(_make_entries())
         # 2 events with shutdown dates, each with 2 alarms = 4 VALARM blocks
         assert result.count("BEGIN:VALARM") == 4
+
+
+def _events(ics: str) -> list[dict[str, str]]:
+    unfolded = ics.replace("\r\n ", "")
+    events = []
+    for block in unfolded.split("BEGIN:VEVENT\r\n")[1:]:
+        header = block.split("BEGIN:VALARM", 1)[0]
+        events.append(dict(line.split(":", 1) for line in header.splitlines() if ":" in line))
+    return events
+
+
+FIRST_RUN = datetime.datetime(2026, 10, 1, 12, 0, tzinfo=datetime.timezone.utc)
+SECOND_RUN = datetime.datetime(2026, 10, 2, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestEventIdentity:
+    def test_uids_are_stable_and_unique(self):
+        entries = _make_entries() + [
+            DeprecationEntry(provider="OpenAI", model_name="gpt-4-0314", shutdown_date=datetime.date(2026, 6, 1))
+        ]
+        uids = [event["UID"] for event in _events(generate_ics(entries))]
+        assert len(set(uids)) == 3
+        assert uids == [event["UID"] for event in _events(generate_ics(entries))]
+        assert uids[0] == event_uid("OpenAI", "gpt-4-0314")
+
+    def test_new_events_start_at_sequence_zero(self):
+        [event, _] = _events(generate_ics(_make_entries(), now=FIRST_RUN))
+        assert event["SEQUENCE"] == "0"
+        assert event["DTSTAMP"] == event["LAST-MODIFIED"] == "20261001T120000Z"
+
+    def test_unchanged_calendar_is_identical(self):
+        first = generate_ics(_make_entries(), now=FIRST_RUN)
+        assert generate_ics(_make_entries(), previous=first, now=SECOND_RUN) == first
+
+    def test_changed_event_bumps_sequence_only_for_itself(self):
+        first = generate_ics(_make_entries(), now=FIRST_RUN)
+        entries = _make_entries()
+        entries[0].shutdown_date = datetime.date(2026, 5, 1)
+        changed, unchanged = _events(generate_ics(entries, previous=first, now=SECOND_RUN))
+        assert (changed["SEQUENCE"], changed["LAST-MODIFIED"]) == ("1", "20261002T120000Z")
+        assert changed["DTSTAMP"] == changed["LAST-MODIFIED"]
+        assert (unchanged["SEQUENCE"], unchanged["LAST-MODIFIED"]) == ("0", "20261001T120000Z")
+
+    def test_parses_with_icalendar(self):
+        calendar = Calendar.from_ical(generate_ics(_make_entries()))
+        assert [str(event["SUMMARY"]) for event in calendar.walk("VEVENT")] == [
+            "[OpenAI] Model deprecation: gpt-4-0314",
+            "[Anthropic] Model deprecation: claude-3-haiku",
+        ]
+
+    def test_write_ics_keeps_file_when_unchanged(self, tmp_path):
+        path = tmp_path / "deprecations.ics"
+        assert write_ics(_make_entries(), str(path))
+        assert not write_ics(_make_entries(), str(path))
+        entries = _make_entries()
+        entries[1].replacement = "claude-haiku-5"
+        assert write_ics(entries, str(path))
+        assert [event["SEQUENCE"] for event in _events(path.read_bytes().decode())] == ["0", "1"]
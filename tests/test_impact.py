@@ -0,0 +1,118 @@
+import datetime
+import gzip
+
+import orjson
+import pytest
+
+from scraper.base import DeprecationEntry
+from usage import impact as impact_module
+from usage.impact import ModelResolver, count_requests, horizon, impact
+
+TODAY = datetime.date(2026, 10, 17)
+
+ENTRIES = [
+    DeprecationEntry(
+        provider="OpenAI",
+        model_name="gpt-4-0613 | gpt-4",
+        shutdown_date=datetime.date(2026, 10, 23),
+        replacement="gpt-5",
+        status="deprecated",
+    ),
+    DeprecationEntry(
+        provider="Anthropic",
+        model_name="claude-2.1",
+        shutdown_date=datetime.date(2026, 1, 1),
+        status="retired",
+    ),
+    DeprecationEntry(provider="OpenAI", model_name="gpt-4o", status="active"),
+    DeprecationEntry(
+        provider="Anthropic",
+        model_name="claude-opus-4-7",
+        shutdown_date=datetime.date(2027, 10, 1),
+        status="active",
+    ),
+]
+
+
+def _entry(shutdown: datetime.date = None) -> DeprecationEntry:
+    fields = {"shutdown_date": shutdown} if shutdown else {}
+    return DeprecationEntry(provider="OpenAI", model_name="m", **fields)
+
+
+class TestHorizon:
+    @pytest.mark.parametrize(
+        ("days", "expected"),
+        [(-1, "shut down"), (0, "<=1d"), (1, "<=1d"), (2, "<=14d"), (30, "<=30d"), (90, "<=90d"), (91, ">90d")],
+    )
+    def test_buckets(self, days, expected):
+        assert horizon(_entry(TODAY + datetime.timedelta(days=days)), TODAY) == expected
+
+    def test_unscheduled(self):
+        assert horizon(_entry(), TODAY) == "unscheduled"
+
+
+class TestCountRequests:
+    def test_csv(self, tmp_path):
+        path = tmp_path / "log.csv"
+        path.write_text("ts,team,model\n1,search,gpt-4\n2,search,gpt-4\n3,ads,gpt-4o\n4,short\n")
+        assert count_requests(path) == {("search", "gpt-4"): 2, ("ads", "gpt-4o"): 1}
+
+    def test_csv_small_chunks_and_missing_team(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(impact_module, "CHUNK_SIZE", 2)
+        path = tmp_path / "log.csv"
+        path.write_text("model\n" + "gpt-4\n" * 5)
+        assert count_requests(path) == {("", "gpt-4"): 5}
+
+    def test_csv_without_model_column(self, tmp_path):
+        path = tmp_path / "log.csv"
+        path.write_text("ts,team\n1,search\n")
+        with pytest.raises(ValueError, match="model"):
+            count_requests(path)
+
+    def test_gzipped_ndjson(self, tmp_path):
+        path = tmp_path / "log.ndjson.gz"
+        records = [{"svc": "search", "m": "gpt-4"}, {"svc": "ads", "m": "gpt-4"}, {"svc": "ads", "m": None}, [1]]
+        with gzip.open(path, "wb") as f:
+            f.write(b"\n".join(orjson.dumps(r) for r in records) + b"\n\nnot json\n")
+        counts = count_requests(path, team_field="svc", model_field="m")
+        assert counts == {("search", "gpt-4"): 1, ("ads", "gpt-4"): 1}
+
+
+class TestModelResolver:
+    def test_matches_aliases_and_gateway_prefixes(self):
+        resolve = ModelResolver(ENTRIES)
+        assert resolve("GPT-4") is ENTRIES[0]
+        assert resolve("openai/gpt-4") is ENTRIES[0]
+        assert resolve("claude-2.1") is ENTRIES[1]
+
+    def test_ignores_active_and_unknown_models(self):
+        resolve = ModelResolver(ENTRIES)
+        assert resolve("gpt-4o") is None
+        assert resolve("claude-opus-4-7") is None
+        assert resolve("brand-new") is None
+
+
+class TestImpact:
+    def test_joins_and_aggregates_across_files(self, tmp_path):
+        csv_path = tmp_path / "a.csv"
+        csv_path.write_text("team,model\nsearch,gpt-4\nsearch,openai/gpt-4\nads,claude-2.1\nads,gpt-4o\nads,claude-opus-4-7\n")
+        ndjson_path = tmp_path / "b.ndjson"
+        ndjson_path.write_bytes(b'{"team": "search", "model": "gpt-4-0613"}\n')
+
+        rows = impact([csv_path, ndjson_path], ENTRIES, today=TODAY)
+        assert [(r.team, r.entry.model_name, r.horizon, r.requests) for r in rows] == [
+            ("ads", "claude-2.1", "shut down", 1),
+            ("search", "gpt-4-0613 | gpt-4", "<=14d", 3),
+        ]
+        assert rows[1].to_dict()["replacement"] == "gpt-5"
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"{i}.csv"
+            path.write_text("team,model\n" + f"t{i},gpt-4\n" * (i + 1))
+            paths.append(path)
+        serial = impact(paths, ENTRIES, today=TODAY)
+        parallel = impact(paths, ENTRIES, jobs=2, today=TODAY)
+        assert [(r.team, r.requests) for r in parallel] == [(r.team, r.requests) for r in serial]
+        assert [r.requests for r in serial] == [3, 2, 1]
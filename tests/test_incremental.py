@@ -0,0 +1,151 @@
+import datetime
+import subprocess
+
+import pytest
+
+from scraper import codec
+from scraper.base import DeprecationEntry
+from usage import incremental
+from usage.__main__ import main
+from usage.incremental import (
+    CLEAN,
+    RETIRED,
+    RETIRING,
+    added_lines,
+    exit_code,
+    file_contents,
+    git_diff,
+    load_matcher,
+    severity,
+)
+
+TODAY = datetime.date(2026, 10, 17)
+
+ENTRIES = [
+    DeprecationEntry(
+        provider="OpenAI",
+        model_name="gpt-4",
+        status="deprecated",
+        shutdown_date=datetime.date(2026, 10, 23),
+        replacement="gpt-5",
+    ),
+    DeprecationEntry(provider="Anthropic", model_name="claude-2.1", status="retired"),
+]
+
+DIFF = b"""\
+diff --git a/app.py b/app.py
+index 1111111..2222222 100644
+--- a/app.py
++++ b/app.py
+@@ -3,0 +4,2 @@ import client
++MODEL = "gpt-4"
+++++ "claude-2.1"
+@@ -10 +12 @@ def run():
+-    model = "claude-2.1"
++    model = MODEL
+diff --git a/old.py b/old.py
+deleted file mode 100644
+--- a/old.py
++++ /dev/null
+@@ -1 +0,0 @@
+-gpt-4
+diff --git a/new.py b/new.py
+new file mode 100644
+--- /dev/null
++++ b/new.py
+@@ -0,0 +1 @@
++x = "gpt-4"
+"""
+
+
+@pytest.fixture
+def data_path(tmp_path):
+    path = tmp_path / "deprecations.json"
+    codec.dump(ENTRIES, path)
+    return path
+
+
+class TestAddedLines:
+    def test_tracks_paths_and_new_line_numbers(self):
+        assert list(added_lines(DIFF)) == [
+            ("app.py", 4, b'MODEL = "gpt-4"'),
+            ("app.py", 5, b'+++ "claude-2.1"'),
+            ("app.py", 12, b"    model = MODEL"),
+            ("new.py", 1, b'x = "gpt-4"'),
+        ]
+
+    def test_counts_context_lines(self):
+        diff = b"+++ b/a.py\n@@ -1,3 +1,4 @@\n one\n-two\n+2\n+3\n three\n"
+        assert list(added_lines(diff)) == [("a.py", 2, b"2"), ("a.py", 3, b"3")]
+
+
+class TestMatcherCache:
+    def test_rebuilds_only_when_data_changes(self, data_path, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        first = load_matcher(data_path, cache_dir)
+        assert set(first.targets) == {"gpt-4", "claude-2.1"}
+
+        def fail(data):
+            raise AssertionError("matcher was rebuilt")
+
+        monkeypatch.setattr(incremental, "_build", fail)
+        assert load_matcher(data_path, cache_dir).regex.pattern == first.regex.pattern
+
+        monkeypatch.undo()
+        codec.dump(ENTRIES[:1], data_path)
+        assert set(load_matcher(data_path, cache_dir).targets) == {"gpt-4"}
+
+    def test_corrupt_cache_is_rebuilt(self, data_path, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "matcher.json").write_bytes(b"{not json")
+        assert "gpt-4" in load_matcher(data_path, cache_dir).targets
+
+
+class TestSeverity:
+    def test_levels(self):
+        assert severity("deprecated", None, TODAY) == RETIRING
+        assert severity("deprecated", TODAY + datetime.timedelta(days=1), TODAY) == RETIRING
+        assert severity("deprecated", TODAY, TODAY) == RETIRED
+        assert severity("retired", None, TODAY) == RETIRED
+
+    def test_hits_and_exit_code(self, data_path, tmp_path):
+        matcher = load_matcher(data_path, tmp_path / "cache")
+        hits = matcher.hits(added_lines(DIFF), today=TODAY)
+        assert [(h.path, h.line, h.match, h.severity) for h in hits] == [
+            ("app.py", 4, "gpt-4", RETIRING),
+            ("app.py", 5, "claude-2.1", RETIRED),
+            ("new.py", 1, "gpt-4", RETIRING),
+        ]
+        assert hits[0].format() == (
+            'app.py:4: gpt-4 (OpenAI deprecated, shutdown 2026-10-23, use gpt-5)\n    MODEL = "gpt-4"'
+        )
+        assert exit_code(hits) == RETIRED
+        assert exit_code(hits[:1]) == RETIRING
+        assert exit_code([]) == CLEAN
+
+
+class TestSources:
+    def test_file_contents_skips_binary_and_missing(self, tmp_path):
+        (tmp_path / "a.py").write_text("gpt-4\n")
+        (tmp_path / "b.bin").write_bytes(b"\0gpt-4")
+        chunks = list(file_contents([tmp_path / "a.py", tmp_path / "b.bin", tmp_path / "missing.py"]))
+        assert chunks == [(str(tmp_path / "a.py"), 1, b"gpt-4\n")]
+
+    def test_staged_changes(self, data_path, tmp_path, monkeypatch, capsys):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        (repo / "app.py").write_text("x = 1\n")
+        subprocess.run([*git, "add", "app.py"], check=True)
+        subprocess.run([*git, "commit", "-qm", "init"], check=True)
+        (repo / "app.py").write_text('x = 1\nmodel = "claude-2.1"\n')
+        subprocess.run([*git, "add", "app.py"], check=True)
+
+        assert list(added_lines(git_diff(["--cached"], cwd=repo))) == [("app.py", 2, b'model = "claude-2.1"')]
+
+        monkeypatch.setattr(incremental, "CACHE_DIR", tmp_path / "cache")
+        monkeypatch.chdir(repo)
+        assert main(["--data", str(data_path)]) == RETIRED
+        assert capsys.readouterr().out.startswith("app.py:2: claude-2.1 (Anthropic retired")
@@ -0,0 +1,68 @@
+import datetime
+
+from analysis.index import DeprecationIndex, normalize_name
+from scraper.base import DeprecationEntry
+
+
+def _entries() -> list[DeprecationEntry]:
+    return [
+        DeprecationEntry(
+            provider="OpenAI",
+            model_name="gpt-4-0613 | gpt-4, gpt-4-completions",
+            shutdown_date=datetime.date(2026, 3, 1),
+        ),
+        DeprecationEntry(
+            provider="Bedrock",
+            model_name="Claude 3 Sonnet",
+            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+            shutdown_date=datetime.date(2026, 1, 1),
+        ),
+        DeprecationEntry(provider="Anthropic", model_name="`claude-3-opus`", status="active"),
+        DeprecationEntry(provider="OpenAI", model_name="ada", shutdown_date=datetime.date(2026, 3, 1)),
+    ]
+
+
+class TestLookups:
+    def test_normalize_name(self):
+        assert normalize_name("  `Claude  3`\tOpus ") == "claude 3 opus"
+
+    def test_by_name_id_and_alias(self):
+        index = DeprecationIndex(_entries())
+        assert index.by_name("claude 3 sonnet")[0].provider == "Bedrock"
+        assert index.by_name("claude-3-opus")[0].provider == "Anthropic"
+        assert index.by_id("ANTHROPIC.claude-3-sonnet-20240229-v1:0")[0].model_name == "Claude 3 Sonnet"
+        assert index.by_alias("gpt-4-completions")[0].provider == "OpenAI"
+        assert index.by_alias("ada") == []
+
+    def test_lookup_combines_all_keys(self):
+        index = DeprecationIndex(_entries())
+        assert [e.model_name for e in index.lookup("gpt-4")] == ["gpt-4-0613 | gpt-4, gpt-4-completions"]
+        assert index.lookup("missing") == []
+
+
+class TestDateRanges:
+    def test_sorted_by_shutdown_then_input_order(self):
+        index = DeprecationIndex(_entries())
+        names = [e.model_name for e in index.shutting_down()]
+        assert names == ["Claude 3 Sonnet", "gpt-4-0613 | gpt-4, gpt-4-completions", "ada"]
+
+    def test_inclusive_bounds(self):
+        index = DeprecationIndex(_entries())
+        assert len(index.shutting_down(start=datetime.date(2026, 1, 1), end=datetime.date(2026, 1, 1))) == 1
+        assert len(index.shutting_down(start=datetime.date(2026, 1, 2))) == 2
+        assert index.shutting_down(end=datetime.date(2025, 12, 31)) == []
+
+    def test_input_order(self):
+        index = DeprecationIndex(_entries())
+        providers = [e.provider for e in index.shutting_down(input_order=True)]
+        assert providers == ["OpenAI", "Bedrock", "OpenAI"]
+
+    def test_shutting_down_on_dates(self):
+        index = DeprecationIndex(_entries())
+        dates = [datetime.date(2026, 3, 1), datetime.date(2026, 1, 1), datetime.date(2026, 3, 1)]
+        assert [e.provider for e in index.shutting_down_on(dates)] == ["OpenAI", "Bedrock", "OpenAI"]
+
+    def test_of_reuses_index(self):
+        index = DeprecationIndex(_entries())
+        assert DeprecationIndex.of(index) is index
+        assert list(DeprecationIndex.of(_entries())) == _entries()
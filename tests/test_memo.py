@@ -0,0 +1,71 @@
+import datetime
+from pathlib import Path
+
+from scraper import memo
+from scraper.base import DeprecationEntry
+from scraper.gemini_scraper import _parse_page as parse_gemini
+from scraper.memo import ParseMemo
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+TODAY = datetime.date(2026, 1, 1)
+
+
+class _CountingParser:
+    def __init__(self, shutdown_date: datetime.date = datetime.date(2026, 6, 1)):
+        self.calls = 0
+        self.shutdown_date = shutdown_date
+
+    def __call__(self, html: str) -> list[DeprecationEntry]:
+        self.calls += 1
+        return [
+            DeprecationEntry(
+                provider="Test",
+                model_name=html.strip(),
+                shutdown_date=self.shutdown_date,
+                status="deprecated",
+            )
+        ]
+
+
+class TestParseMemo:
+    def test_unchanged_page_skips_parse(self, tmp_path):
+        parse_memo = ParseMemo(tmp_path)
+        parser = _CountingParser()
+        first = parse_memo.parse("Test", "model-a", parser, today=TODAY)
+        second = parse_memo.parse("Test", "model-a\r\n", parser, today=TODAY)
+        assert parser.calls == 1
+        assert first == second
+        assert (parse_memo.stats.hits, parse_memo.stats.misses) == (1, 1)
+
+    def test_changed_page_is_reparsed(self, tmp_path):
+        parse_memo = ParseMemo(tmp_path)
+        parser = _CountingParser()
+        parse_memo.parse("Test", "model-a", parser, today=TODAY)
+        entries = parse_memo.parse("Test", "model-b", parser, today=TODAY)
+        assert parser.calls == 2
+        assert entries[0].model_name == "model-b"
+
+    def test_parser_code_change_invalidates(self, tmp_path, monkeypatch):
+        parse_memo = ParseMemo(tmp_path)
+        parser = _CountingParser()
+        parse_memo.parse("Test", "model-a", parser, today=TODAY)
+        monkeypatch.setattr(memo, "parser_code_hash", lambda: "different")
+        parse_memo.parse("Test", "model-a", parser, today=TODAY)
+        assert parser.calls == 2
+
+    def test_reparses_once_a_shutdown_date_passes(self, tmp_path):
+        parse_memo = ParseMemo(tmp_path)
+        parser = _CountingParser(shutdown_date=datetime.date(2026, 1, 10))
+        parse_memo.parse("Test", "model-a", parser, today=TODAY)
+        parse_memo.parse("Test", "model-a", parser, today=datetime.date(2026, 1, 9))
+        assert parser.calls == 1
+        parse_memo.parse("Test", "model-a", parser, today=datetime.date(2026, 1, 10))
+        assert parser.calls == 2
+
+    def test_round_trips_real_scraper_output(self, tmp_path):
+        html = (FIXTURES_DIR / "gemini.html").read_text()
+        parse_memo = ParseMemo(tmp_path)
+        parsed = parse_memo.parse("Gemini", html, parse_gemini)
+        cached = ParseMemo(tmp_path).parse("Gemini", html, parse_gemini)
+        assert cached == parsed
@@ -0,0 +1,76 @@
+import datetime
+
+from generators.ics_generator import write_ics
+from generators.output import write_chunks_if_changed, write_if_changed
+from generators.readme_generator import update_readme
+from scraper.base import DeprecationEntry
+
+
+def _entries() -> list[DeprecationEntry]:
+    return [
+        DeprecationEntry(
+            provider="OpenAI",
+            model_name="gpt-4",
+            shutdown_date=datetime.date.today() + datetime.timedelta(days=60),
+            replacement="gpt-5",
+            status="deprecated",
+        )
+    ]
+
+
+class TestWriteIfChanged:
+    def test_writes_new_file(self, tmp_path):
+        path = tmp_path / "sub" / "out.json"
+        assert write_if_changed(path, b"[]")
+        assert path.read_bytes() == b"[]"
+
+    def test_skips_identical_content(self, tmp_path):
+        path = tmp_path / "out.json"
+        path.write_bytes(b"[]")
+        mtime = path.stat().st_mtime_ns
+        assert not write_if_changed(path, b"[]")
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_normalize_ignores_volatile_parts(self, tmp_path):
+        path = tmp_path / "out.txt"
+        path.write_bytes(b"stamp 1\nbody")
+        strip = lambda data: data.split(b"\n", 1)[1]
+        assert not write_if_changed(path, b"stamp 2\nbody", normalize=strip)
+        assert write_if_changed(path, b"stamp 2\nother", normalize=strip)
+        assert path.read_bytes() == b"stamp 2\nother"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+class TestWriteChunksIfChanged:
+    def test_streams_new_and_changed_content(self, tmp_path):
+        path = tmp_path / "out.ics"
+        assert write_chunks_if_changed(path, [b"ab", b"cd"])
+        assert not write_chunks_if_changed(path, iter([b"a", b"bcd"]))
+        assert write_chunks_if_changed(path, [b"ab", b"c"])
+        assert path.read_bytes() == b"abc"
+        assert write_chunks_if_changed(path, [b"abc", b"d"])
+        assert path.read_bytes() == b"abcd"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.ics"]
+
+
+class TestChangeAwareOutputs:
+    def test_readme_ignores_last_updated_line(self, tmp_path):
+        path = tmp_path / "README.md"
+        path.write_text("# Title\n")
+        assert update_readme(str(path), _entries())
+
+        today = datetime.date.today().isoformat()
+        stale = path.read_text().replace(f"Last updated: {today}", "Last updated: 2000-01-01")
+        path.write_text(stale)
+        assert not update_readme(str(path), _entries())
+        assert path.read_text() == stale
+
+        changed = _entries()
+        changed[0].replacement = "gpt-6"
+        assert update_readme(str(path), changed)
+        assert f"Last updated: {today}" in path.read_text()
+
+    def test_ics_skips_unchanged_calendar(self, tmp_path):
+        path = tmp_path / "deprecations.ics"
+        assert write_ics(_entries(), str(path))
+        assert not write_ics(_entries(), str(path))
@@ -1,7 +1,7 @@
 import datetime
 
 from scraper.base import DeprecationEntry
-from generators.readme_generator import generate_readme, MARKER_START, MARKER_END
+from generators.readme_generator import SECTION_END, _parse_sections, generate_readme, MARKER_START, MARKER_END
 
 
 def _make_entries() -> list[DeprecationEntry]:
@@ -111,3 +111,64 @@ class TestGenerateReadme:
         result = generate_readme(entries)
         assert "\U0001f534" not in result
         assert "\U0001f7e1" not in result
+
+
+class TestProviderSections:
+    TODAY = datetime.date(2026, 3, 1)
+
+    def _entries(self) -> list[DeprecationEntry]:
+        return [
+            DeprecationEntry(
+                provider="OpenAI",
+                model_name="gpt-4",
+                shutdown_date=datetime.date(2026, 4, 15),
+                replacement="gpt-5",
+                status="deprecated",
+            ),
+            DeprecationEntry(
+                provider="Anthropic",
+                model_name="claude-2",
+                shutdown_date=datetime.date(2026, 6, 1),
+                status="deprecated",
+            ),
+        ]
+
+    def test_sections_are_marked_with_hash_and_validity(self):
+        result = generate_readme(self._entries(), today=self.TODAY)
+        sections = _parse_sections(result)
+        assert list(sections) == ["Anthropic", "OpenAI"]
+        # gpt-4 turns yellow 30 days before its 2026-04-15 shutdown.
+        assert sections["OpenAI"].valid_until == datetime.date(2026, 3, 16)
+        assert result.count(SECTION_END) == 2
+
+    def test_unchanged_sections_are_reused_verbatim(self):
+        previous = generate_readme(self._entries(), today=self.TODAY)
+        edited = previous.replace("| gpt-5 |", "| gpt-5 (kept) |")
+        result = generate_readme(self._entries(), previous=edited, today=self.TODAY + datetime.timedelta(days=1))
+        assert "gpt-5 (kept)" in result
+
+    def test_changed_section_is_rendered_again(self):
+        previous = generate_readme(self._entries(), today=self.TODAY)
+        edited = previous.replace("| gpt-5 |", "| gpt-5 (kept) |").replace("| claude-2 |", "| claude-2 (kept) |")
+        entries = self._entries()
+        entries[0].replacement = "gpt-6"
+        result = generate_readme(entries, previous=edited, today=self.TODAY)
+        assert "| gpt-6 |" in result and "gpt-5 (kept)" not in result
+        assert "claude-2 (kept)" in result
+
+    def test_expired_markers_are_reclassified_in_place(self):
+        previous = generate_readme(self._entries(), today=self.TODAY)
+        edited = previous.replace("| gpt-5 |", "| gpt-5 (kept) |")
+        later = datetime.date(2026, 4, 1)
+        result = generate_readme(self._entries(), previous=edited, today=later)
+        assert "| \U0001f7e1 2026-04-15 | gpt-5 (kept) |" in result
+        assert _parse_sections(result)["OpenAI"].valid_until == datetime.date(2026, 4, 15)
+        assert generate_readme(self._entries(), previous=previous, today=later) == generate_readme(
+            self._entries(), today=later
+        )
+
+    def test_expired_rows_are_dropped(self):
+        previous = generate_readme(self._entries(), today=self.TODAY)
+        result = generate_readme(self._entries(), previous=previous, today=datetime.date(2026, 7, 15))
+        assert "gpt-4" not in result
+        assert "\U0001f534 2026-06-01" in result
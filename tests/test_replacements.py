@@ -0,0 +1,93 @@
+import datetime
+
+from analysis.replacements import ReplacementGraph, replacement_identifiers, resolve_replacements
+from generators.readme_generator import generate_readme
+from generators.slack_notifier import format_slack_message
+from scraper.base import DeprecationEntry
+
+
+def _entry(name: str, replacement: str = "", status: str = "deprecated", **fields) -> DeprecationEntry:
+    return DeprecationEntry(provider="Gemini", model_name=name, replacement=replacement, status=status, **fields)
+
+
+class TestReplacementIdentifiers:
+    def test_bedrock_name_and_id(self):
+        text = "Claude 3.5 Sonnet / anthropic.claude-3-5-sonnet-20240620-v1:0"
+        assert replacement_identifiers(text) == ["anthropic.claude-3-5-sonnet-20240620-v1:0", "Claude 3.5 Sonnet"]
+
+    def test_first_alternative_without_decorations(self):
+        assert replacement_identifiers("gpt-5 or gpt-4.1*") == ["gpt-5"]
+        assert replacement_identifiers("gpt-5.6-sol (reasoning.mode: pro)") == ["gpt-5.6-sol"]
+        assert replacement_identifiers("davinci-002, gpt-4o") == ["davinci-002"]
+
+
+class TestReplacementGraph:
+    def test_follows_chain_to_live_model(self):
+        entries = [
+            _entry("gemini-2.5-flash-image", "gemini-3.1-flash-image-preview"),
+            _entry("gemini-3.1-flash-image-preview", "gemini-3.1-flash-image", status="retired"),
+            _entry("gemini-3.1-flash-image", status="active"),
+        ]
+        resolve_replacements(entries)
+        assert [e.resolved_replacement for e in entries] == ["gemini-3.1-flash-image"] * 2 + [""]
+
+    def test_unlisted_replacement_is_final(self):
+        graph = ReplacementGraph([_entry("old", "brand-new")])
+        assert graph.resolve("brand-new") == "brand-new"
+
+    def test_deprecated_dead_end_is_kept(self):
+        graph = ReplacementGraph([_entry("a", "b"), _entry("b")])
+        assert graph.resolve("b") == "b"
+
+    def test_cycle_resolves_to_nothing(self):
+        graph = ReplacementGraph([_entry("a", "b"), _entry("b", "c"), _entry("c", "b")])
+        assert graph.resolve("b") == ""
+        assert graph.resolve("a") == ""
+
+    def test_bedrock_chain_through_model_id(self):
+        entries = [
+            DeprecationEntry(
+                provider="Bedrock",
+                model_name="Claude 3 Sonnet",
+                replacement="Claude 3.5 Sonnet / anthropic.claude-3-5-sonnet-v1:0",
+                status="legacy",
+            ),
+            DeprecationEntry(
+                provider="Bedrock",
+                model_name="Claude v3.5 Sonnet",
+                model_id="anthropic.claude-3-5-sonnet-v1:0",
+                replacement="Claude Sonnet 4 / anthropic.claude-sonnet-4-v1:0",
+                status="legacy",
+            ),
+        ]
+        resolve_replacements(entries)
+        assert entries[0].resolved_replacement == "Claude Sonnet 4 / anthropic.claude-sonnet-4-v1:0"
+
+    def test_resolution_is_memoized(self):
+        graph = ReplacementGraph([_entry("a", "b"), _entry("b", "c"), _entry("c", "d")])
+        assert graph.resolve("c") == "d"
+        graph._edges.clear()
+        graph._index = None
+        assert graph.resolve("c") == "d"
+
+
+class TestResolvedOutput:
+    def _entry(self) -> DeprecationEntry:
+        entry = _entry(
+            "gemini-2.5-flash-image",
+            "gemini-3.1-flash-image-preview",
+            shutdown_date=datetime.date.today() + datetime.timedelta(days=14),
+        )
+        entry.resolved_replacement = "gemini-3.1-flash-image"
+        return entry
+
+    def test_json(self):
+        assert self._entry().to_dict()["resolved_replacement"] == "gemini-3.1-flash-image"
+
+    def test_readme(self):
+        assert "gemini-3.1-flash-image-preview → gemini-3.1-flash-image |" in generate_readme([self._entry()])
+
+    def test_slack(self):
+        message = format_slack_message([self._entry()])
+        assert "(resolves to gemini-3.1-flash-image)" in message["text"]
+        assert "(resolves to gemini-3.1-flash-image)" in message["blocks"][1]["text"]["text"]
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from scraper.base import DeprecationEntry
+from scraper.runner import scrape_all
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def _make_scraper(provider: str, delay: float):
+    def scrape() -> list[DeprecationEntry]:
+        time.sleep(delay)
+        return [DeprecationEntry(provider=provider, model_name=f"{provider}-model")]
+
+    return scrape
+
+
+class TestScrapeAll:
+    def test_results_keep_provider_order(self):
+        scrapers = [
+            ("Slow", _make_scraper("Slow", 0.2)),
+            ("Fast", _make_scraper("Fast", 0.0)),
+            ("Medium", _make_scraper("Medium", 0.1)),
+        ]
+        results = scrape_all(scrapers, max_workers=3, timeout=5)
+        assert [r.name for r in results] == ["Slow", "Fast", "Medium"]
+        assert [r.entries[0].provider for r in results] == ["Slow", "Fast", "Medium"]
+
+    def test_runs_concurrently(self):
+        scrapers = [(f"P{i}", _make_scraper(f"P{i}", 0.2)) for i in range(4)]
+        start = time.monotonic()
+        scrape_all(scrapers, max_workers=4, timeout=5)
+        assert time.monotonic() - start < 0.6
+
+    def test_reports_elapsed_time(self):
+        results = scrape_all([("Slow", _make_scraper("Slow", 0.1))], max_workers=1, timeout=5)
+        assert results[0].elapsed >= 0.1
+
+    def test_single_worker(self):
+        scrapers = [(f"P{i}", _make_scraper(f"P{i}", 0.0)) for i in range(3)]
+        results = scrape_all(scrapers, max_workers=1, timeout=5)
+        assert [r.name for r in results] == ["P0", "P1", "P2"]
+
+    def test_timeout_abandons_only_the_slow_provider(self):
+        scrapers = [
+            ("Fast", _make_scraper("Fast", 0.0)),
+            ("Hung", _make_scraper("Hung", 5.0)),
+        ]
+        start = time.monotonic()
+        results = scrape_all(scrapers, max_workers=2, timeout=0.2)
+        assert time.monotonic() - start < 1.0
+        assert [(r.name, r.timed_out, len(r.entries)) for r in results] == [("Fast", False, 1), ("Hung", True, 0)]
+
+    def test_queued_providers_run_after_a_timeout(self):
+        scrapers = [("Hung", _make_scraper("Hung", 5.0)), ("Next", _make_scraper("Next", 0.0))]
+        results = scrape_all(scrapers, max_workers=1, timeout=0.2)
+        assert [r.timed_out for r in results] == [True, False]
+
+    def test_process_exits_at_the_time_limit(self):
+        script = textwrap.dedent(
+            """
+            import time
+            from scraper.runner import scrape_all
+            scrape_all([("Hung", lambda: time.sleep(10) or [])], max_workers=1, timeout=0.2)
+            """
+        )
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], cwd=PROJECT_DIR, check=True, timeout=30)
+        assert time.monotonic() - start < 5.0
+
+    def test_timeout_counts_from_provider_start(self):
+        # With one worker the second provider waits 0.15s in the queue, which
+        # must not count against its own 0.25s limit.
+        scrapers = [
+            ("First", _make_scraper("First", 0.15)),
+            ("Second", _make_scraper("Second", 0.15)),
+        ]
+        results = scrape_all(scrapers, max_workers=1, timeout=0.25)
+        assert [r.name for r in results] == ["First", "Second"]
+
+    def test_propagates_scraper_errors(self):
+        def broken() -> list[DeprecationEntry]:
+            raise ValueError("bad page")
+
+        with pytest.raises(ValueError, match="bad page"):
+            scrape_all([("Broken", broken)], max_workers=1, timeout=5)
@@ -0,0 +1,112 @@
+import datetime
+
+from scraper.base import DeprecationEntry
+from usage import matcher, scanner
+from usage.scanner import build_patterns, compile_matcher, iter_files, scan, scan_buffer
+
+
+def _entry(name: str, model_id: str = "", status: str = "deprecated", **fields) -> DeprecationEntry:
+    return DeprecationEntry(provider="OpenAI", model_name=name, model_id=model_id, status=status, **fields)
+
+
+ENTRIES = [
+    _entry("gpt-4", shutdown_date=datetime.date(2026, 10, 23), replacement="gpt-5"),
+    _entry("Claude 3 Haiku", "claude-3-haiku-20240307", status="retired"),
+    _entry("gpt-4o", status="active"),
+    # Active models may carry a tentative "not sooner than" shutdown date.
+    _entry("claude-opus-4-7", status="active", shutdown_date=datetime.date(2027, 4, 1)),
+    _entry("ft-gpt-3.5-turbo | gpt-3.5-turbo-ft"),
+]
+
+
+def _matches(text: str) -> list[str]:
+    regex = compile_matcher(build_patterns(ENTRIES))
+    return [match.decode() for _, match, _ in scan_buffer(regex, text.encode())]
+
+
+class TestPatterns:
+    def test_includes_names_ids_and_aliases_of_retiring_entries(self):
+        assert set(build_patterns(ENTRIES)) == {
+            "gpt-4",
+            "claude 3 haiku",
+            "claude-3-haiku-20240307",
+            "ft-gpt-3.5-turbo",
+            "gpt-3.5-turbo-ft",
+        }
+
+    def test_earliest_shutdown_wins(self):
+        later = _entry("gpt-4", shutdown_date=datetime.date(2027, 1, 1))
+        sooner = _entry("gpt-4", shutdown_date=datetime.date(2026, 1, 1))
+        assert build_patterns([later, sooner])["gpt-4"] is sooner
+
+    def test_no_patterns_matches_nothing(self):
+        assert list(scan_buffer(compile_matcher([]), b"gpt-4")) == []
+
+
+class TestMatching:
+    def test_respects_identifier_boundaries(self):
+        assert _matches('a = "gpt-4"; b = "gpt-4o"; c = "gpt-4.1"; d = "my_gpt-4"') == ["gpt-4"]
+
+    def test_is_case_insensitive_and_keeps_original_case(self):
+        assert _matches("model: GPT-4\nClaude 3 Haiku") == ["GPT-4", "Claude 3 Haiku"]
+
+    def test_allows_vendor_prefix_and_version_suffix(self):
+        assert _matches("anthropic.claude-3-haiku-20240307 claude-3-haiku-20240307@1") == [
+            "claude-3-haiku-20240307",
+            "claude-3-haiku-20240307",
+        ]
+
+    def test_reports_line_numbers_across_blocks(self, monkeypatch):
+        monkeypatch.setattr(matcher, "BLOCK_SIZE", 16)
+        data = b"x\n" * 20 + b"use gpt-4 here\n" + b"y\n" * 20 + b"gpt-4\n"
+        found = list(scan_buffer(compile_matcher(["gpt-4"]), data))
+        assert [(line, text) for line, _, text in found] == [(21, b"use gpt-4 here"), (42, b"gpt-4")]
+
+
+class TestFiles:
+    def test_gitignore_fallback(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scanner, "_git_files", lambda root: None)
+        (tmp_path / ".gitignore").write_text("build/\n*.log\n!keep.log\n")
+        for name in ["src/app.py", "build/out.py", "debug.log", "keep.log", "src/build/x.py"]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text("")
+        found = {p.relative_to(tmp_path).as_posix() for p in iter_files([tmp_path])}
+        assert found == {".gitignore", "src/app.py", "keep.log"}
+
+    def test_no_ignore_lists_everything(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "debug.log").write_text("")
+        found = {p.name for p in iter_files([tmp_path], respect_ignore=False)}
+        assert found == {".gitignore", "debug.log"}
+
+
+class TestScan:
+    def test_annotates_hits(self, tmp_path):
+        (tmp_path / "app.py").write_text('client.create(model="gpt-4")\n')
+        (tmp_path / "image.bin").write_bytes(b"\0gpt-4")
+        [hit] = scan([tmp_path], ENTRIES, jobs=1, respect_ignore=False)
+        assert (hit.line, hit.match, hit.entry.model_name) == (1, "gpt-4", "gpt-4")
+        assert hit.format().endswith(
+            ': gpt-4 (OpenAI deprecated, shutdown 2026-10-23, use gpt-5)\n    client.create(model="gpt-4")'
+        )
+
+    def test_non_ascii_names(self, tmp_path):
+        entries = [_entry("Modèle-Ä", status="retired")]
+        (tmp_path / "app.py").write_text("MODèLE-Ä\n")
+        [hit] = scan([tmp_path], entries, jobs=1, respect_ignore=False)
+        assert hit.entry is entries[0]
+
+    def test_memory_maps_large_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scanner, "MMAP_THRESHOLD", 10)
+        (tmp_path / "big.txt").write_text("padding line\n" * 10 + "claude-3-haiku-20240307\n")
+        [hit] = scan([tmp_path], ENTRIES, jobs=1, respect_ignore=False)
+        assert hit.line == 11
+
+    def test_parallel_matches_serial(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(scanner, "PARALLEL_MIN_FILES", 2)
+        for i in range(4):
+            (tmp_path / f"f{i}.py").write_text(f"# {i}\nMODEL = 'gpt-4'\n")
+        serial = scan([tmp_path], ENTRIES, jobs=1, respect_ignore=False)
+        parallel = scan([tmp_path], ENTRIES, jobs=2, respect_ignore=False)
+        assert [(h.path, h.line) for h in parallel] == [(h.path, h.line) for h in serial]
+        assert len(serial) == 4
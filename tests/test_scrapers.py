@@ -1,12 +1,24 @@
 import datetime
 from pathlib import Path
 
+import pytest
+
+from benchmarks.pages import generate_page
+from scraper import (
+    anthropic_scraper,
+    bedrock_scraper,
+    gemini_scraper,
+    openai_scraper,
+    parsing,
+    vertex_scraper,
+)
 from scraper.base import UNKNOWN_DATE, DeprecationEntry
 from scraper.openai_scraper import scrape as scrape_openai
 from scraper.anthropic_scraper import scrape as scrape_anthropic
 from scraper.vertex_scraper import scrape as scrape_vertex
 from scraper.bedrock_scraper import scrape as scrape_bedrock
 from scraper.gemini_scraper import scrape as scrape_gemini
+from scraper.parsing import available_backends
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -128,6 +140,18 @@ class TestVertexScraper:
             status="deprecated",
         )
 
+    def test_heading_layout_is_parsed_once(self, monkeypatch):
+        calls = []
+
+        def counting_make_soup(html, **kwargs):
+            calls.append(kwargs)
+            return parsing.make_soup(html, **kwargs)
+
+        monkeypatch.setattr(vertex_scraper, "make_soup", counting_make_soup)
+        html = "<div><h3>claude-2</h3><p>Deprecated as of January 5, 2026.</p></div>"
+        assert len(scrape_vertex(html)) == 1
+        assert calls == [{}]
+
 
 class TestBedrockScraper:
     def test_parses_legacy_entry(self):
@@ -197,3 +221,109 @@ class TestGeminiScraper:
             replacement="gemini-embedding-001",
             status="retired",
         )
+
+
+_SCRAPERS_AND_FIXTURES = [
+    (scrape_openai, "openai.html"),
+    (scrape_anthropic, "anthropic.html"),
+    (scrape_vertex, "vertex.html"),
+    (scrape_bedrock, "bedrock.html"),
+    (scrape_gemini, "gemini.html"),
+]
+
+
+class TestParserBackends:
+    @pytest.mark.parametrize("backend", available_backends())
+    @pytest.mark.parametrize("scrape_fn,fixture", _SCRAPERS_AND_FIXTURES)
+    def test_backends_produce_identical_entries(self, monkeypatch, backend, scrape_fn, fixture):
+        html = _load_fixture(fixture)
+        monkeypatch.setattr(parsing, "BACKEND", "html.parser")
+        expected = scrape_fn(html)
+        monkeypatch.setattr(parsing, "BACKEND", backend)
+        assert scrape_fn(html) == expected
+
+    def test_html_parser_always_available(self):
+        assert "html.parser" in available_backends()
+
+
+class TestTableOnlyParsing:
+    @pytest.mark.parametrize(
+        "module,fixture",
+        [
+            (openai_scraper, "openai.html"),
+            (anthropic_scraper, "anthropic.html"),
+            (vertex_scraper, "vertex.html"),
+            (bedrock_scraper, "bedrock.html"),
+            (gemini_scraper, "gemini.html"),
+        ],
+    )
+    def test_matches_full_parse(self, monkeypatch, module, fixture):
+        html = _load_fixture(fixture).replace(
+            "<body>", "<body><nav><a href='/'>Home</a></nav><script>var t = '<table>';</script>"
+        )
+        filtered = module.scrape(html)
+        monkeypatch.setattr(module, "TABLES_ONLY", ())
+        assert filtered == module.scrape(html)
+
+
+class TestSpannedCells:
+    def test_gemini_rowspan_replacement_applies_to_every_row(self):
+        html = """<table>
+        <tr><th>Model</th><th>Release date</th><th>Shutdown date</th><th>Recommended replacement</th></tr>
+        <tr><td>gemini-a</td><td>March 1, 2025</td><td>June 1, 2026</td><td rowspan="2">gemini-c</td></tr>
+        <tr><td>gemini-b</td><td>March 1, 2025</td><td>June 1, 2026</td></tr>
+        </table>"""
+        entries = scrape_gemini(html)
+        assert [e.replacement for e in entries] == ["gemini-c", "gemini-c"]
+
+    def test_openai_colspan_date_column(self):
+        html = """<table>
+        <tr><th>Shutdown date</th><th>Model / system</th><th>Recommended replacement</th></tr>
+        <tr><td>2026-01-01</td><td colspan="2">gpt-old</td></tr>
+        </table>"""
+        (entry,) = scrape_openai(html)
+        assert entry.model_name == "gpt-old"
+        assert entry.shutdown_date == datetime.date(2026, 1, 1)
+
+
+def _reference_sections(soup) -> list[tuple[str, str]]:
+    """The original per-heading sibling scan the section walker replaces."""
+    sections = []
+    for heading in soup.find_all(["h2", "h3", "h4"]):
+        parts = []
+        for sibling in heading.next_siblings:
+            if sibling.name in ("h1", "h2", "h3", "h4"):
+                break
+            parts.append(sibling.get_text() if sibling.name else str(sibling))
+        sections.append((heading.get_text().strip(), " ".join(parts)))
+    return sections
+
+
+class TestHeadingSections:
+    NESTED = """<html><body>
+    <h1>Partner models</h1><p>Intro deprecated as of May 1, 2025.</p>
+    <h2>Claude <code>claude-a@1</code></h2>
+    <p>Claude A is deprecated as of January 1, 2025 and will be shut down on June 1, 2026.</p>
+    <!-- shut down on July 1, 2026 -->
+    <script>var s = "shut down on August 1, 2026";</script>
+    <div><h3>Claude B</h3><p>Deprecated as of <b>February 2, 2025</b>.</p>
+      <section><h4>Claude B regional</h4>Shut down on March 3, 2026.</section>
+      <p>Trailing text shut down on April 4, 2026.</p>
+    </div>
+    <h4>Claude C</h4>No dates here.
+    <h1>Other</h1><h3>Claude D</h3><p>Discontinued on September 9, 2026.</p>
+    </body></html>"""
+
+    @pytest.mark.parametrize("backend", available_backends())
+    def test_matches_sibling_scan(self, backend):
+        soup = parsing.make_soup(self.NESTED, backend=backend)
+        expected = _reference_sections(soup)
+        sections = vertex_scraper._segment_sections(soup)
+        assert [(s.heading_text, s.text) for s in sections] == expected
+
+    def test_synthetic_heading_page(self):
+        html = generate_page("vertex", 50, headings=True, sections=4)
+        soup = parsing.make_soup(html)
+        sections = vertex_scraper._segment_sections(soup)
+        assert [(s.heading_text, s.text) for s in sections] == _reference_sections(soup)
+        assert len(scrape_vertex(html)) == 50
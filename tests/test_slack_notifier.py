@@ -81,7 +81,8 @@ class TestFormatSlackMessage:
 
 class TestSendNotification:
     def test_sends_when_upcoming_exists(self):
-        with patch("generators.slack_notifier.requests.post") as mock_post:
+        with patch("generators.slack_notifier.get_session") as mock_session:
+            mock_post = mock_session.return_value.post
             send_notification(_make_entries(), ["https://hooks.slack.com/test"])
             assert mock_post.call_count == 2
 
@@ -90,16 +91,18 @@ class TestSendNotification:
             "https://hooks.slack.com/first",
             "https://hooks.slack.com/second",
         ]
-        with patch("generators.slack_notifier.requests.post") as mock_post:
+        with patch("generators.slack_notifier.get_session") as mock_session:
+            mock_post = mock_session.return_value.post
             send_notification(_make_entries(), urls)
             assert mock_post.call_count == 4
             called_urls = [call.args[0] for call in mock_post.call_args_list]
             assert all(called_urls.count(url) == 2 for url in urls)
 
     def test_posts_each_shutdown_horizon_separately(self):
-        with patch("generators.slack_notifier.requests.post") as mock_post:
+        with patch("generators.slack_notifier.get_session") as mock_session:
             send_notification(_make_entries(), ["https://hooks.slack.com/test"])
 
+        mock_post = mock_session.return_value.post
         payloads = [call.kwargs["json"] for call in mock_post.call_args_list]
         section_texts = [
             "\n".join(block["text"]["text"] for block in payload["blocks"][1:])
@@ -112,6 +115,6 @@ class TestSendNotification:
 
     def test_skips_when_no_upcoming(self):
         entries = [_make_entries()[3]]
-        with patch("generators.slack_notifier.requests.post") as mock_post:
+        with patch("generators.slack_notifier.get_session") as mock_session:
             send_notification(entries, ["https://hooks.slack.com/test"])
-            mock_post.assert_not_called()
+            mock_session.return_value.post.assert_not_called()
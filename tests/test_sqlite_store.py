@@ -0,0 +1,76 @@
+import datetime
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from scraper.base import UNKNOWN_DATE, DeprecationEntry
+from store.sqlite_store import query, shutting_down_within, write_database
+
+TODAY = datetime.date(2026, 1, 1)
+
+
+def _entries() -> list[DeprecationEntry]:
+    return [
+        DeprecationEntry(
+            provider="Bedrock",
+            model_name="Claude 3 Sonnet",
+            model_id="anthropic.claude-3-sonnet",
+            shutdown_date=datetime.date(2026, 2, 1),
+            status="legacy",
+        ),
+        DeprecationEntry(provider="OpenAI", model_name="gpt-4", shutdown_date=datetime.date(2026, 1, 20)),
+        DeprecationEntry(provider="OpenAI", model_name="gpt-5", status="active"),
+        DeprecationEntry(
+            provider="OpenAI",
+            model_name="davinci",
+            deprecated_date=datetime.date(2023, 1, 1),
+            shutdown_date=datetime.date(2024, 1, 4),
+            replacement="babbage-002",
+            status="retired",
+        ),
+    ]
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "deprecations.db"
+    write_database(path, _entries())
+    return path
+
+
+class TestSqliteStore:
+    def test_round_trips_all_entries(self, db):
+        entries = query(db)
+        assert sorted(entries, key=lambda e: e.model_name) == sorted(_entries(), key=lambda e: e.model_name)
+        assert entries[-1].shutdown_date == UNKNOWN_DATE
+
+    def test_filters(self, db):
+        assert [e.model_name for e in query(db, provider="OpenAI", status="retired")] == ["davinci"]
+        assert [e.provider for e in query(db, model="anthropic.claude-3-sonnet")] == ["Bedrock"]
+        assert [e.provider for e in query(db, model="Claude 3 Sonnet")] == ["Bedrock"]
+
+    def test_shutdown_window_is_inclusive_and_ordered(self, db):
+        entries = shutting_down_within(db, 31, today=TODAY)
+        assert [e.model_name for e in entries] == ["gpt-4", "Claude 3 Sonnet"]
+        assert [e.model_name for e in shutting_down_within(db, 19, today=TODAY)] == ["gpt-4"]
+        assert shutting_down_within(db, 18, today=TODAY) == []
+
+    def test_range_queries_use_shutdown_index(self, db):
+        conn = sqlite3.connect(db)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM entries WHERE shutdown_date >= ? AND shutdown_date <= ?",
+            ("2026-01-01", "2026-02-01"),
+        ).fetchall()
+        conn.close()
+        assert "entries_shutdown_date" in str(plan)
+
+    def test_rewrite_replaces_contents(self, db):
+        write_database(db, _entries()[:1])
+        assert len(query(db)) == 1
+        assert [p.name for p in db.parent.iterdir()] == [db.name]
+
+    def test_relative_path(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        write_database(Path("rel.db"), _entries())
+        assert len(query(Path("rel.db"))) == len(_entries())
@@ -0,0 +1,71 @@
+from bs4 import BeautifulSoup
+
+from scraper.tables import collapse_whitespace, extract_grid
+
+
+def _grid(html: str, **kwargs):
+    return extract_grid(BeautifulSoup(html, "html.parser").find("table"), **kwargs)
+
+
+class TestExtractGrid:
+    def test_plain_table(self):
+        grid = _grid(
+            "<table><tr><th> A </th><th>B</th></tr>"
+            "<tr><td>1</td><td>2</td></tr><tr><td>3</td><td>4</td></tr></table>"
+        )
+        assert grid.headers == ["A", "B"]
+        assert grid.columns == [["1", "3"], ["2", "4"]]
+        assert list(grid.rows()) == [["1", "2"], ["3", "4"]]
+        assert len(grid) == 2
+
+    def test_rowspan_is_copied_down(self):
+        grid = _grid(
+            "<table><tr><th>Model</th><th>Region</th></tr>"
+            "<tr><td rowspan='3'>m</td><td>us</td></tr>"
+            "<tr><td>eu</td></tr><tr><td>ap</td></tr>"
+            "<tr><td>n</td><td>us</td></tr></table>"
+        )
+        assert grid.columns == [["m", "m", "m", "n"], ["us", "eu", "ap", "us"]]
+
+    def test_colspan_is_copied_across(self):
+        grid = _grid(
+            "<table><tr><th>A</th><th>B</th><th>C</th></tr>"
+            "<tr><td colspan='2'>wide</td><td>c</td></tr></table>"
+        )
+        assert list(grid.rows()) == [["wide", "wide", "c"]]
+
+    def test_rowspan_and_colspan_together(self):
+        grid = _grid(
+            "<table><tr><th>A</th><th>B</th><th>C</th></tr>"
+            "<tr><td rowspan='2' colspan='2'>block</td><td>1</td></tr>"
+            "<tr><td>2</td></tr></table>"
+        )
+        assert list(grid.rows()) == [["block", "block", "1"], ["block", "block", "2"]]
+
+    def test_rowspan_in_last_column(self):
+        grid = _grid(
+            "<table><tr><th>A</th><th>B</th></tr>"
+            "<tr><td>1</td><td rowspan='2'>shared</td></tr><tr><td>2</td></tr></table>"
+        )
+        assert list(grid.rows()) == [["1", "shared"], ["2", "shared"]]
+
+    def test_short_rows_stay_short(self):
+        grid = _grid(
+            "<table><tr><th>A</th><th>B</th><th>C</th></tr>"
+            "<tr><td>1</td></tr><tr><td>1</td><td>2</td><td>3</td></tr></table>"
+        )
+        assert list(grid.rows()) == [["1"], ["1", "2", "3"]]
+        assert grid.columns[2] == ["", "3"]
+
+    def test_invalid_span_values(self):
+        grid = _grid("<table><tr><th>A</th></tr><tr><td rowspan='x' colspan='0'>1</td></tr></table>")
+        assert list(grid.rows()) == [["1"]]
+
+    def test_custom_normalizer(self):
+        grid = _grid("<table><tr><th>A</th></tr><tr><td> a \n  b </td></tr></table>", normalize=collapse_whitespace)
+        assert list(grid.rows()) == [["a b"]]
+
+    def test_empty_table(self):
+        grid = _grid("<table></table>")
+        assert grid.headers == []
+        assert list(grid.rows()) == []
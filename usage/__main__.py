@@ -0,0 +1,44 @@
+"""Check a change for references to retiring models.
+
+Exits 2 if any hit is retired or past its shutdown date, 1 if any hit is
+only deprecated, and 0 when the change is clean.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from usage.incremental import DEFAULT_DATA, added_lines, exit_code, file_contents, git_diff, load_matcher
+
+
+def main(argv: list[str] = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    parser = argparse.ArgumentParser(prog="python -m usage", description=__doc__)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        "--diff",
+        metavar="REV",
+        help='scan lines added since REV, e.g. "origin/main...HEAD"; "-" reads a diff from stdin',
+    )
+    source.add_argument("--files", nargs="+", type=Path, metavar="PATH", help="scan these files in full")
+    parser.add_argument("--data", type=Path, default=DEFAULT_DATA, help="deprecation data (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    matcher = load_matcher(args.data)
+    if args.files:
+        chunks = file_contents(args.files)
+    elif args.diff == "-":
+        chunks = added_lines(sys.stdin.buffer.read())
+    else:
+        # Without --diff, check what is staged for the next commit.
+        chunks = added_lines(git_diff([args.diff] if args.diff else ["--cached"]))
+
+    hits = matcher.hits(chunks)
+    for hit in hits:
+        print(hit.format())
+    return exit_code(hits)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
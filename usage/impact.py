@@ -0,0 +1,203 @@
+"""Join request logs against the deprecation data to measure who is affected."""
+
+import collections
+import concurrent.futures
+import csv
+import dataclasses
+import datetime
+import functools
+import gzip
+import io
+import itertools
+import logging
+import operator
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+import orjson
+
+from analysis.index import DeprecationIndex
+from analysis.replacements import is_retiring
+from generators.slack_notifier import days_until
+from scraper.base import DeprecationEntry
+
+log = logging.getLogger(__name__)
+
+CHUNK_SIZE = 16384
+GZIP_MAGIC = b"\x1f\x8b"
+# Upper bounds, in days until shutdown, of the reported horizons.
+HORIZONS = (1, 14, 30, 90)
+
+Pair = tuple[str, str]
+
+
+def horizon(entry: DeprecationEntry, today: datetime.date = None) -> str:
+    """Bucket label for how soon ``entry`` shuts down, e.g. "<=14d"."""
+    if not entry.has_shutdown_date():
+        return "unscheduled"
+    days = days_until(entry, today)
+    if days < 0:
+        return "shut down"
+    for limit in HORIZONS:
+        if days <= limit:
+            return f"<={limit}d"
+    return f">{HORIZONS[-1]}d"
+
+
+def _open(path: Path) -> IO[bytes]:
+    with open(path, "rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+
+def _csv_pairs(fp: IO[bytes], team_field: str, model_field: str) -> Iterator[collections.Counter]:
+    reader = csv.reader(io.TextIOWrapper(fp, encoding="utf-8", errors="replace", newline=""))
+    header = next(reader, None)
+    if header is None:
+        return
+    try:
+        model_column = header.index(model_field)
+    except ValueError:
+        raise ValueError(f"no {model_field!r} column in CSV header") from None
+    team_column = header.index(team_field) if team_field in header else None
+    if team_column is None:
+        get_model = operator.itemgetter(model_column)
+
+        def get_pair(row: list[str]) -> Pair:
+            return "", get_model(row)
+
+        width = model_column + 1
+    else:
+        get_pair = operator.itemgetter(team_column, model_column)
+        width = max(team_column, model_column) + 1
+    while rows := list(itertools.islice(reader, CHUNK_SIZE)):
+        try:
+            yield collections.Counter(map(get_pair, rows))
+        except IndexError:
+            # Short rows are rare; only their chunk takes the slow path.
+            yield collections.Counter(get_pair(row) for row in rows if len(row) >= width)
+
+
+def _record_pair(line: bytes, team_field: str, model_field: str) -> Pair | None:
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    team, model = record.get(team_field) or "", record.get(model_field)
+    if not isinstance(model, str):
+        return None
+    return str(team), model
+
+
+def _ndjson_pairs(fp: IO[bytes], team_field: str, model_field: str) -> Iterator[collections.Counter]:
+    while lines := list(itertools.islice(fp, CHUNK_SIZE)):
+        pairs = (_record_pair(line, team_field, model_field) for line in lines if line.strip())
+        counts = collections.Counter(pairs)
+        counts.pop(None, None)
+        yield counts
+
+
+def count_requests(path: Path, team_field: str = "team", model_field: str = "model") -> collections.Counter:
+    """Requests per (team, model) in one CSV or NDJSON log, optionally gzipped.
+
+    The file is read CHUNK_SIZE records at a time and each chunk is tallied
+    by Counter in C, so memory depends on the number of distinct
+    (team, model) pairs rather than on the size of the log. The format is
+    sniffed from the first byte: "{" means NDJSON, anything else CSV with
+    a header row.
+    """
+    counts: collections.Counter = collections.Counter()
+    with _open(path) as fp:
+        chunks = _ndjson_pairs if fp.peek(64).lstrip()[:1] == b"{" else _csv_pairs
+        for chunk in chunks(fp, team_field, model_field):
+            counts.update(chunk)
+    return counts
+
+
+class ModelResolver:
+    """Maps the model strings found in logs to tracked deprecation entries.
+
+    Every distinct string is looked up in the index once. Gateway-style
+    "openai/gpt-4" values fall back to the part after the last slash.
+    Among several matches the entry shutting down first wins.
+    """
+
+    def __init__(self, entries: list[DeprecationEntry] | DeprecationIndex):
+        self._index = DeprecationIndex.of(entries)
+        self._memo: dict[str, DeprecationEntry | None] = {}
+
+    def __call__(self, model: str) -> DeprecationEntry | None:
+        try:
+            return self._memo[model]
+        except KeyError:
+            pass
+        matches = self._index.lookup(model)
+        if not matches and "/" in model:
+            matches = self._index.lookup(model.rsplit("/", 1)[1])
+        tracked = [e for e in matches if is_retiring(e)]
+        result = min(tracked, key=lambda e: (not e.has_shutdown_date(), e.shutdown_date), default=None)
+        self._memo[model] = result
+        return result
+
+
+@dataclasses.dataclass
+class Impact:
+    team: str
+    entry: DeprecationEntry
+    horizon: str
+    requests: int
+
+    def to_dict(self) -> dict:
+        return {
+            "team": self.team,
+            "provider": self.entry.provider,
+            "model": self.entry.model_name,
+            "shutdown_date": self.entry.shutdown_date.isoformat() if self.entry.has_shutdown_date() else "",
+            "horizon": self.horizon,
+            "replacement": self.entry.resolved_replacement or self.entry.replacement,
+            "requests": self.requests,
+        }
+
+
+def impact(
+    paths: Iterable[Path],
+    entries: list[DeprecationEntry] | DeprecationIndex,
+    team_field: str = "team",
+    model_field: str = "model",
+    jobs: int = 1,
+    today: datetime.date = None,
+) -> list[Impact]:
+    """Requests per team to each retiring model, soonest shutdown first.
+
+    Files are counted independently, across a process pool when ``jobs`` is
+    above one, and the per-file counts are joined against ``entries`` once
+    at the end.
+    """
+    paths = list(paths)
+    count = functools.partial(count_requests, team_field=team_field, model_field=model_field)
+    totals: collections.Counter = collections.Counter()
+    if jobs > 1 and len(paths) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            for counts in pool.map(count, paths):
+                totals.update(counts)
+    else:
+        for path in paths:
+            totals.update(count(path))
+
+    resolve = ModelResolver(entries)
+    grouped: dict[tuple[str, int], list] = {}
+    for (team, model), requests in totals.items():
+        entry = resolve(model)
+        if entry is None:
+            continue
+        group = grouped.setdefault((team, id(entry)), [entry, 0])
+        group[1] += requests
+
+    rows = [
+        Impact(team=team, entry=entry, horizon=horizon(entry, today), requests=requests)
+        for (team, _), (entry, requests) in grouped.items()
+    ]
+    rows.sort(key=lambda r: (not r.entry.has_shutdown_date(), r.entry.shutdown_date, -r.requests, r.team))
+    return rows
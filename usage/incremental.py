@@ -0,0 +1,183 @@
+"""Scan only what a change touches, for pre-commit hooks and CI.
+
+The compiled pattern and the hit annotations are cached under
+``.cache/scan``, keyed by a hash of the deprecation data. A cache hit
+imports nothing beyond the standard library and orjson; the full scanner,
+which imports every scraper, is only loaded to rebuild the cache.
+"""
+
+import dataclasses
+import datetime
+import hashlib
+import logging
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import orjson
+
+from generators.output import write_atomic
+from usage.matcher import scan_buffer
+
+log = logging.getLogger(__name__)
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_DATA = PROJECT_DIR / "data" / "deprecations.json"
+# Same location as scraper.base.CACHE_DIR, without importing the scrapers.
+CACHE_DIR = Path(os.environ.get("CACHE_DIR") or PROJECT_DIR / ".cache") / "scan"
+# Bump when the cache layout or the way patterns are built changes.
+CACHE_VERSION = 2
+BINARY_SNIFF_BYTES = 8192
+
+CLEAN, RETIRING, RETIRED = 0, 1, 2
+
+HUNK_RE = re.compile(rb"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def severity(status: str, shutdown: datetime.date | None, today: datetime.date) -> int:
+    """RETIRED once a model is retired or past its shutdown date, RETIRING before."""
+    if status == "retired" or (shutdown is not None and shutdown <= today):
+        return RETIRED
+    return RETIRING
+
+
+@dataclasses.dataclass
+class DiffHit:
+    path: str
+    line: int
+    match: str
+    text: str
+    note: str
+    severity: int
+
+    def format(self) -> str:
+        return f"{self.path}:{self.line}: {self.match} ({self.note})\n    {self.text}"
+
+
+@dataclasses.dataclass
+class Matcher:
+    regex: re.Pattern
+    # Lower-cased name -> {"note", "status", "shutdown"}.
+    targets: dict[str, dict]
+
+    def hits(
+        self, lines: Iterable[tuple[str, int, bytes]], today: datetime.date = None
+    ) -> list[DiffHit]:
+        """Hits in (path, first line number, text) chunks; text may span several lines."""
+        if today is None:
+            today = datetime.date.today()
+        found = []
+        for path, first_line, data in lines:
+            for offset, match, text in scan_buffer(self.regex, data):
+                target = self.targets[match.lower().decode()]
+                shutdown = datetime.date.fromisoformat(target["shutdown"]) if target["shutdown"] else None
+                found.append(
+                    DiffHit(
+                        path=path,
+                        line=first_line + offset - 1,
+                        match=match.decode(errors="replace"),
+                        text=text.decode(errors="replace").strip(),
+                        note=target["note"],
+                        severity=severity(target["status"], shutdown, today),
+                    )
+                )
+        return found
+
+
+def _build(data: bytes) -> tuple[bytes, dict[str, dict]]:
+    # Deferred so that a cache hit never imports the scrapers.
+    from scraper import codec
+    from usage.scanner import build_patterns, compile_matcher, describe
+
+    patterns = build_patterns(codec.decode(data))
+    targets = {
+        name: {
+            "note": describe(entry),
+            "status": entry.status,
+            "shutdown": entry.shutdown_date.isoformat() if entry.has_shutdown_date() else "",
+        }
+        for name, entry in patterns.items()
+    }
+    return compile_matcher(patterns).pattern, targets
+
+
+def load_matcher(data_path: Path = DEFAULT_DATA, cache_dir: Path = None) -> Matcher:
+    """The matcher for ``data_path``, rebuilt only when the data has changed."""
+    data = Path(data_path).read_bytes()
+    key = f"{CACHE_VERSION}:{hashlib.sha256(data).hexdigest()}"
+    cache_path = Path(cache_dir or CACHE_DIR) / "matcher.json"
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+        if cached["key"] == key:
+            return Matcher(re.compile(cached["pattern"].encode()), cached["targets"])
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+        pass
+    log.debug("Rebuilding scan matcher for %s", data_path)
+    pattern, targets = _build(data)
+    write_atomic(cache_path, orjson.dumps({"key": key, "pattern": pattern.decode(), "targets": targets}))
+    return Matcher(re.compile(pattern), targets)
+
+
+def added_lines(diff: bytes) -> Iterator[tuple[str, int, bytes]]:
+    """(path, line number, text) for every line a unified diff adds.
+
+    Hunk headers give the number of lines in each hunk, so added lines
+    that happen to start with "++" are not mistaken for file headers.
+    """
+    path = None
+    old_left = new_left = line = 0
+    for raw in diff.splitlines():
+        if old_left > 0 or new_left > 0:
+            tag = raw[:1]
+            if tag == b"+":
+                if path is not None:
+                    yield path, line, raw[1:]
+                line += 1
+                new_left -= 1
+            elif tag == b"-":
+                old_left -= 1
+            elif tag == b" " or not raw:
+                line += 1
+                old_left -= 1
+                new_left -= 1
+            continue
+        if raw.startswith(b"+++ "):
+            target = raw[4:].split(b"\t", 1)[0]
+            if target == b"/dev/null":
+                path = None
+            else:
+                path = os.fsdecode(target[2:] if target.startswith(b"b/") else target)
+        elif m := HUNK_RE.match(raw):
+            old_count, start, new_count = m.groups()
+            old_left = 1 if old_count is None else int(old_count)
+            new_left = 1 if new_count is None else int(new_count)
+            line = int(start)
+
+
+def git_diff(args: list[str], cwd: Path = None) -> bytes:
+    """Zero-context ``git diff`` output; ``args`` as for ``git diff``, e.g. ["--cached"]."""
+    return subprocess.run(
+        ["git", "-c", "core.quotePath=false", "diff", "--no-color", "--no-ext-diff", "-U0", *args],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+    ).stdout
+
+
+def file_contents(paths: Iterable[Path]) -> Iterator[tuple[str, int, bytes]]:
+    """Each readable, non-binary file as one (path, 1, contents) chunk."""
+    for path in paths:
+        try:
+            data = Path(path).read_bytes()
+        except OSError as exc:
+            log.debug("Skipping %s: %s", path, exc)
+            continue
+        if b"\0" not in data[:BINARY_SNIFF_BYTES]:
+            yield str(path), 1, data
+
+
+def exit_code(hits: Iterable) -> int:
+    """The highest severity among ``hits``, or CLEAN when there are none."""
+    return max((hit.severity for hit in hits), default=CLEAN)
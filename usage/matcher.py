@@ -0,0 +1,90 @@
+"""Multi-name matching over raw bytes, shared by the full and incremental scans.
+
+Only the standard library is imported here, so the incremental scan can
+load a cached matcher without pulling in the scrapers.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+BLOCK_SIZE = 8 << 20
+MAX_LINE_LENGTH = 200
+
+# Identifiers are bounded so "gpt-4" does not fire inside "gpt-4o",
+# "gpt-4.1" or "my_gpt-4". Punctuation such as "." before or "@" after a
+# name is allowed, so "anthropic.claude-3-haiku-20240307" and
+# "claude-3-haiku@20240307" still match "claude-3-haiku-20240307" and
+# "claude-3-haiku".
+BOUNDARY_BEFORE = rb"(?<![A-Za-z0-9_\-])"
+BOUNDARY_AFTER = rb"(?![A-Za-z0-9_\-]|\.[0-9])"
+
+
+def _trie_pattern(node: dict) -> bytes:
+    end = None in node
+    alternatives = [re.escape(char) + _trie_pattern(node[char]) for char in sorted(c for c in node if c is not None)]
+    if not alternatives:
+        return b""
+    if len(alternatives) == 1 and not end:
+        return alternatives[0]
+    group = b"(?:" + b"|".join(alternatives) + b")"
+    return group + b"?" if end else group
+
+
+def ascii_lower(text: str) -> str:
+    """Lower-case only ASCII letters, the way bytes.lower() treats scanned input."""
+    return text.encode().lower().decode()
+
+
+def compile_matcher(names: Iterable[str]) -> re.Pattern:
+    """One bytes regex matching every lower-case name, shaped as a trie.
+
+    Names sharing a prefix share one branch of the alternation, so the
+    regex engine tests each input position against the trie in C instead
+    of trying every name in turn. This gives Aho-Corasick-like behaviour
+    without a third-party automaton. The regex is case-sensitive and is
+    meant to run over lower-cased input, which is markedly faster than
+    re.IGNORECASE.
+    """
+    trie: dict = {}
+    for name in names:
+        node = trie
+        for i in range(len(encoded := name.encode())):
+            node = node.setdefault(encoded[i : i + 1], {})
+        node[None] = {}
+    if not trie:
+        return re.compile(rb"(?!)")
+    return re.compile(BOUNDARY_BEFORE + b"(?:" + _trie_pattern(trie) + b")" + BOUNDARY_AFTER)
+
+
+def _blocks(data) -> Iterator[tuple[int, int]]:
+    """(start, end) spans of at most about BLOCK_SIZE bytes, cut after a newline."""
+    start, size = 0, len(data)
+    while start < size:
+        end = min(start + BLOCK_SIZE, size)
+        if end < size:
+            newline = data.rfind(b"\n", start, end)
+            end = newline + 1 if newline != -1 else end
+        yield start, end
+        start = end
+
+
+def scan_buffer(matcher: re.Pattern, data) -> Iterator[tuple[int, bytes, bytes]]:
+    """Yield (line number, matched bytes, line bytes) for every match in ``data``.
+
+    ``data`` is lower-cased a block at a time, so memory stays bounded for
+    memory-mapped files. Matches are reported in their original case.
+    """
+    line = 1
+    for block_start, block_end in _blocks(data):
+        block = data[block_start:block_end]
+        counted_to = 0
+        for m in matcher.finditer(block.lower()):
+            start, end = m.span()
+            line += block.count(b"\n", counted_to, start)
+            counted_to = start
+            line_start = block.rfind(b"\n", 0, start) + 1
+            line_end = block.find(b"\n", start)
+            if line_end == -1:
+                line_end = len(block)
+            yield line, block[start:end], block[line_start : min(line_end, line_start + MAX_LINE_LENGTH)]
+        line += block.count(b"\n", counted_to)
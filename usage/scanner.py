@@ -0,0 +1,244 @@
+"""Find references to deprecated models in source trees."""
+
+import concurrent.futures
+import dataclasses
+import datetime
+import fnmatch
+import logging
+import mmap
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from analysis.index import ALIAS_SEPARATORS_RE
+from analysis.replacements import is_retiring
+from scraper.base import DeprecationEntry
+from usage.incremental import severity
+from usage.matcher import ascii_lower, compile_matcher, scan_buffer
+
+log = logging.getLogger(__name__)
+
+MIN_PATTERN_LENGTH = 3
+MMAP_THRESHOLD = 1 << 20
+BINARY_SNIFF_BYTES = 8192
+PARALLEL_MIN_FILES = 64
+SKIP_DIRS = {".git", ".hg", ".svn"}
+
+
+@dataclasses.dataclass
+class Hit:
+    path: str
+    line: int
+    match: str
+    text: str
+    entry: DeprecationEntry
+
+    @property
+    def severity(self) -> int:
+        entry = self.entry
+        shutdown = entry.shutdown_date if entry.has_shutdown_date() else None
+        return severity(entry.status, shutdown, datetime.date.today())
+
+    def format(self) -> str:
+        return f"{self.path}:{self.line}: {self.match} ({describe(self.entry)})\n    {self.text}"
+
+
+def describe(entry: DeprecationEntry) -> str:
+    """Annotation for a hit, e.g. "OpenAI deprecated, shutdown 2026-10-23, use gpt-5"."""
+    shutdown = entry.shutdown_date.isoformat() if entry.has_shutdown_date() else "TBD"
+    note = f"{entry.provider} {entry.status}, shutdown {shutdown}"
+    replacement = entry.resolved_replacement or entry.replacement
+    if replacement:
+        note += f", use {replacement}"
+    return note
+
+
+def _urgency(entry: DeprecationEntry) -> tuple:
+    return (not entry.has_shutdown_date(), entry.shutdown_date)
+
+
+def build_patterns(entries: Iterable[DeprecationEntry]) -> dict[str, DeprecationEntry]:
+    """Map each lower-cased model name, alias and ID to its entry.
+
+    Only retiring entries are included. When several entries share a name
+    the one shutting down first wins.
+    """
+    patterns: dict[str, DeprecationEntry] = {}
+    for entry in entries:
+        if not is_retiring(entry):
+            continue
+        names = ALIAS_SEPARATORS_RE.split(entry.model_name) + [entry.model_id]
+        for name in names:
+            name = ascii_lower(name.strip().strip("`").strip())
+            if len(name) < MIN_PATTERN_LENGTH:
+                continue
+            current = patterns.get(name)
+            if current is None or _urgency(entry) < _urgency(current):
+                patterns[name] = entry
+    return patterns
+
+
+class _IgnoreRules:
+    """The subset of .gitignore semantics needed when git itself is unavailable."""
+
+    def __init__(self, base: Path, lines: Iterable[str], parent: "_IgnoreRules | None" = None):
+        self.base = base
+        self.parent = parent
+        self.rules: list[tuple[bool, bool, re.Pattern]] = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            line = line.lstrip("!")
+            dir_only = line.endswith("/")
+            anchored = "/" in line.rstrip("/")
+            line = line.strip("/")
+            regex = fnmatch.translate(line).replace(".*", "[^/]*").replace("[^/]*[^/]*", ".*")
+            if not anchored:
+                regex = r"(?:.*/)?" + regex
+            self.rules.append((negate, dir_only, re.compile(regex)))
+
+    @classmethod
+    def load(cls, directory: Path, parent: "_IgnoreRules | None") -> "_IgnoreRules | None":
+        try:
+            lines = (directory / ".gitignore").read_text(errors="replace").splitlines()
+        except OSError:
+            return parent
+        return cls(directory, lines, parent)
+
+    def ignored(self, path: Path, is_dir: bool) -> bool:
+        verdict = self.parent.ignored(path, is_dir) if self.parent else False
+        relative = path.relative_to(self.base).as_posix()
+        for negate, dir_only, regex in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relative):
+                verdict = not negate
+        return verdict
+
+
+def _git_files(root: Path) -> list[Path] | None:
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [root / os.fsdecode(name) for name in result.stdout.split(b"\0") if name]
+
+
+def _walk(directory: Path, rules: "_IgnoreRules | None", respect_ignore: bool) -> Iterator[Path]:
+    if respect_ignore:
+        rules = _IgnoreRules.load(directory, rules)
+    try:
+        children = list(os.scandir(directory))
+    except OSError:
+        return
+    for child in children:
+        path = Path(child.path)
+        is_dir = child.is_dir(follow_symlinks=False)
+        if is_dir and child.name in SKIP_DIRS:
+            continue
+        if rules is not None and rules.ignored(path, is_dir):
+            continue
+        if is_dir:
+            yield from _walk(path, rules, respect_ignore)
+        elif child.is_file(follow_symlinks=False):
+            yield path
+
+
+def iter_files(paths: Iterable[Path], respect_ignore: bool = True) -> Iterator[Path]:
+    """Files under ``paths``, skipping ignored ones.
+
+    Inside a git work tree the file list comes from ``git ls-files``, which
+    applies every .gitignore, .git/info/exclude and global excludes file.
+    Elsewhere each directory's .gitignore is honoured by a small matcher.
+    """
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            yield path
+            continue
+        if respect_ignore:
+            files = _git_files(path)
+            if files is not None:
+                yield from (f for f in files if f.is_file())
+                continue
+        yield from _walk(path, None, respect_ignore)
+
+
+_worker_matcher: re.Pattern | None = None
+
+
+def _init_worker(pattern: bytes) -> None:
+    global _worker_matcher
+    _worker_matcher = re.compile(pattern)
+
+
+def scan_file(path: Path, matcher: re.Pattern = None) -> list[tuple[str, int, str, str]]:
+    """Matches in one file as (path, line, match, line text); binary files are skipped."""
+    matcher = matcher or _worker_matcher
+    try:
+        with open(path, "rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return []
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            if size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    found = list(scan_buffer(matcher, data))
+            else:
+                found = list(scan_buffer(matcher, head + f.read()))
+    except OSError as exc:
+        log.debug("Skipping %s: %s", path, exc)
+        return []
+    return [
+        (str(path), line, match.decode(errors="replace"), text.decode(errors="replace").strip())
+        for line, match, text in found
+    ]
+
+
+def scan(
+    paths: Iterable[Path],
+    entries: Iterable[DeprecationEntry],
+    jobs: int = None,
+    respect_ignore: bool = True,
+) -> list[Hit]:
+    """Scan files under ``paths`` for names of retiring models.
+
+    Large file sets are split across a process pool; each worker compiles
+    the matcher once. Hits come back sorted by path and line.
+    """
+    patterns = build_patterns(entries)
+    matcher = compile_matcher(patterns)
+    files = list(iter_files(paths, respect_ignore))
+    jobs = jobs or os.cpu_count() or 1
+
+    if jobs == 1 or len(files) < PARALLEL_MIN_FILES:
+        results = (scan_file(path, matcher) for path in files)
+        return _to_hits(results, patterns)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(matcher.pattern,),
+    ) as pool:
+        chunksize = max(1, len(files) // (jobs * 8))
+        return _to_hits(pool.map(scan_file, files, chunksize=chunksize), patterns)
+
+
+def _to_hits(results: Iterable[list[tuple]], patterns: dict[str, DeprecationEntry]) -> list[Hit]:
+    hits = [
+        Hit(path=path, line=line, match=match, text=text, entry=patterns[ascii_lower(match)])
+        for found in results
+        for path, line, match, text in found
+    ]
+    hits.sort(key=lambda hit: (hit.path, hit.line))
+    return hits